@@ -0,0 +1,11 @@
+"""Benchmarks comparing the optimized code paths with the code they replaced.
+
+They live outside the ``pyjobs`` package so they are never deployed. Run them
+from the repository root, e.g. ``python -m benchmarks.thumbnails --help``.
+"""
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyjobs.settings")
+django.setup()
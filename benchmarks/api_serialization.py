@@ -0,0 +1,80 @@
+"""Compares serializing the jobs with FieldsPreparer and ProjectionPreparer.
+
+The fake jobs go to a throwaway test database, never the configured one.
+"""
+from argparse import ArgumentParser
+
+from django.conf import settings
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+from restless.preparers import FieldsPreparer
+
+from benchmarks.common import report, report_speedup, timed
+from pyjobs.api.serializers import PyJobsSerializer
+from pyjobs.api.views import JobResource
+from pyjobs.core.models import Country, Currency, Job
+
+DESCRIPTION = "Vaga para desenvolver APIs em Python e Django. " * 40
+
+
+def create_fake_jobs(rows):
+    """Inserts ``rows`` jobs with ``bulk_create``, skipping the signals."""
+    country = Country.objects.create(name="Brasil")
+    currency = Currency.objects.create(name="Real", slug="BRL")
+    Job.objects.bulk_create(
+        (
+            Job(
+                title=f"Desenvolvedor Python {count}",
+                workplace="São Paulo",
+                company_name=f"Empresa {count}",
+                description=DESCRIPTION,
+                requirements=DESCRIPTION,
+                country=country,
+                currency=currency,
+                unique_slug=f"desenvolvedor-python-{count}",
+            )
+            for count in range(rows)
+        ),
+        batch_size=1000,
+    )
+
+
+def serialize_legacy():
+    """How ``JobResource`` serialized a listing before the projection."""
+    preparer = FieldsPreparer(fields=JobResource.preparer.fields)
+    data = [preparer.prepare(job) for job in Job.objects.all()]
+    return PyJobsSerializer().serialize({"objects": data})
+
+
+def serialize_projected(dumps):
+    data = JobResource.preparer.project(Job.objects.all())
+    with override_settings(API_JSON_DUMPS=dumps):
+        return PyJobsSerializer().serialize_projected({"objects": data})
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument(
+        "--dumps",
+        default=settings.API_JSON_DUMPS,
+        help="Dotted path of the encoder used by the projection, e.g. orjson.dumps",
+    )
+    options = parser.parse_args()
+
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    old_config = runner.setup_databases()
+    try:
+        create_fake_jobs(options.rows)
+        _, legacy = timed(serialize_legacy)
+        _, projected = timed(serialize_projected, options.dumps)
+    finally:
+        runner.teardown_databases(old_config)
+
+    report("legacy:", legacy, options.rows, "jobs")
+    report("projected:", projected, options.rows, "jobs", options.dumps)
+    report_speedup(legacy, projected)
+
+
+if __name__ == "__main__":
+    main()
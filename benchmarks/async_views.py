@@ -0,0 +1,124 @@
+"""Compares the sync and async blog views against a slow blog API."""
+import asyncio
+import json
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+from uuid import uuid4
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, override_settings
+
+from benchmarks.common import report, report_speedup, timed
+from pyjobs.blog.views import async_blog_post, blog_post
+
+BENCHMARK_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "benchmark_async_views",
+    }
+}
+
+
+def start_slow_blog_api(delay):
+    """Serves a stub of the blog API on localhost, answering every post after
+    ``delay`` seconds. Returns the server, already running in a thread."""
+
+    class SlowBlogApi(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            sleep(delay)
+            slug = self.path.rsplit(":", 1)[-1]
+            body = json.dumps(
+                {
+                    "ID": 1,
+                    "title": slug,
+                    "slug": slug,
+                    "content": "<p>Post</p>",
+                    "excerpt": "",
+                    "post_thumbnail": None,
+                    "tags": {},
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowBlogApi)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def get_request(slug):
+    request = RequestFactory().get(f"/blog/{slug}")
+    request.user = AnonymousUser()
+    return request
+
+
+def get_slugs(total):
+    """Slugs never seen before, so every request misses the blog cache."""
+    prefix = uuid4().hex[:8]
+    return [f"post-{prefix}-{count}" for count in range(total)]
+
+
+def run_sync(slugs, workers):
+    def view(slug):
+        return blog_post(get_request(slug), slug)
+
+    with ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(view, slugs))
+
+
+async def run_async(slugs):
+    return await asyncio.gather(
+        *(async_blog_post(get_request(slug), slug) for slug in slugs)
+    )
+
+
+def count_ok(responses):
+    ok = sum(response.status_code == 200 for response in responses)
+    return f"{ok} ok"
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Sync workers, like gunicorn's default worker class",
+    )
+    parser.add_argument(
+        "--delay", type=float, default=0.2, help="Blog API latency, in seconds"
+    )
+    options = parser.parse_args()
+
+    total = options.requests
+    server = start_slow_blog_api(options.delay)
+    api_url = f"http://127.0.0.1:{server.server_port}/"
+
+    try:
+        with override_settings(BLOG_API_URL=api_url, CACHES=BENCHMARK_CACHES):
+            responses, sync = timed(run_sync, get_slugs(total), options.workers)
+            report("sync:", sync, total, "requests", count_ok(responses))
+
+            responses, asynchronous = timed(asyncio.run, run_async(get_slugs(total)))
+            report("async:", asynchronous, total, "requests", count_ok(responses))
+    finally:
+        server.shutdown()
+
+    report_speedup(sync, asynchronous)
+
+
+if __name__ == "__main__":
+    main()
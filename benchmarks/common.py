@@ -0,0 +1,17 @@
+from time import perf_counter
+
+
+def timed(func, *args, **kwargs):
+    """Calls ``func`` and returns its result with the seconds it took."""
+    start = perf_counter()
+    result = func(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+def report(name, elapsed, total, unit, note=""):
+    note = f", {note}" if note else ""
+    print(f"{name:<12} {elapsed:6.2f}s ({total / elapsed:9.1f} {unit}/s{note})")
+
+
+def report_speedup(legacy, current):
+    print(f"{'speedup:':<12} {legacy / current:6.1f}x")
@@ -0,0 +1,60 @@
+"""Compares rendering emails one by one and with ``get_emails_with_template``."""
+from argparse import ArgumentParser
+from datetime import datetime
+
+from benchmarks.common import report, report_speedup, timed
+from benchmarks.legacy import render_legacy_email
+from pyjobs.core.email_utils import get_emails_with_template
+from pyjobs.core.models import Job, JobApplication, Profile
+
+JOBS = 20
+
+
+def get_fake_emails(recipients):
+    """Unsaved jobs and applications, shaped like the challenge reminders."""
+    jobs = [
+        Job(
+            pk=pk,
+            created_at=datetime(2021, 1, 1),
+            title=f"Desenvolvedor Python {pk}",
+            company_name=f"Empresa {pk}",
+            unique_slug=f"desenvolvedor-python-{pk}",
+        )
+        for pk in range(1, JOBS + 1)
+    ]
+    emails = []
+    for count in range(recipients):
+        job = jobs[count % JOBS]
+        profile = Profile(pk=count + 1)
+        context = {
+            "vaga": job,
+            "pessoa": profile,
+            "mensagem": JobApplication(pk=count + 1, job=job),
+        }
+        subject = f"Teste Técnico da empresa: {job.company_name}"
+        emails.append((context, subject, [f"pessoa{count}@example.com"]))
+    return emails
+
+
+def render_one_by_one(template_name, emails):
+    for context, subject, to_emails in emails:
+        render_legacy_email(template_name, context, subject, to_emails)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--recipients", type=int, default=10000)
+    parser.add_argument("--template", default="job_interest_challenge")
+    options = parser.parse_args()
+
+    emails = get_fake_emails(options.recipients)
+    _, legacy = timed(render_one_by_one, options.template, emails)
+    _, bulk = timed(get_emails_with_template, options.template, emails)
+
+    report("legacy:", legacy, len(emails), "emails")
+    report("bulk:", bulk, len(emails), "emails")
+    report_speedup(legacy, bulk)
+
+
+if __name__ == "__main__":
+    main()
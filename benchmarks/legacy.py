@@ -0,0 +1,92 @@
+"""The implementations the optimized code replaced, kept in one place for the
+benchmarks and for the tests checking the output did not change."""
+import textwrap
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import get_template
+from django.utils.translation import gettext_lazy as _
+from PIL import Image, ImageDraw, ImageFont
+
+from pyjobs.core.utils import THUMBNAIL_KINDS
+
+
+def render_legacy_email(template_name, context_specific, subject, to_emails):
+    """How ``get_email_with_template`` rendered each message before the bulk
+    renderer."""
+    context = {
+        "dono_do_site": settings.WEBSITE_OWNER_NAME,
+        "nome_do_site": settings.WEBSITE_NAME,
+        "url_do_site": settings.WEBSITE_HOME_URL,
+        "vaga": context_specific.get("vaga", None),
+        "pessoa": context_specific.get("pessoa", None),
+        "mensagem": context_specific.get("mensagem", None),
+        "job_application": context_specific.get("job_application", None),
+    }
+
+    if context["vaga"]:
+        context["vaga_close_url"] = context["vaga"].get_close_url()
+        context["vaga_listing_url"] = context["vaga"].get_listing_url()
+
+    plain_text = get_template(f"emails/{template_name}.txt")
+    html_text = get_template(f"emails/html/{template_name}.html")
+
+    text_content, html_content = plain_text.render(context), html_text.render(context)
+
+    msg = EmailMultiAlternatives(
+        subject, text_content, settings.WEBSITE_GENERAL_EMAIL, to_emails
+    )
+    msg.attach_alternative(html_content, "text/html")
+
+    return msg
+
+
+def render_legacy_thumbnail(kind, title):
+    """How the thumbnails were drawn before ``ThumbnailCompositor``."""
+    base_image, header = THUMBNAIL_KINDS[kind]
+    font_path = "{}Montserrat/Montserrat-Medium.ttf".format(
+        settings.THUMBNAILS_BASE_FOLDER
+    )
+    font_bold_path = "{}Montserrat/Montserrat-Bold.ttf".format(
+        settings.THUMBNAILS_BASE_FOLDER
+    )
+
+    font_med_cntr = ImageFont.truetype(font_path, 60)
+    font_bold_cntr = ImageFont.truetype(font_bold_path, 60)
+
+    im = Image.open("{}{}".format(settings.THUMBNAILS_BASE_FOLDER, base_image))
+    im = im.resize((1280, 720))
+
+    image_overlay = Image.new("RGB", (1280, 720), color=0)
+
+    image_overlay.putalpha(175)
+
+    im.paste(image_overlay, (0, 0), image_overlay)
+
+    draw = ImageDraw.Draw(im)
+
+    w, nothing = draw.textsize(str(header), font=font_med_cntr)
+    draw.text(
+        ((1280 - w) / 2, 90),
+        text=str(header),
+        fill="white",
+        font=font_med_cntr,
+    )
+
+    offset = 225
+    for line in textwrap.wrap(title, width=25):
+        w, nothing = draw.textsize(line, font=font_bold_cntr)
+        draw.text(((1280 - w) / 2, offset), line, font=font_bold_cntr)
+        offset += font_bold_cntr.getsize(line)[1]
+
+    w, nothing = draw.textsize(
+        " ".join([str(_("Via")), settings.WEBSITE_NAME]), font=font_med_cntr
+    )
+    draw.text(
+        ((1280 - w) / 2, 500),
+        text=" ".join([str(_("Via")), settings.WEBSITE_NAME]),
+        fill="white",
+        font=font_med_cntr,
+    )
+
+    return im
@@ -0,0 +1,42 @@
+"""Compares thumbnail renders per second of the compositor and the legacy code."""
+from argparse import ArgumentParser
+
+from benchmarks.common import report, report_speedup, timed
+from benchmarks.legacy import render_legacy_thumbnail
+from pyjobs.core.utils import THUMBNAIL_KINDS, get_thumbnail_compositor
+
+TITLES = (
+    "Desenvolvedor Python Pleno",
+    "Engenheiro de Dados Sênior com experiência em Django e PostgreSQL",
+    "Estágio em Backend",
+    "Tech Lead Python / Flask / FastAPI - 100% Remoto",
+)
+
+
+def render_all(render, renders):
+    for count in range(renders):
+        render(TITLES[count % len(TITLES)])
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=50)
+    parser.add_argument("--kind", choices=sorted(THUMBNAIL_KINDS), default="job")
+    options = parser.parse_args()
+
+    kind, renders = options.kind, options.renders
+    compositor = get_thumbnail_compositor(kind)
+    compositor.render(TITLES[0])  # warm up the header/footer layer
+
+    _, legacy = timed(
+        render_all, lambda title: render_legacy_thumbnail(kind, title), renders
+    )
+    _, current = timed(render_all, compositor.render, renders)
+
+    report("legacy:", legacy, renders, "renders")
+    report("compositor:", current, renders, "renders")
+    report_speedup(legacy, current)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,17 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from pyjobs.api.models import ApiKey
 
-admin.site.register(ApiKey)
+
+class ApiKeyAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "key_hash")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if obj.api_key:
+            messages.warning(
+                request,
+                f"Chave de API: {obj.api_key} (copie agora, apenas o hash é guardado)",
+            )
+
+
+admin.site.register(ApiKey, ApiKeyAdmin)
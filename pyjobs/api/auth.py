@@ -0,0 +1,120 @@
+"""
+``?api_key=`` authentication of the partner endpoints.
+
+Keys are stored hashed (see ``ApiKey``) and looked up by the unique hash.
+Each process remembers the answer for ``API_KEY_CACHE_TTL`` seconds, so most
+requests cost no query: a deleted key keeps working on a process until its
+entry expires.
+
+Every key has a token bucket in the shared cache holding up to
+``API_RATE_LIMIT_BURST`` requests, refilled at ``API_RATE_LIMIT_RATE`` per
+second. The bucket is read and written without a lock, concurrent requests
+may take a few more tokens than there are: it is meant to stop one integrator
+from saturating the database, not to bill requests. The requests of each key
+are also counted per hour, see the ``api_key_usage`` command. Buckets and
+counters are keyed by the key hash.
+
+The cache must be shared by every process (``CACHE_BACKEND`` pointing to
+memcached or redis). With the default ``LocMemCache`` each process keeps its
+own buckets and counters, so a key gets the burst once per process and
+``api_key_usage`` only sees a fraction of the requests.
+"""
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from restless.exceptions import TooManyRequests
+
+from pyjobs.api.models import ApiKey, hash_api_key
+
+MAX_VERIFIED_KEYS = 1024
+RATE_LIMIT_KEY = "api_rate_limit:{}"
+REQUEST_COUNT_KEY = "api_requests:{}:{:%Y%m%d%H}"
+REQUEST_COUNT_TIMEOUT = 60 * 60 * 24 * 8
+
+
+class RateLimited(TooManyRequests):
+    def __init__(self, retry_after):
+        self.retry_after = math.ceil(retry_after)
+        super(RateLimited, self).__init__(
+            f"Rate limit exceeded, retry in {self.retry_after} seconds."
+        )
+
+
+_verified = {}  # key hash -> (expires at, ApiKey pk or None)
+_verified_lock = threading.Lock()
+
+
+def get_api_key_id(api_key):
+    """Returns the pk of the ``ApiKey`` of ``api_key``, ``None`` if invalid."""
+    if not api_key:
+        return None
+
+    key_hash = hash_api_key(api_key)
+    now = time.monotonic()
+    cached = _verified.get(key_hash)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    pk = ApiKey.objects.filter(key_hash=key_hash).values_list("pk", flat=True).first()
+    with _verified_lock:
+        if len(_verified) >= MAX_VERIFIED_KEYS:  # random keys sprayed by bots
+            _verified.clear()
+        _verified[key_hash] = (now + settings.API_KEY_CACHE_TTL, pk)
+    return pk
+
+
+def take_token(key_hash):
+    """Takes a token from the bucket of the key. Returns how many seconds to
+    wait for one if it is empty, otherwise 0."""
+    rate, burst = settings.API_RATE_LIMIT_RATE, settings.API_RATE_LIMIT_BURST
+    key = RATE_LIMIT_KEY.format(key_hash)
+    now = time.time()
+    tokens, updated_at = cache.get(key, (burst, now))
+    tokens = min(burst, tokens + (now - updated_at) * rate)
+    if tokens < 1:
+        return (1 - tokens) / rate
+
+    cache.set(key, (tokens - 1, now), timeout=math.ceil(burst / rate) + 1)
+    return 0
+
+
+def count_request(key_hash, hour=None):
+    key = REQUEST_COUNT_KEY.format(key_hash, hour or datetime.now())
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=REQUEST_COUNT_TIMEOUT)
+        cache.incr(key)
+
+
+def get_request_counts(key_hash, hours=24):
+    """Returns the number of requests of the key in each of the last ``hours``
+    hours, oldest first, as ``(hour, count)`` pairs."""
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    hours = [now - timedelta(hours=hours_ago) for hours_ago in range(hours - 1, -1, -1)]
+    keys = {hour: REQUEST_COUNT_KEY.format(key_hash, hour) for hour in hours}
+    counts = cache.get_many(keys.values())
+    return [(hour, counts.get(key, 0)) for hour, key in keys.items()]
+
+
+def authenticate(request):
+    """
+    Returns the pk of the key in ``?api_key=``, ``None`` if it is invalid.
+    Raises ``RateLimited`` if the key has no requests left for now, those
+    requests are counted too.
+    """
+    api_key = request.GET.get("api_key")
+    key_id = get_api_key_id(api_key)
+    if key_id is None:
+        return None
+
+    key_hash = hash_api_key(api_key)
+    count_request(key_hash)
+    retry_after = take_token(key_hash)
+    if retry_after:
+        raise RateLimited(retry_after)
+    return key_id
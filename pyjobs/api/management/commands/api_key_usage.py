@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from pyjobs.api.auth import get_request_counts
+from pyjobs.api.models import ApiKey
+
+
+class Command(BaseCommand):
+    help = "Shows the requests of each API key in the last hours"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=int, default=24)
+
+    def handle(self, *args, **options):
+        if options["hours"] < 1:
+            raise CommandError("--hours must be at least 1")
+
+        for api_key in ApiKey.objects.order_by("pk"):
+            counts = get_request_counts(api_key.key_hash, options["hours"])
+            total = sum(count for _, count in counts)
+            peak_hour, peak = max(counts, key=lambda hour_count: hour_count[1])
+            self.stdout.write(
+                f"{api_key}: {total} requests, peak of {peak} at {peak_hour:%Y-%m-%d %H}h"
+            )
@@ -0,0 +1,44 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def hash_api_keys(apps, schema_editor):
+    ApiKey = apps.get_model("api", "ApiKey")
+    seen = set()
+    for api_key in ApiKey.objects.order_by("pk"):
+        key_hash = hashlib.sha256(api_key.api_key.encode()).hexdigest()
+        if key_hash in seen:
+            api_key.delete()
+            continue
+        seen.add(key_hash)
+        api_key.key_hash = key_hash
+        api_key.save(update_fields=["key_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("api", "0001_initial")]
+
+    operations = [
+        migrations.AddField(
+            model_name="apikey",
+            name="name",
+            field=models.CharField(blank=True, max_length=100, verbose_name="Nome"),
+        ),
+        migrations.AddField(
+            model_name="apikey",
+            name="key_hash",
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        # irreversible: the plain keys can't be recovered from their hashes
+        migrations.RunPython(hash_api_keys),
+        migrations.RemoveField(model_name="apikey", name="api_key"),
+        migrations.AlterField(
+            model_name="apikey",
+            name="key_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, unique=True
+            ),
+        ),
+    ]
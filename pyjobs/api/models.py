@@ -1,5 +1,39 @@
+import hashlib
+import secrets
+
 from django.db import models
 
 
+def generate_api_key():
+    return secrets.token_urlsafe(32)
+
+
+def hash_api_key(api_key):
+    """Keys are random tokens, a plain SHA-256 is enough to not keep them."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
 class ApiKey(models.Model):
-    api_key = models.CharField(max_length=250, null=False, blank=False)
+    """Only the hash of a key is stored: the key itself can only be read from
+    ``api_key`` on the instance that created it, a new one is generated on
+    save if none was given."""
+
+    name = models.CharField("Nome", max_length=100, blank=True)
+    key_hash = models.CharField(max_length=64, unique=True, editable=False, blank=True)
+
+    def __str__(self):
+        return self.name or f"ApiKey {self.pk}"
+
+    @property
+    def api_key(self):
+        return getattr(self, "_api_key", None)
+
+    @api_key.setter
+    def api_key(self, value):
+        self._api_key = value
+        self.key_hash = hash_api_key(value)
+
+    def save(self, *args, **kwargs):
+        if not self.key_hash:
+            self.api_key = generate_api_key()
+        super(ApiKey, self).save(*args, **kwargs)
@@ -0,0 +1,108 @@
+from django.db import models
+from restless.preparers import FieldsPreparer
+
+from pyjobs.api.serializers import PyJobsTypesJSONEncoder
+
+
+def format_datetime(value):
+    return value.strftime(PyJobsTypesJSONEncoder.DATETIME_FORMAT)
+
+
+def get_formatter(field):
+    """How the encoders would have turned a value of ``field`` into JSON, or
+    ``None`` if it already is a JSON type."""
+    if isinstance(field, models.DateTimeField):
+        return format_datetime
+    if isinstance(field, models.DateField):
+        return lambda value: value.isoformat()
+    if isinstance(field, (models.DecimalField, models.UUIDField)):
+        return str
+    return None
+
+
+class ProjectionPreparer(FieldsPreparer):
+    """
+    A ``FieldsPreparer`` for plain fields of ``model`` that can prepare a
+    whole queryset without building its model instances: ``project`` fetches
+    just the prepared columns as tuples and formats the values JSON can't hold
+    in one pass, so the rows can go to a fast JSON encoder as they are.
+
+    ``related_names`` are prepared from the ``related_columns`` of the same
+    query (joined lookups like ``user__email``), each name taking the column
+    at the same position. Subclasses shaping them differently override
+    ``prepare_related``.
+    """
+
+    related_names = ()
+    related_columns = ()
+
+    def __init__(self, model, fields):
+        super(ProjectionPreparer, self).__init__(fields)
+        self.names = [name for name in fields if name not in self.related_names]
+        self.columns = [fields[name] for name in self.names]
+        self.formatters = []
+        for position, column in enumerate(self.columns):
+            formatter = get_formatter(model._meta.get_field(column))
+            if formatter is not None:
+                self.formatters.append((position, formatter))
+
+    def project(self, queryset):
+        return list(self.iterate(queryset))
+
+    def iterate(self, queryset, chunk_size=None):
+        """Yields the prepared rows one by one. With ``chunk_size`` they are
+        fetched through ``iterator``, a server-side cursor where supported,
+        so the queryset is never held in memory."""
+        names, formatters = self.names, self.formatters
+        width = len(names)
+        rows = queryset.values_list(*self.columns, *self.related_columns)
+        if chunk_size is not None:
+            rows = rows.iterator(chunk_size=chunk_size)
+        for row in rows:
+            if formatters:
+                row = list(row)
+                for position, formatter in formatters:
+                    if row[position] is not None:
+                        row[position] = formatter(row[position])
+            item = dict(zip(names, row))
+            if self.related_columns:
+                self.prepare_related(item, row[width:])
+            yield item
+
+    def prepare_related(self, item, values):
+        item.update(zip(self.related_names, values))
+
+
+class JobApplicationPreparer(ProjectionPreparer):
+    """
+    Prepares the applications with the applicant and the job joined in the
+    same query, shaped like ``PyJobsTypesJSONEncoder`` shapes a ``User`` and a
+    ``Job``, instead of one profile query per applicant.
+    """
+
+    related_names = ("user", "job")
+    related_columns = (
+        "user__first_name",
+        "user__last_name",
+        "user__email",
+        "user__profile__github",
+        "user__profile__linkedin",
+        "user__profile__portfolio",
+        "user__profile__cellphone",
+        "job__title",
+        "job__company_name",
+        "job__id",
+    )
+
+    def prepare_related(self, item, values):
+        first_name, last_name, email, *profile, title, company_name, pk = values
+        github, linkedin, portfolio, cellphone = profile
+        item["user"] = {
+            "github": github,
+            "linkedin": linkedin,
+            "portfolio": portfolio,
+            "cellphone": cellphone,
+            "full_name": f"{first_name} {last_name}".strip(),
+            "email": email,
+        }
+        item["job"] = f"{title} - {company_name} - {pk}"
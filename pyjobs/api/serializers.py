@@ -1,6 +1,8 @@
 import json
 from datetime import datetime
 
+from django.conf import settings
+from django.utils.module_loading import import_string
 from restless.serializers import JSONSerializer
 from restless.utils import MoreTypesJSONEncoder
 
@@ -36,3 +38,18 @@ class PyJobsSerializer(JSONSerializer):
 
     def serialize(self, data):
         return json.dumps(data, cls=PyJobsTypesJSONEncoder)
+
+    def serialize_projected(self, data):
+        """Serializes data made of JSON types only (see ``ProjectionPreparer``)
+        with the ``API_JSON_DUMPS`` function, e.g. ``orjson.dumps``."""
+        return import_string(settings.API_JSON_DUMPS)(data)
+
+    def serialize_lines(self, items):
+        """Yields each item of ``items`` serialized like ``serialize_projected``
+        on its own line, as newline-delimited JSON bytes."""
+        dumps = import_string(settings.API_JSON_DUMPS)
+        for item in items:
+            line = dumps(item)
+            if isinstance(line, str):
+                line = line.encode()
+            yield line + b"\n"
@@ -0,0 +1,79 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.shortcuts import resolve_url
+from django.test import RequestFactory, TestCase, override_settings
+from freezegun import freeze_time
+
+from pyjobs.api.auth import RateLimited, authenticate, get_request_counts
+from pyjobs.api.models import ApiKey, hash_api_key
+
+
+@patch.dict("pyjobs.api.auth._verified", clear=True)
+@override_settings(API_RATE_LIMIT_BURST=2, API_RATE_LIMIT_RATE=0.5)
+class TestApiKeyAuthentication(TestCase):
+    def setUp(self):
+        self.api_key = ApiKey.objects.create(name="Parceiro")
+        self.request = RequestFactory().get("/", {"api_key": self.api_key.api_key})
+
+    def test_only_the_hash_is_stored(self):
+        self.assertEqual(hash_api_key(self.api_key.api_key), self.api_key.key_hash)
+        self.assertIsNone(ApiKey.objects.get(pk=self.api_key.pk).api_key)
+
+    def test_verified_keys_are_cached(self):
+        self.assertEqual(self.api_key.pk, authenticate(self.request))
+        with self.assertNumQueries(0):
+            self.assertEqual(self.api_key.pk, authenticate(self.request))
+
+    def test_invalid_keys(self):
+        request = RequestFactory().get("/", {"api_key": "invalid"})
+        self.assertIsNone(authenticate(request))
+        with self.assertNumQueries(0):
+            self.assertIsNone(authenticate(request))
+        self.assertIsNone(authenticate(RequestFactory().get("/")))
+
+    def test_rate_limit(self):
+        with freeze_time("2020-01-01 12:00:00") as frozen_time:
+            authenticate(self.request)
+            authenticate(self.request)
+            with self.assertRaises(RateLimited) as context:
+                authenticate(self.request)
+            self.assertEqual(2, context.exception.retry_after)
+
+            frozen_time.tick(2)
+            self.assertEqual(self.api_key.pk, authenticate(self.request))
+
+    def test_rate_limited_responses(self):
+        url = resolve_url("api:job_export")
+        for _ in range(2):
+            self.client.get(url, {"api_key": self.api_key.api_key})
+        response = self.client.get(url, {"api_key": self.api_key.api_key})
+        self.assertEqual(429, response.status_code)
+        self.assertIn("Retry-After", response)
+
+        url = resolve_url("api:jobapplication_list")
+        response = self.client.get(url, {"api_key": self.api_key.api_key, "id": 1})
+        self.assertEqual(429, response.status_code)
+        self.assertIn("Retry-After", response)
+
+    def test_request_counters(self):
+        with freeze_time("2020-01-01 12:30:00"):
+            for _ in range(3):
+                try:
+                    authenticate(self.request)
+                except RateLimited:
+                    pass
+            counts = get_request_counts(self.api_key.key_hash, hours=2)
+
+            output = StringIO()
+            call_command("api_key_usage", hours=2, stdout=output)
+
+        self.assertEqual([0, 3], [count for _, count in counts])
+        self.assertIn(
+            "Parceiro: 3 requests, peak of 3 at 2020-01-01 12h", output.getvalue()
+        )
+
+    def test_request_counters_need_an_hour(self):
+        with self.assertRaises(CommandError):
+            call_command("api_key_usage", hours=0, stdout=StringIO())
@@ -0,0 +1,81 @@
+from datetime import datetime
+from json import loads
+from unittest.mock import patch
+
+from django.shortcuts import resolve_url
+from django.test import TestCase
+from model_bakery import baker as mommy
+
+from pyjobs.api.models import ApiKey
+from pyjobs.api.views import JobResource
+from pyjobs.core.models import Country, Currency, Job, JobApplication, Profile
+
+
+class TestExportViews(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        country, currency = mommy.make(Country), mommy.make(Currency)
+        self.jobs = mommy.make(
+            Job, public=True, country=country, currency=currency, _quantity=3
+        )
+        for day, job in enumerate(self.jobs, start=1):
+            Job.objects.filter(pk=job.pk).update(created_at=datetime(2020, 1, day))
+
+        for profile in mommy.make(Profile, _quantity=2):
+            JobApplication.objects.create(user=profile.user, job=self.jobs[0])
+
+        self.api_key = mommy.make(ApiKey)
+        self.jobs_url = resolve_url("api:job_export")
+        self.applications_url = resolve_url("api:jobapplication_export")
+
+    def export(self, url, **params):
+        params.setdefault("api_key", self.api_key.api_key)
+        response = self.client.get(url, params)
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.streaming)
+        self.assertEqual("application/x-ndjson", response["Content-Type"])
+        content = b"".join(response.streaming_content).decode()
+        return [loads(line) for line in content.splitlines()]
+
+    def export_error(self, url, **params):
+        return self.client.get(url, {"api_key": self.api_key.api_key, **params})
+
+    def test_jobs(self):
+        lines = self.export(self.jobs_url)
+        self.assertEqual([job.pk for job in self.jobs], [line["id"] for line in lines])
+        self.assertEqual("2020-01-01 00:00:00", lines[0]["created_at"])
+        self.assertEqual(set(JobResource.preparer.fields), set(lines[0]))
+
+    def test_jobs_since(self):
+        lines = self.export(self.jobs_url, since="2020-01-01 00:00:00")
+        self.assertEqual(
+            [job.pk for job in self.jobs[1:]], [line["id"] for line in lines]
+        )
+        lines = self.export(self.jobs_url, since="2020-01-03")
+        self.assertEqual([], lines)
+
+    def test_applications(self):
+        lines = self.export(self.applications_url, id=self.jobs[0].pk)
+        self.assertEqual(2, len(lines))
+        self.assertEqual(str(self.jobs[0]), lines[0]["job"])
+        self.assertIn("github", lines[0]["user"])
+        self.assertEqual([], self.export(self.applications_url, id=self.jobs[1].pk))
+
+    def test_queries_do_not_grow_with_the_rows(self):
+        with self.assertNumQueries(2):
+            self.export(self.jobs_url)
+
+    def test_invalid_api_key(self):
+        response = self.client.get(self.jobs_url, {"api_key": "invalid"})
+        self.assertEqual(401, response.status_code)
+        self.assertIn("error", response.json())
+
+    def test_invalid_params(self):
+        response = self.export_error(self.jobs_url, since="yesterday")
+        self.assertEqual(400, response.status_code)
+        response = self.export_error(self.applications_url, id="abc")
+        self.assertEqual(400, response.status_code)
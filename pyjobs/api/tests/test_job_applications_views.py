@@ -1,8 +1,10 @@
 from json import loads
 from unittest.mock import patch
 
+from django.db import connection
 from django.shortcuts import resolve_url
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker as mommy
 from model_mommy.recipe import Recipe
 
@@ -95,3 +97,83 @@ class TestJobApplicationWithItemsResourceList(TestCase):
 
     def test_results(self):
         self.assertEqual(len(self.response.json["objects"]), 1)
+
+
+class TestJobApplicationResourceQueries(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.job = mommy.make(
+            Job,
+            public=True,
+            country=mommy.make(Country),
+            currency=mommy.make(Currency),
+        )
+        self.api_key = mommy.make(ApiKey)
+        self.url = resolve_url("api:jobapplication_list")
+        self.params = {"id": self.job.pk, "api_key": self.api_key.api_key}
+        self.client.get(self.url, self.params)  # the key is verified once
+
+    def apply(self, applicants):
+        for profile in mommy.make(Profile, _quantity=applicants):
+            JobApplication.objects.create(user=profile.user, job=self.job)
+
+    def count_queries(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {**self.params, **params})
+        self.assertEqual(200, response.status_code)
+        return len(queries)
+
+    def test_queries_do_not_grow_with_the_applicants(self):
+        self.apply(1)
+        queries = self.count_queries()
+        self.apply(9)
+        self.assertEqual(queries, self.count_queries())
+
+    def test_keyset_queries_do_not_grow_with_the_applicants(self):
+        self.apply(1)
+        queries = self.count_queries(cursor="")
+        self.apply(9)
+        self.assertEqual(queries, self.count_queries(cursor=""))
+
+    def test_applicant(self):
+        profile = mommy.make(
+            Profile, github="https://github.com/ana", cellphone="11999999999"
+        )
+        profile.user.first_name, profile.user.last_name = "Ana", "Silva"
+        profile.user.save()
+        application = JobApplication.objects.create(user=profile.user, job=self.job)
+
+        data = self.client.get(self.url, self.params).json()
+        self.assertEqual(data["meta"]["total_count"], 1)
+        self.assertEqual(
+            data["objects"][0]["user"],
+            {
+                "github": "https://github.com/ana",
+                "linkedin": profile.linkedin,
+                "portfolio": profile.portfolio,
+                "cellphone": "11999999999",
+                "full_name": "Ana Silva",
+                "email": profile.user.email,
+            },
+        )
+        self.assertEqual(data["objects"][0]["job"], str(self.job))
+        self.assertEqual(
+            data["objects"][0]["created_at"],
+            application.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    def test_projection_matches_the_encoder(self):
+        self.apply(2)
+        projected = self.client.get(self.url, self.params).json()["objects"]
+        encoded = self.client.get(self.url, {**self.params, "cursor": ""}).json()
+        self.assertEqual(projected, encoded["objects"])
+
+    def test_pages(self):
+        self.apply(21)
+        data = self.client.get(self.url, self.params).json()
+        self.assertEqual(len(data["objects"]), 20)
+        self.assertEqual(data["meta"]["total_pages"], 2)
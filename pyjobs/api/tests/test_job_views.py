@@ -1,10 +1,16 @@
+import json
 from json import loads
 from unittest.mock import patch
 
+from django.db import connection
 from django.shortcuts import resolve_url
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker as mommy
+from restless.preparers import FieldsPreparer
 
+from pyjobs.api.preparers import ProjectionPreparer
+from pyjobs.api.serializers import PyJobsSerializer
 from pyjobs.api.views import JobResource
 from pyjobs.core.models import Job, Country, Currency
 
@@ -51,6 +57,48 @@ class TestJobResourceList(TestCase):
         self.assertEqual(self.response.json["error"], "Invalid page number")
 
 
+class TestJobResourceListByCursor(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.country = mommy.make(Country)
+        self.currency = mommy.make(Currency)
+        self.client = Client()
+        mommy.make(
+            Job,
+            _quantity=PER_PAGE + 5,
+            public=True,
+            country=self.country,
+            currency=self.currency,
+        )
+        self.url = resolve_url("api:job_list")
+
+    def get(self, cursor):
+        response = self.client.get(self.url, {"cursor": cursor})
+        return response.status_code, loads(response.content.decode("utf-8"))
+
+    def test_pagination(self):
+        status, first = self.get("")
+        self.assertEqual(200, status)
+        self.assertEqual(len(first["objects"]), PER_PAGE)
+        self.assertEqual(first["meta"]["estimated_count"], PER_PAGE + 5)
+        self.assertTrue(first["meta"]["next"])
+        self.assertIsNone(first["meta"]["previous_cursor"])
+
+        status, second = self.get(first["meta"]["next_cursor"])
+        self.assertEqual(len(second["objects"]), 5)
+        self.assertFalse(second["meta"]["next"])
+        self.assertTrue(second["meta"]["previous"])
+
+    def test_invalid_cursor(self):
+        status, response = self.get("foo")
+        self.assertEqual(400, status)
+        self.assertEqual(response["error"], "Invalid cursor")
+
+
 class TestJobResourceListIfEmpty(TestCase):
     @patch("pyjobs.marketing.triggers.send_group_notification")
     @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
@@ -111,3 +159,71 @@ class TestJobResourceDetail(TestCase):
 
             with self.subTest():
                 self.assertEqual(getattr(self.job, field), self.response.json[field])
+
+
+def dumps_with_marker(data):
+    return json.dumps({"marker": True, **data})
+
+
+class TestJobResourceProjection(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.country = mommy.make(Country)
+        self.currency = mommy.make(Currency)
+        mommy.make(
+            Job,
+            _quantity=PER_PAGE + 5,
+            public=True,
+            country=self.country,
+            currency=self.currency,
+        )
+        self.url = resolve_url("api:job_list")
+
+    def test_same_objects_as_the_fields_preparer(self):
+        preparer = FieldsPreparer(fields=JobResource.preparer.fields)
+        expected = loads(
+            PyJobsSerializer().serialize(
+                [preparer.prepare(job) for job in Job.objects.all()[:PER_PAGE]]
+            )
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(loads(response.content)["objects"], expected)
+
+    def test_only_prepared_columns_are_fetched(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+
+        (select,) = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "LIMIT" in query["sql"]
+        ]
+        self.assertIn('"core_job"."description"', select)
+        self.assertNotIn('"core_job"."salary_range"', select)
+
+    def test_related_columns(self):
+        class CountryPreparer(ProjectionPreparer):
+            related_names = ("country",)
+            related_columns = ("country__name",)
+
+        preparer = CountryPreparer(Job, {"title": "title", "country": "country"})
+        job = Job.objects.first()
+
+        self.assertEqual(
+            preparer.project(Job.objects.filter(pk=job.pk)),
+            [{"title": job.title, "country": self.country.name}],
+        )
+
+    @override_settings(
+        API_JSON_DUMPS="pyjobs.api.tests.test_job_views.dumps_with_marker"
+    )
+    def test_encoder_is_pluggable(self):
+        response = loads(self.client.get(self.url).content)
+        self.assertTrue(response["marker"])
+        self.assertEqual(len(response["objects"]), PER_PAGE)
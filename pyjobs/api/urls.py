@@ -1,9 +1,16 @@
 from django.conf.urls import include, url
 
-from pyjobs.api.views import JobResource, JobApplicationResource
+from pyjobs.api.views import (
+    JobApplicationResource,
+    JobResource,
+    export_job_applications,
+    export_jobs,
+)
 
 app_name = "api"
 urlpatterns = [
+    url("^jobs/export/$", export_jobs, name="job_export"),
+    url("^japps/export/$", export_job_applications, name="jobapplication_export"),
     url("^jobs/", include(JobResource.urls(name_prefix="job"))),
     url("^japps/", include(JobApplicationResource.urls(name_prefix="jobapplication"))),
 ]
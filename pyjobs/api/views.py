@@ -1,29 +1,58 @@
 from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.http import require_GET
 from restless.dj import DjangoResource
 from restless.exceptions import BadRequest
-from restless.preparers import FieldsPreparer
 
+from pyjobs.api.auth import RateLimited, authenticate
+from pyjobs.api.preparers import JobApplicationPreparer, ProjectionPreparer
 from pyjobs.api.serializers import PyJobsSerializer
+from pyjobs.core.conditional_get import jobs_conditional_get
+from pyjobs.core.pagination import InvalidCursor, KeysetPage, KeysetPaginator
 from pyjobs.core.models import Job, JobApplication
-from pyjobs.api.models import ApiKey
+
+EXPORT_CHUNK_SIZE = 2000
 
 
 class DjangoPaginatedResource(DjangoResource):
     """This will be unnecessary with next restless versions. For instante,
     see this recent (2019) progress for details:
-    https://github.com/toastdriven/restless/issues/78"""
+    https://github.com/toastdriven/restless/issues/78
+
+    Passing a ``cursor`` (empty for the first page) switches to keyset
+    pagination, which skips the COUNT and OFFSET queries and reports an
+    ``estimated_count`` instead of the exact totals."""
 
     def serialize_list(self, data):
         if data is None:
             return super(DjangoResource, self).serialize_list(data)
 
+        if "cursor" in self.request.GET:
+            try:
+                self.page = KeysetPaginator(data, self.page_size).page(
+                    self.request.GET["cursor"]
+                )
+            except InvalidCursor:
+                raise BadRequest("Invalid cursor")
+            return self.serialize_page(self.page.object_list)
+
         paginator = Paginator(data, self.page_size)
         page_number = self.request.GET.get("page", 1)
         if page_number not in paginator.page_range:
             raise BadRequest("Invalid page number")
 
         self.page = paginator.page(page_number)
-        data = self.page.object_list
+        return self.serialize_page(self.page.object_list)
+
+    def serialize_page(self, data):
+        """Querysets prepared by a ``ProjectionPreparer`` skip the model
+        instances and the encoder hooks."""
+        if isinstance(self.preparer, ProjectionPreparer) and isinstance(data, QuerySet):
+            final_data = self.wrap_list_response(self.preparer.project(data))
+            return self.serializer.serialize_projected(final_data)
+
         return super(DjangoResource, self).serialize_list(data)
 
     def wrap_list_response(self, data):
@@ -32,6 +61,17 @@ class DjangoPaginatedResource(DjangoResource):
         if not hasattr(self, "page"):
             return response_dict
 
+        if isinstance(self.page, KeysetPage):
+            response_dict["meta"] = {
+                "limit": self.page.paginator.per_page,
+                "estimated_count": self.page.paginator.estimated_count,
+                "next": self.page.has_next(),
+                "previous": self.page.has_previous(),
+                "next_cursor": self.page.next_cursor,
+                "previous_cursor": self.page.previous_cursor,
+            }
+            return response_dict
+
         next_page, previous_page = None, None
         if self.page.has_next() and self.page.next_page_number():
             next_page = True
@@ -52,7 +92,8 @@ class DjangoPaginatedResource(DjangoResource):
 class JobResource(DjangoPaginatedResource):
     page_size = 20
     serializer = PyJobsSerializer()
-    preparer = FieldsPreparer(
+    preparer = ProjectionPreparer(
+        Job,
         fields={
             field.name: field.name
             for field in Job._meta.fields
@@ -67,9 +108,14 @@ class JobResource(DjangoPaginatedResource):
                 "created_at",
                 "remote",
             }
-        }
+        },
     )
 
+    @classmethod
+    def as_view(cls, view_type, *init_args, **init_kwargs):
+        view = super(JobResource, cls).as_view(view_type, *init_args, **init_kwargs)
+        return jobs_conditional_get()(view)
+
     def list(self):
         return Job.objects.all()
 
@@ -77,21 +123,87 @@ class JobResource(DjangoPaginatedResource):
         return Job.objects.get(id=pk)
 
 
-class JobApplicationResource(DjangoResource):
+class JobApplicationResource(DjangoPaginatedResource):
     page_size = 20
     serializer = PyJobsSerializer()
-    preparer = FieldsPreparer(
-        fields={field.name: field.name for field in JobApplication._meta.fields}
+    preparer = JobApplicationPreparer(
+        JobApplication,
+        fields={field.name: field.name for field in JobApplication._meta.fields},
     )
 
     def list(self):
         job_to_lookout = Job.objects.get(id=int(self.request.GET.get("id")))
-        qs = JobApplication.objects.filter(job=job_to_lookout)
+        qs = (
+            JobApplication.objects.filter(job=job_to_lookout)
+            .select_related("user__profile", "job")
+            .order_by("-created_at", "-id")
+        )
         return qs
 
     def is_authenticated(self):
+        return authenticate(self.request) is not None
+
+    def build_error(self, err):
+        response = super(JobApplicationResource, self).build_error(err)
+        if isinstance(err, RateLimited):
+            response["Retry-After"] = err.retry_after
+        return response
+
+
+def parse_since(value):
+    """Parses the ``since`` filter of the exports, a date or a datetime."""
+    try:
+        since = parse_datetime(value) or parse_date(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValueError(f"Invalid since: {value}")
+    return since
+
+
+def stream_export(request, queryset, preparer):
+    """
+    Streams the rows of ``queryset`` created after ``?since=``, oldest first,
+    as newline-delimited JSON. Rows are read through a server-side cursor and
+    written as they are prepared, so memory stays flat whatever the size of
+    the export. Pass the ``created_at`` of the last line as ``since`` to pull
+    only the new rows next time.
+    """
+    try:
+        if authenticate(request) is None:
+            return JsonResponse({"error": "Unauthorized."}, status=401)
+    except RateLimited as error:
+        response = JsonResponse({"error": error.msg}, status=error.status)
+        response["Retry-After"] = error.retry_after
+        return response
+
+    if request.GET.get("since"):
         try:
-            key = ApiKey.objects.get(api_key=self.request.GET.get("api_key"))
-            return True
-        except ApiKey.DoesNotExist:
-            return False
+            since = parse_since(request.GET["since"])
+        except ValueError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+        queryset = queryset.filter(created_at__gt=since)
+
+    queryset = queryset.order_by("created_at", "id")
+    rows = preparer.iterate(queryset, chunk_size=EXPORT_CHUNK_SIZE)
+    response = StreamingHttpResponse(
+        PyJobsSerializer().serialize_lines(rows), content_type="application/x-ndjson"
+    )
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@require_GET
+def export_jobs(request):
+    return stream_export(request, Job.objects.all(), JobResource.preparer)
+
+
+@require_GET
+def export_job_applications(request):
+    try:
+        job_id = int(request.GET.get("id", ""))
+    except ValueError:
+        return JsonResponse({"error": "Invalid job id."}, status=400)
+
+    queryset = JobApplication.objects.filter(job_id=job_id)
+    return stream_export(request, queryset, JobApplicationResource.preparer)
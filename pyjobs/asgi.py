@@ -0,0 +1,19 @@
+"""
+ASGI config for pyjobs project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with any ASGI server, e.g. ``uvicorn pyjobs.asgi:application`` or
+gunicorn with uvicorn's worker class, so the async views (blog, reCAPTCHA
+forms) let one worker wait on many upstream calls at once.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyjobs.settings")
+
+application = get_asgi_application()
@@ -2,6 +2,7 @@ from django.shortcuts import get_object_or_404, render, redirect, reverse, HttpR
 from django.utils.translation import gettext_lazy as _
 from pyjobs.assessment.models import *
 from django.contrib.auth.decorators import login_required
+from pyjobs.core.thumbnails import thumbnail_response
 from pyjobs.core.utils import generate_thumbnail_quiz
 
 from random import shuffle
@@ -88,9 +89,7 @@ def question_submit(request, unique_slug, question_id):
 
 
 def quiz_thumbnail(request, unique_slug):
-    quiz = Assessment.objects.filter(slug=unique_slug).first()
-    im = generate_thumbnail_quiz(quiz=quiz)
-
-    response = HttpResponse(content_type="image/png")
-    im.save(response, "PNG")
-    return response
+    quiz = get_object_or_404(Assessment, slug=unique_slug)
+    return thumbnail_response(
+        request, "quiz", quiz.name, lambda: generate_thumbnail_quiz(quiz=quiz)
+    )
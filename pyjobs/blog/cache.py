@@ -0,0 +1,135 @@
+"""
+Stale-while-revalidate cache for the blog API.
+
+Each response is kept in the configured cache backend, keyed by URL, together
+with the time it was fetched. For ``BLOG_CACHE_TTL`` seconds it is served as
+is. After that the stale copy is still served while one background thread
+fetches a new one; a ``cache.add`` lock keeps the other requests (and workers,
+with a shared backend) from starting the same refresh. When the API fails the
+last good copy stays in place, so the blog keeps working through outages:
+only a URL that was never fetched has to wait for the API.
+
+The async functions run the cache calls, and the start of the background
+refresh, in a thread with ``sync_to_async``. The cache backends are not
+async and must not block the event loop.
+"""
+import logging
+from hashlib import md5
+from threading import Thread
+from time import time
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from pyjobs.core import http_client
+
+BLOG_CACHE_KEY = "blog_api:{}"
+BLOG_REFRESH_LOCK_KEY = "blog_api_refresh:{}"
+BLOG_REFRESH_LOCK_TIMEOUT = 60
+# how long a copy can still be served while the blog API is down
+BLOG_STALE_TIMEOUT = 60 * 60 * 24 * 7
+
+logger = logging.getLogger(__name__)
+
+
+class BlogUnavailable(Exception):
+    pass
+
+
+def get_blog_url(path):
+    if not settings.BLOG_API_URL:
+        raise BlogUnavailable("BLOG_API_URL is not set")
+    return f"{settings.BLOG_API_URL}{path}"
+
+
+def get_cache_key(url):
+    return BLOG_CACHE_KEY.format(md5(url.encode()).hexdigest())
+
+
+def get_lock_key(url):
+    return BLOG_REFRESH_LOCK_KEY.format(md5(url.encode()).hexdigest())
+
+
+def save_response(url, response):
+    """Caches ``(fetched_at, status_code, data)`` for the response of ``url``.
+    Server errors are not cached, they raise ``BlogUnavailable`` instead."""
+    if response.status_code >= 500:
+        raise BlogUnavailable(f"{url} returned {response.status_code}")
+    try:
+        data = response.json() if response.status_code == 200 else None
+    except ValueError as error:
+        raise BlogUnavailable(f"{url}: {error}") from error
+
+    entry = (time(), response.status_code, data)
+    cache.set(get_cache_key(url), entry, BLOG_STALE_TIMEOUT)
+    return entry
+
+
+def fetch(url):
+    try:
+        response = http_client.get(url)
+    except requests.RequestException as error:
+        raise BlogUnavailable(f"{url}: {error}") from error
+    return save_response(url, response)
+
+
+async def afetch(url):
+    try:
+        response = await http_client.aget(url)
+    except requests.RequestException as error:
+        raise BlogUnavailable(f"{url}: {error}") from error
+    return await sync_to_async(save_response, thread_sensitive=False)(url, response)
+
+
+def refresh(url):
+    try:
+        fetch(url)
+    except BlogUnavailable as error:
+        logger.warning("Serving the stale copy of the blog API: %s", error)
+    finally:
+        cache.delete(get_lock_key(url))
+
+
+def refresh_in_background(url):
+    if not cache.add(get_lock_key(url), True, BLOG_REFRESH_LOCK_TIMEOUT):
+        return None  # someone else is already refreshing it
+    thread = Thread(target=refresh, args=(url,), daemon=True)
+    thread.start()
+    return thread
+
+
+def get_cached_entry(url):
+    """Returns the cached entry of ``url``, refreshing it in background if it
+    is stale, or ``None`` if it was never fetched."""
+    entry = cache.get(get_cache_key(url))
+    if entry is not None and time() - entry[0] > settings.BLOG_CACHE_TTL:
+        refresh_in_background(url)
+    return entry
+
+
+def get_blog_response(path):
+    """
+    Returns the ``(status_code, data)`` of ``path`` in the blog API, ``data``
+    being the decoded JSON of a 200 or ``None``. Raises ``BlogUnavailable``
+    if the API is down and ``path`` was never cached.
+    """
+    url = get_blog_url(path)
+    entry = get_cached_entry(url)
+    if entry is None:
+        entry = fetch(url)
+
+    _fetched_at, status_code, data = entry
+    return status_code, data
+
+
+async def aget_blog_response(path):
+    """Same as ``get_blog_response``, without blocking the event loop."""
+    url = get_blog_url(path)
+    entry = await sync_to_async(get_cached_entry, thread_sensitive=False)(url)
+    if entry is None:
+        entry = await afetch(url)
+
+    _fetched_at, status_code, data = entry
+    return status_code, data
@@ -0,0 +1,162 @@
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import requests
+import responses
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from freezegun import freeze_time
+
+from pyjobs.blog.cache import (
+    BlogUnavailable,
+    aget_blog_response,
+    get_blog_response,
+    get_lock_key,
+)
+
+BLOG_API_URL = "https://blog.example.com/api/"
+POSTS_URL = f"{BLOG_API_URL}posts/"
+POST = {
+    "ID": 1,
+    "title": "Python 4",
+    "slug": "python-4",
+    "post_thumbnail": None,
+    "tags": {},
+    "excerpt": "Soon",
+}
+
+
+class InlineThread:
+    """Runs the refresh right away so the tests see its result."""
+
+    def __init__(self, target, args, daemon):
+        self.target, self.args = target, args
+
+    def start(self):
+        self.target(*self.args)
+
+
+@freeze_time("2026-10-18 12:00:00")
+@override_settings(BLOG_API_URL=BLOG_API_URL, BLOG_CACHE_TTL=60)
+@patch("pyjobs.blog.cache.Thread", InlineThread)
+@patch("pyjobs.core.http_client.sleep")
+@patch.dict("pyjobs.core.http_client._clients", clear=True)
+class BlogCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def expire(self):
+        return freeze_time(datetime(2026, 10, 18, 12) + timedelta(seconds=61))
+
+    @responses.activate
+    def test_fresh_responses_are_served_from_cache(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": [POST]})
+
+        self.assertEqual(get_blog_response("posts/"), (200, {"posts": [POST]}))
+        self.assertEqual(get_blog_response("posts/"), (200, {"posts": [POST]}))
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_stale_responses_are_served_while_refreshed(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": []})
+        get_blog_response("posts/")
+        responses.replace(responses.GET, POSTS_URL, json={"posts": [POST]})
+
+        with self.expire():
+            self.assertEqual(get_blog_response("posts/"), (200, {"posts": []}))
+            self.assertEqual(get_blog_response("posts/"), (200, {"posts": [POST]}))
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_concurrent_refreshes_are_deduplicated(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": []})
+        get_blog_response("posts/")
+        cache.add(get_lock_key(POSTS_URL), True)
+
+        with self.expire():
+            get_blog_response("posts/")
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_last_good_copy_survives_upstream_errors(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": [POST]})
+        get_blog_response("posts/")
+        responses.replace(responses.GET, POSTS_URL, body=requests.ConnectionError())
+
+        with self.expire():
+            self.assertEqual(get_blog_response("posts/"), (200, {"posts": [POST]}))
+            self.assertEqual(get_blog_response("posts/"), (200, {"posts": [POST]}))
+        self.assertIsNone(cache.get(get_lock_key(POSTS_URL)))
+
+    @responses.activate
+    def test_errors_without_cached_copy(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, status=500)
+
+        with self.assertRaises(BlogUnavailable):
+            get_blog_response("posts/")
+
+    @responses.activate
+    def test_not_found_is_cached(self, _sleep):
+        url = f"{BLOG_API_URL}posts/slug:nope"
+        responses.add(responses.GET, url, status=404)
+
+        self.assertEqual(get_blog_response("posts/slug:nope"), (404, None))
+        self.assertEqual(get_blog_response("posts/slug:nope"), (404, None))
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_blog_index_keeps_working_through_outages(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": [POST]})
+        self.assertContains(self.client.get(reverse("blog_index")), "Python 4")
+        responses.replace(responses.GET, POSTS_URL, status=503)
+
+        with self.expire():
+            response = self.client.get(reverse("blog_index"))
+        self.assertContains(response, "Python 4")
+
+    @responses.activate
+    def test_async_fetch_is_cached(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": [POST]})
+
+        response = async_to_sync(aget_blog_response)("posts/")
+
+        self.assertEqual(response, (200, {"posts": [POST]}))
+        self.assertEqual(get_blog_response("posts/"), response)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_async_cache_calls_leave_the_event_loop(self, _sleep):
+        responses.add(responses.GET, POSTS_URL, json={"posts": [POST]})
+        cache_threads, cache_get = [], cache.get
+
+        def get(*args, **kwargs):
+            cache_threads.append(threading.get_ident())
+            return cache_get(*args, **kwargs)
+
+        async def fetch_from_the_loop():
+            with patch("pyjobs.blog.cache.cache.get", get):
+                await aget_blog_response("posts/")
+            return threading.get_ident()
+
+        loop_thread = async_to_sync(fetch_from_the_loop)()
+
+        self.assertTrue(cache_threads)
+        self.assertNotIn(loop_thread, cache_threads)
+
+    @responses.activate
+    def test_blog_post_redirects_while_blog_is_down(self, _sleep):
+        responses.add(responses.GET, f"{BLOG_API_URL}posts/slug:python-4", status=503)
+
+        response = self.client.get(reverse("blog_post", args=["python-4"]))
+
+        self.assertRedirects(
+            response, reverse("blog_index"), fetch_redirect_response=False
+        )
+
+    @override_settings(BLOG_API_URL=None)
+    def test_blog_index_without_api(self, _sleep):
+        response = self.client.get(reverse("blog_index"))
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
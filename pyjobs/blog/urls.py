@@ -6,7 +6,7 @@ from django.urls import reverse
 from pyjobs.blog.views import *
 
 urlpatterns = [
-    url(r"^$", blog_index, name="blog_index"),
-    url(r"^(?P<unique_slug>[-\w\d]+)$", blog_post, name="blog_post"),
-    url(r"^tag/(?P<unique_slug>[-\w\d]+)$", blog_tag_view, name="blog_tag"),
+    url(r"^$", async_blog_index, name="blog_index"),
+    url(r"^(?P<unique_slug>[-\w\d]+)$", async_blog_post, name="blog_post"),
+    url(r"^tag/(?P<unique_slug>[-\w\d]+)$", async_blog_tag_view, name="blog_tag"),
 ]
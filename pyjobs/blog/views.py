@@ -1,15 +1,19 @@
-import requests
-
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, resolve_url
 from django.conf import settings
 from django.utils.text import slugify
 
+from pyjobs.blog.cache import BlogUnavailable, aget_blog_response, get_blog_response
+
 
 def blog_index(request):
     page_number = request.GET.get("page", 1)
-    if not settings.BLOG_API_URL:
+    try:
+        status_code, post_request = get_blog_response("posts/")
+    except BlogUnavailable:
+        return redirect("/")
+    if status_code != 200:
         return redirect("/")
-    post_request = requests.get(f"{settings.BLOG_API_URL}posts/").json()
 
     posts = []
     for post in post_request["posts"]:
@@ -28,11 +32,14 @@ def blog_index(request):
 
 
 def blog_tag_view(request, unique_slug):
-    response = requests.get(f"{settings.BLOG_API_URL}posts?filter[tag]={unique_slug}")
-    if response.status_code != 200:
+    try:
+        status_code, post_response = get_blog_response(
+            f"posts?filter[tag]={unique_slug}"
+        )
+    except BlogUnavailable:
+        return redirect(resolve_url("blog_index"))
+    if status_code != 200:
         return redirect(resolve_url("blog_index"))
-
-    post_response = response.json()
 
     context = {
         "posts": [],
@@ -54,12 +61,43 @@ def blog_tag_view(request, unique_slug):
 
 
 def blog_post(request, unique_slug):
-    post_request = requests.get(f"{settings.BLOG_API_URL}posts/slug:{unique_slug}")
-    if post_request.status_code != 200:
+    try:
+        status_code, post = get_blog_response(f"posts/slug:{unique_slug}")
+    except BlogUnavailable:
+        return redirect(resolve_url("blog_index"))
+    if status_code != 200:
         return redirect(resolve_url("blog_index"))
 
     context = {
-        "post": post_request.json(),
+        "post": post,
     }
 
     return render(request, "blog/post_details.html", context=context)
+
+
+# The async views wait for the blog API without blocking the worker, the
+# response is then in the cache where the sync view reads it from.
+
+
+async def async_blog_index(request):
+    try:
+        await aget_blog_response("posts/")
+    except BlogUnavailable:
+        return redirect("/")
+    return await sync_to_async(blog_index)(request)
+
+
+async def async_blog_tag_view(request, unique_slug):
+    try:
+        await aget_blog_response(f"posts?filter[tag]={unique_slug}")
+    except BlogUnavailable:
+        return redirect(resolve_url("blog_index"))
+    return await sync_to_async(blog_tag_view)(request, unique_slug)
+
+
+async def async_blog_post(request, unique_slug):
+    try:
+        await aget_blog_response(f"posts/slug:{unique_slug}")
+    except BlogUnavailable:
+        return redirect(resolve_url("blog_index"))
+    return await sync_to_async(blog_post)(request, unique_slug)
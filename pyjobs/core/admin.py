@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.core.mail import send_mail
+from django.core.mail import get_connection, send_mail
 from django.utils.html import mark_safe
 from datetime import datetime
 from pyjobs.core.models import (
@@ -17,7 +17,7 @@ from pyjobs.marketing.triggers import (
 )
 from datetime import datetime
 from pyjobs.marketing.newsletter import subscribe_user_to_mailer
-from pyjobs.core.email_utils import get_email_with_template
+from pyjobs.core.email_utils import get_emails_with_template
 from django.utils.translation import gettext_lazy as _
 
 
@@ -45,27 +45,29 @@ def add_subscriber(modeladmin, request, queryset):
 def send_challenge_to_old_applicants(modeladmin, request, queryset):
     available_jobs = [job for job in queryset if job.is_challenging]
 
-    emails_to_be_sent = []
-
-    for job in available_jobs:
-
-        job_applicantions = JobApplication.objects.filter(job=job, email_sent=False)
-
-        for job_applicant in job_applicantions:
-            email_context = {
-                "vaga": job,
-                "pessoa": job_applicant.user.profile,
-                "mensagem": job_applicant,
-            }
+    job_applications = list(
+        JobApplication.objects.filter(
+            job__in=available_jobs, email_sent=False
+        ).select_related("job", "user__profile")
+    )
 
-            message = get_email_with_template(
-                "job_interest_challenge",
-                email_context,
-                " ".join(map(str, [_("Teste Técnico da empresa:"), job.company_name])),
-                [job_applicant.user.email],
-            )
+    def get_challenge_email(job_applicant):
+        job = job_applicant.job
+        email_context = {
+            "vaga": job,
+            "pessoa": job_applicant.user.profile,
+            "mensagem": job_applicant,
+        }
+        subject = " ".join(map(str, [_("Teste Técnico da empresa:"), job.company_name]))
+        return email_context, subject, [job_applicant.user.email]
+
+    messages = get_emails_with_template(
+        "job_interest_challenge", map(get_challenge_email, job_applications)
+    )
 
-            message.send()
+    with get_connection() as connection:
+        for message, job_applicant in zip(messages, job_applications):
+            connection.send_messages([message])
 
             job_applicant.email_sent = True
             job_applicant.email_sent_at = datetime.now()
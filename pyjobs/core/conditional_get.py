@@ -0,0 +1,79 @@
+"""
+Conditional GET (``ETag``/``Last-Modified``) for the job listings polled by
+feed readers and API clients.
+
+``Job`` signals keep the time of the last change to any job in the shared
+cache, and both validators are built from it: a request whose
+``If-None-Match`` or ``If-Modified-Since`` still matches is answered with a
+304 before the view runs a single query. When the entry is missing (first
+request, cache flushed) it is set to the current time, which at worst makes
+clients download the page once more. ``Last-Modified`` only has one second
+of resolution, so every change moves it at least to the next second.
+"""
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+JOBS_CHANGED_AT_KEY = "jobs_changed_at"
+
+
+def get_jobs_changed_at():
+    changed_at = cache.get(JOBS_CHANGED_AT_KEY)
+    if changed_at is None:
+        cache.add(JOBS_CHANGED_AT_KEY, time.time(), timeout=None)
+        changed_at = cache.get(JOBS_CHANGED_AT_KEY)
+    return changed_at
+
+
+def touch_jobs_changed_at():
+    changed_at = time.time()
+    previous = cache.get(JOBS_CHANGED_AT_KEY)
+    if previous is not None:
+        # else a client that fetched in the same second keeps its copy
+        changed_at = max(changed_at, int(previous) + 1)
+    cache.set(JOBS_CHANGED_AT_KEY, changed_at, timeout=None)
+
+
+def get_jobs_validators(period=None):
+    """Returns the ``ETag`` and the ``Last-Modified`` timestamp of the job
+    listings. With ``period`` (seconds) they also change at the start of each
+    period, for listings of the last days whose jobs age out without changes."""
+    changed_at = get_jobs_changed_at()
+    if period is not None:
+        now = time.time()
+        changed_at = max(changed_at, now - now % period)
+    return quote_etag(f"jobs-{changed_at:.6f}"), int(changed_at)
+
+
+def jobs_conditional_get(period=None):
+    """
+    Answers ``GET``/``HEAD`` requests to the decorated view with a 304 while
+    the client's copy is up to date, and sets the validators on its 200s.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+
+            # read before the view runs, a change made meanwhile must not be
+            # validated by a page that may not include it
+            etag, last_modified = get_jobs_validators(period)
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is None:
+                response = view(request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response["ETag"] = etag
+                response["Last-Modified"] = http_date(last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,38 +1,76 @@
 from django.conf import settings
-from social_django.models import UserSocialAuth
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
 
+SOCIAL_PROVIDERS = {"github": "github", "linkedin": "linkedin-oauth2"}
+SOCIAL_LOGIN_STATE_KEY = "social_login_state:{}"
+SOCIAL_LOGIN_STATE_TIMEOUT = 60 * 60 * 24
 
-def append_social_info_to_context(request):
-    return_content = {}
 
-    try:
-        user = request.user
-    except:
-        user = None
+def get_request_user(request):
+    """Returns the logged in user without loading the session of visitors
+    that never had one."""
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return None
 
-    try:
-        return_content["GITHUB_LOGIN"] = user.social_auth.get(provider="github")
-    except (UserSocialAuth.DoesNotExist, AttributeError):
-        return_content["GITHUB_LOGIN"] = False
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user
 
-    try:
-        return_content["LINKEDIN_LOGIN"] = user.social_auth.get(
-            provider="linkedin-oauth2"
-        )
-    except (UserSocialAuth.DoesNotExist, AttributeError):
-        return_content["LINKEDIN_LOGIN"] = False
 
-    return_content["SOCIAL_AUTH"] = (
-        return_content["GITHUB_LOGIN"] or return_content["LINKEDIN_LOGIN"]
+def get_social_login_state(user):
+    """Returns which social logins the user has and whether their profile is
+    still empty, cached until a ``UserSocialAuth`` or ``Profile`` changes."""
+    key = SOCIAL_LOGIN_STATE_KEY.format(user.pk)
+    state = cache.get(key)
+    if state is not None:
+        return state
+
+    from pyjobs.core.models import Profile
+
+    providers = set(
+        user.social_auth.filter(provider__in=SOCIAL_PROVIDERS.values()).values_list(
+            "provider", flat=True
+        )
     )
-    return_content["EMPTY_PROFILE"] = return_content["SOCIAL_AUTH"] and not (
-        request.user.profile.linkedin
-        or request.user.profile.github
-        or request.user.profile.portfolio
-        or request.user.profile.cellphone
+    state = {name: provider in providers for name, provider in SOCIAL_PROVIDERS.items()}
+    state["empty_profile"] = bool(providers) and not any(
+        any(fields)
+        for fields in Profile.objects.filter(user=user).values_list(
+            "linkedin", "github", "portfolio", "cellphone"
+        )
     )
+    cache.set(key, state, SOCIAL_LOGIN_STATE_TIMEOUT)
+    return state
+
+
+def invalidate_social_login_state(user_id):
+    cache.delete(SOCIAL_LOGIN_STATE_KEY.format(user_id))
 
-    return return_content
+
+def append_social_info_to_context(request):
+    """
+    Every value is lazy: nothing is queried (nor is the session loaded) unless
+    a template reads it, and the login state is cached per user.
+    """
+
+    def get_state(name):
+        def resolve():
+            user = get_request_user(request)
+            return user is not None and get_social_login_state(user)[name]
+
+        return resolve
+
+    def has_social_auth():
+        return get_state("github")() or get_state("linkedin")()
+
+    return {
+        "GITHUB_LOGIN": SimpleLazyObject(get_state("github")),
+        "LINKEDIN_LOGIN": SimpleLazyObject(get_state("linkedin")),
+        "SOCIAL_AUTH": SimpleLazyObject(has_social_auth),
+        "EMPTY_PROFILE": SimpleLazyObject(get_state("empty_profile")),
+    }
 
 
 def global_vars(request):
@@ -10,29 +10,67 @@ except:
     CURRENT_DOMAIN = "pyjobs.com.br"
 
 
-def get_email_with_template(template_name, context_specific, subject, to_emails):
-    context = {
+def get_site_context():
+    return {
         "dono_do_site": settings.WEBSITE_OWNER_NAME,
         "nome_do_site": settings.WEBSITE_NAME,
         "url_do_site": settings.WEBSITE_HOME_URL,
-        "vaga": context_specific.get("vaga", None),
-        "pessoa": context_specific.get("pessoa", None),
-        "mensagem": context_specific.get("mensagem", None),
-        "job_application": context_specific.get("job_application", None),
     }
 
-    if context["vaga"]:
-        context["vaga_close_url"] = context["vaga"].get_close_url()
-        context["vaga_listing_url"] = context["vaga"].get_listing_url()
 
-    plain_text = get_template(f"emails/{template_name}.txt")
-    html_text = get_template(f"emails/html/{template_name}.html")
+def get_email_templates(template_name):
+    return (
+        get_template(f"emails/{template_name}.txt"),
+        get_template(f"emails/html/{template_name}.html"),
+    )
 
-    text_content, html_content = plain_text.render(context), html_text.render(context)
 
-    msg = EmailMultiAlternatives(
-        subject, text_content, settings.WEBSITE_GENERAL_EMAIL, to_emails
+def get_emails_with_template(template_name, emails):
+    """
+    Bulk version of ``get_email_with_template``: ``emails`` is an iterable of
+    ``(context_specific, subject, to_emails)``. Both templates are loaded once,
+    the site variables are shared by every render and the close and listing
+    URLs (two SHA-512 each) are computed once per job.
+    """
+    plain_text, html_text = get_email_templates(template_name)
+    context = Context(
+        get_site_context(), autoescape=plain_text.backend.engine.autoescape
     )
-    msg.attach_alternative(html_content, "text/html")
+    job_urls = {}
+
+    messages = []
+    for context_specific, subject, to_emails in emails:
+        recipient_context = {
+            "vaga": context_specific.get("vaga", None),
+            "pessoa": context_specific.get("pessoa", None),
+            "mensagem": context_specific.get("mensagem", None),
+            "job_application": context_specific.get("job_application", None),
+        }
+
+        job = recipient_context["vaga"]
+        if job:
+            key = (job.pk, job.created_at, job.unique_slug)
+            if key not in job_urls:
+                job_urls[key] = {
+                    "vaga_close_url": job.get_close_url(),
+                    "vaga_listing_url": job.get_listing_url(),
+                }
+            recipient_context.update(job_urls[key])
+
+        with context.push(recipient_context):
+            text_content = plain_text.template.render(context)
+            html_content = html_text.template.render(context)
 
-    return msg
+        msg = EmailMultiAlternatives(
+            subject, text_content, settings.WEBSITE_GENERAL_EMAIL, to_emails
+        )
+        msg.attach_alternative(html_content, "text/html")
+        messages.append(msg)
+
+    return messages
+
+
+def get_email_with_template(template_name, context_specific, subject, to_emails):
+    return get_emails_with_template(
+        template_name, [(context_specific, subject, to_emails)]
+    )[0]
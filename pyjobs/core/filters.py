@@ -1,3 +1,5 @@
+from django.db.models import Count
+
 from pyjobs.core.models import (
     Job,
     STATE_CHOICES,
@@ -9,11 +11,11 @@ from pyjobs.core.models import (
 from django.utils.translation import gettext_lazy as _
 import django_filters
 
+FACET_FIELDS = ("country", "contract_form", "remote", "salary_range", "job_level")
+
 
 class JobFilter(django_filters.FilterSet):
-    title = django_filters.CharFilter(
-        field_name="title", lookup_expr="icontains", label=_("Título da Vaga")
-    )
+    title = django_filters.CharFilter(method="search", label=_("Título da Vaga"))
     country = django_filters.ModelChoiceFilter(
         queryset=Country.objects.all(), label=_("País")
     )
@@ -21,3 +23,96 @@ class JobFilter(django_filters.FilterSet):
     remote = django_filters.BooleanFilter(field_name="remote", label=_("Remoto?"))
     salary_range = django_filters.ChoiceFilter(choices=SALARY_RANGES[:-1])
     job_level = django_filters.ChoiceFilter(choices=JOB_LEVELS[:-1])
+
+    def search(self, queryset, name, value):
+        return queryset.search(value)
+
+    def get_facet_selection(self):
+        """
+        Returns the selected value of each facet, normalized to the values
+        stored in the database (ids, integers and booleans).
+        """
+        self.form.is_valid()
+        cleaned_data = getattr(self.form, "cleaned_data", {})
+
+        selection = {}
+        for name in FACET_FIELDS:
+            value = cleaned_data.get(name)
+            if value in (None, ""):
+                continue
+            if name == "country":
+                value = value.pk
+            elif name != "remote":
+                value = int(value)
+            selection[name] = value
+        return selection
+
+    def get_facet_options(self, name, country_names):
+        if name == "country":
+            return sorted(country_names.items(), key=lambda option: str(option[1]))
+        if name == "remote":
+            return [(True, _("Sim")), (False, _("Não"))]
+        return list(self.filters[name].extra["choices"])
+
+    def facet_rows(self):
+        queryset = self.queryset
+        title = getattr(self.form, "cleaned_data", {}).get("title")
+        if title:
+            # unranked, the rank would split the groups
+            queryset = queryset.search(title, rank=False)
+
+        return (
+            queryset.order_by()
+            .values(*FACET_FIELDS, "country__name")
+            .annotate(total=Count("pk"))
+        )
+
+    def facets(self, rows=None):
+        """
+        Counts the jobs behind every option of every facet with one grouped
+        query. Each facet is counted with the selection of every *other* facet
+        applied, so picking an option shows how the remaining ones narrow down.
+
+        ``rows`` can be given to count from already grouped rows (see
+        ``ActiveJobsSnapshot.facet_rows``) instead of querying the database.
+        """
+        selection = self.get_facet_selection()
+        if rows is None:
+            rows = self.facet_rows()
+
+        counts = {name: {} for name in FACET_FIELDS}
+        country_names = {}
+        for row in rows:
+            country_names[row["country"]] = row["country__name"]
+            for name in FACET_FIELDS:
+                if any(
+                    row[other] != value
+                    for other, value in selection.items()
+                    if other != name
+                ):
+                    continue
+                counts[name][row[name]] = counts[name].get(row[name], 0) + row["total"]
+
+        facets = []
+        for name in FACET_FIELDS:
+            options = []
+            for value, label in self.get_facet_options(name, country_names):
+                selected = selection.get(name) == value
+                count = counts[name].get(value, 0)
+                if count or selected:
+                    options.append(
+                        {
+                            "value": value,
+                            "label": label,
+                            "count": count,
+                            "selected": selected,
+                        }
+                    )
+            facets.append(
+                {
+                    "name": name,
+                    "label": self.form.fields[name].label,
+                    "options": options,
+                }
+            )
+        return facets
@@ -1,5 +1,6 @@
-import requests
+import logging
 
+import requests
 from django import forms
 from django.contrib.auth import authenticate
 from django.contrib.auth.forms import UserCreationForm
@@ -9,6 +10,7 @@ from django.forms import ModelForm, formset_factory, inlineformset_factory
 from datetime import datetime
 from django_select2.forms import Select2MultipleWidget, Select2Widget
 
+from pyjobs.core import http_client
 from pyjobs.core.models import Job, Profile, Skill, JobApplication, SkillProficiency
 from pyjobs.marketing.models import Contact
 from django.utils.translation import gettext_lazy as _
@@ -17,25 +19,64 @@ from captcha.fields import ReCaptchaField
 from captcha.widgets import ReCaptchaV2Checkbox
 
 
+RECAPTCHA_VERIFY_URL = "https://www.google.com/recaptcha/api/siteverify"
+# http_client.CircuitOpen is a requests.ConnectionError
+RECAPTCHA_ERRORS = (requests.RequestException, ValueError, KeyError)
+
+logger = logging.getLogger(__name__)
+
+
+def is_recaptcha_enabled():
+    return not settings.DEBUG or bool(settings.RECAPTCHA_SECRET_KEY)
+
+
+def get_recaptcha_data(g_recaptcha_response):
+    return {
+        "secret": settings.RECAPTCHA_SECRET_KEY,
+        "response": g_recaptcha_response,
+    }
+
+
+def verify_recaptcha(g_recaptcha_response):
+    if not g_recaptcha_response:
+        return False  # the widget was not even solved, no need to ask Google
+    try:
+        recaptcha_response = http_client.post(
+            RECAPTCHA_VERIFY_URL, data=get_recaptcha_data(g_recaptcha_response)
+        )
+        return recaptcha_response.json()["success"]
+    except RECAPTCHA_ERRORS:
+        logger.warning("Could not verify the reCAPTCHA", exc_info=True)
+        return False
+
+
+async def averify_recaptcha(g_recaptcha_response):
+    if not g_recaptcha_response:
+        return False  # the widget was not even solved, no need to ask Google
+    try:
+        recaptcha_response = await http_client.apost(
+            RECAPTCHA_VERIFY_URL, data=get_recaptcha_data(g_recaptcha_response)
+        )
+        return recaptcha_response.json()["success"]
+    except RECAPTCHA_ERRORS:
+        logger.warning("Could not verify the reCAPTCHA", exc_info=True)
+        return False
+
+
 class CustomModelForm(ModelForm):
     def __init__(self, *args, **kwargs):
         super(CustomModelForm, self).__init__(*args, **kwargs)
 
-    def is_valid(self, g_recaptcha_response):
-        if settings.DEBUG and not settings.RECAPTCHA_SECRET_KEY:
+    def is_valid(self, g_recaptcha_response, recaptcha_verified=None):
+        """``recaptcha_verified`` is the result of a verification already done
+        (by the async views), otherwise the reCAPTCHA is verified here."""
+        if not is_recaptcha_enabled():
             return super().is_valid()
 
-        data = {
-            "secret": settings.RECAPTCHA_SECRET_KEY,
-            "response": g_recaptcha_response,
-        }
-        recaptcha_response = requests.post(
-            "https://www.google.com/recaptcha/api/siteverify", data=data
-        )
-
-        result = recaptcha_response.json()
+        if recaptcha_verified is None:
+            recaptcha_verified = verify_recaptcha(g_recaptcha_response)
 
-        return result["success"] and super().is_valid()
+        return recaptcha_verified and super().is_valid()
 
 
 class JobForm(CustomModelForm):
@@ -0,0 +1,209 @@
+"""
+Shared client for the outbound HTTP calls (blog API, reCAPTCHA, newsletter
+providers, job boards).
+
+Each host gets its own ``requests.Session`` so connections are pooled and
+kept alive between calls, every request has a connect and a read timeout,
+idempotent requests are retried with jittered exponential backoff and a
+circuit breaker stops calling a host that keeps failing: after
+``BREAKER_THRESHOLD`` consecutive failures calls fail fast with
+``CircuitOpen`` for ``BREAKER_COOLDOWN`` seconds, then a single trial call
+decides whether the host is back. Latency and error counters are kept per
+host, see ``get_metrics``.
+
+The async views await ``aget``/``apost``: the same calls run in a pool of
+``ASYNC_WORKERS`` threads, so one event loop can wait on many upstream calls
+at once without blocking. This is not a non-blocking client. A process has at
+most ``ASYNC_WORKERS`` upstream calls in flight, and the other calls queue
+for a free thread, each bounded by its own timeout. Raise ``ASYNC_WORKERS``
+(and with it ``POOL_SIZE``) if more concurrent calls are needed.
+"""
+import asyncio
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+RETRY_STATUS = (502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+ASYNC_WORKERS = 32
+POOL_SIZE = ASYNC_WORKERS  # so concurrent async calls reuse their connections
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30
+
+
+class CircuitOpen(requests.ConnectionError):
+    pass
+
+
+def get_retry_delay(attempt):
+    """Full jitter: anywhere between 0 and the exponential backoff."""
+    return random.uniform(0, RETRY_BACKOFF * 2**attempt)
+
+
+class HostMetrics:
+    def __init__(self):
+        self.requests = self.errors = self.retries = self.rejected = 0
+        self.total_latency = self.max_latency = 0.0
+
+    def record(self, latency, failed):
+        self.requests += 1
+        self.errors += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "average_latency": (
+                self.total_latency / self.requests if self.requests else 0.0
+            ),
+            "max_latency": self.max_latency,
+        }
+
+
+class HostClient:
+    def __init__(self, host):
+        self.host = host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.metrics = HostMetrics()
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    def allow_request(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if monotonic() - self.opened_at < BREAKER_COOLDOWN or self.trial_running:
+                self.metrics.rejected += 1
+                return False
+            self.trial_running = True  # half open: let one call through
+            return True
+
+    def record(self, latency, failed):
+        with self.lock:
+            self.metrics.record(latency, failed)
+            self.trial_running = False
+            if not failed:
+                self.failures, self.opened_at = 0, None
+                return
+
+            self.failures += 1
+            if self.failures >= BREAKER_THRESHOLD or self.opened_at is not None:
+                if self.opened_at is None:
+                    logger.warning("Circuit opened for %s", self.host)
+                self.opened_at = monotonic()
+
+    def send(self, method, url, timeout, **kwargs):
+        if not self.allow_request():
+            raise CircuitOpen(f"Too many failures calling {self.host}")
+
+        start = monotonic()
+        try:
+            response = self.session.request(method, url, timeout=timeout, **kwargs)
+        except requests.RequestException:
+            self.record(monotonic() - start, failed=True)
+            raise
+        self.record(monotonic() - start, failed=response.status_code >= 500)
+        return response
+
+    def request(self, method, url, timeout=DEFAULT_TIMEOUT, retries=None, **kwargs):
+        """Like ``requests.request``. ``retries`` defaults to
+        ``DEFAULT_RETRIES`` for idempotent methods and to none otherwise."""
+        if retries is None:
+            retries = DEFAULT_RETRIES if method.upper() in IDEMPOTENT_METHODS else 0
+
+        for attempt in range(retries + 1):
+            last_attempt = attempt == retries
+            try:
+                response = self.send(method, url, timeout, **kwargs)
+            except CircuitOpen:
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or response.status_code not in RETRY_STATUS:
+                    return response
+
+            with self.lock:
+                self.metrics.retries += 1
+            sleep(get_retry_delay(attempt))
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(url):
+    parts = urlsplit(url)
+    host = f"{parts.scheme}://{parts.netloc}"
+    with _clients_lock:
+        if host not in _clients:
+            _clients[host] = HostClient(host)
+        return _clients[host]
+
+
+def request(method, url, **kwargs):
+    return get_client(url).request(method, url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    with _clients_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                ASYNC_WORKERS, thread_name_prefix="http_client"
+            )
+        return _executor
+
+
+async def arequest(method, url, **kwargs):
+    loop = asyncio.get_running_loop()
+    call = partial(request, method, url, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+async def aget(url, **kwargs):
+    return await arequest("GET", url, **kwargs)
+
+
+async def apost(url, **kwargs):
+    return await arequest("POST", url, **kwargs)
+
+
+def get_metrics():
+    """Returns the counters of every host called by this process."""
+    with _clients_lock:
+        clients = list(_clients.values())
+    return {client.host: client.metrics.as_dict() for client in clients}
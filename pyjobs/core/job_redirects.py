@@ -0,0 +1,130 @@
+"""
+Redirects from the job URLs built with a primary key (``/job/42/``, still
+linked by the previous/next buttons) to the ones built with the job's slug.
+
+Instead of storing one ``Redirect`` row per job and URL, the fallback
+middleware applies a rule on 404s: if the URL is one of ``PK_URL_NAMES`` and
+its ``unique_slug`` is a number, it redirects to the same URL built with the
+current slug of that job. The slug is found with a primary key lookup and
+kept in the shared cache until the job is saved or deleted.
+"""
+from django.core.cache import cache
+from django.urls import Resolver404, resolve, reverse
+
+PK_URL_NAMES = (
+    "job_view",
+    "thumbnail_view",
+    "applied_users_details",
+    "get_job_applications",
+    "job_application_challenge_submission",
+)
+JOB_SLUG_KEY = "job_slug:{}"
+JOB_SLUG_TIMEOUT = 60 * 60 * 24
+
+
+def get_job_slug(pk):
+    """Returns the ``unique_slug`` of the job, ``None`` if it does not exist."""
+    from pyjobs.core.models import Job
+
+    key = JOB_SLUG_KEY.format(pk)
+    slug = cache.get(key)
+    if slug is None:
+        slug = (
+            Job.objects.filter(pk=pk).values_list("unique_slug", flat=True).first()
+            or ""  # cached too, bots probe job ids that never existed
+        )
+        cache.set(key, slug, JOB_SLUG_TIMEOUT)
+    return slug or None
+
+
+def invalidate_job_slug(pk):
+    cache.delete(JOB_SLUG_KEY.format(pk))
+
+
+def get_pk(resolver_match):
+    """Returns the job pk of a URL addressing a job by pk, otherwise ``None``."""
+    if resolver_match.url_name not in PK_URL_NAMES:
+        return None
+    pk = resolver_match.kwargs.get("unique_slug", "")
+    return int(pk) if pk.isdigit() else None
+
+
+def get_slug_path(resolver_match, slug):
+    kwargs = {**resolver_match.kwargs, "unique_slug": slug}
+    return reverse(resolver_match.view_name, kwargs=kwargs)
+
+
+def get_job_redirect(request):
+    """Returns the path ``request`` should be redirected to, if it addressed
+    an existing job by pk."""
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return None
+
+    pk = get_pk(resolver_match)
+    if pk is None:
+        return None
+
+    slug = get_job_slug(pk)
+    if slug is None or slug == str(pk):
+        return None
+    return get_slug_path(resolver_match, slug)
+
+
+def is_redundant(resolver_match, new_path, slugs):
+    """Whether the rule answers the same as a ``Redirect`` row of the job URL
+    ``resolver_match``. ``slugs`` maps the pks of the existing jobs to their
+    slugs, the rows of the jobs that are gone point to a 404 anyway."""
+    pk = get_pk(resolver_match)
+    if pk not in slugs:
+        return True
+    slug = slugs[pk]
+    return bool(slug) and new_path == get_slug_path(resolver_match, slug)
+
+
+def prune_job_redirects(batch_size=1000):
+    """
+    Deletes the ``Redirect`` rows made redundant by the rule, ``batch_size``
+    rows at a time. Rows pointing elsewhere are kept. Yields the number of
+    rows checked and deleted after each batch.
+    """
+    from django.contrib.redirects.models import Redirect
+
+    from pyjobs.core.models import Job
+
+    last_pk, checked, deleted = 0, 0, 0
+    while True:
+        rows = list(
+            Redirect.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", "old_path", "new_path")[:batch_size]
+        )
+        if not rows:
+            return
+
+        last_pk = rows[-1][0]
+        candidates = []
+        for pk, old_path, new_path in rows:
+            try:
+                resolver_match = resolve(old_path)
+            except Resolver404:
+                continue
+            if get_pk(resolver_match) is not None:
+                candidates.append((pk, resolver_match, new_path))
+
+        slugs = dict(
+            Job.objects.filter(
+                pk__in={get_pk(resolver_match) for _, resolver_match, _ in candidates}
+            ).values_list("pk", "unique_slug")
+        )
+        redundant = [
+            pk
+            for pk, resolver_match, new_path in candidates
+            if is_redundant(resolver_match, new_path, slugs)
+        ]
+        if redundant:
+            Redirect.objects.filter(pk__in=redundant).delete()
+
+        checked += len(rows)
+        deleted += len(redundant)
+        yield checked, deleted
@@ -0,0 +1,46 @@
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from pyjobs.assessment.models import Assessment
+from pyjobs.core.models import Job
+from pyjobs.core.thumbnails import prerender_thumbnails
+
+
+def get_thumbnail_tasks(all_jobs=False):
+    jobs = Job.objects.public() if all_jobs else Job.get_active_jobs()
+    titles = [("job", title) for title in jobs.values_list("title", flat=True)]
+    titles += [
+        ("quiz", name)
+        for name in Assessment.objects.filter(public=True).values_list(
+            "name", flat=True
+        )
+    ]
+    return [
+        (kind, title, language)
+        for kind, title in dict.fromkeys(titles)
+        for language, _name in settings.LANGUAGES
+    ]
+
+
+class Command(BaseCommand):
+    help = "Renders the thumbnails of the active jobs and public quizzes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all", action="store_true", help="Every public job, not only the active"
+        )
+        parser.add_argument("--processes", type=int, default=None)
+
+    def handle(self, *args, **options):
+        tasks = get_thumbnail_tasks(options["all"])
+
+        start = perf_counter()
+        rendered = sum(prerender_thumbnails(tasks, options["processes"]))
+        elapsed = perf_counter() - start
+
+        self.stdout.write(
+            f"{rendered} thumbnails rendered, {len(tasks) - rendered} already "
+            f"cached, in {elapsed:.1f}s ({rendered / elapsed:.1f} renders/s)"
+        )
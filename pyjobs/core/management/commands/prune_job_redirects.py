@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from pyjobs.core.job_redirects import prune_job_redirects
+
+
+class Command(BaseCommand):
+    help = "Deletes the Redirect rows from job pk URLs answered by the redirect rule"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        for checked, deleted in prune_job_redirects(options["batch_size"]):
+            self.stdout.write(f"{checked} redirects checked, {deleted} deleted")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from pyjobs.core.similarity import rebuild_similar_jobs
+
+
+class Command(BaseCommand):
+    help = "Recomputes the similar jobs of every job"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        for processed in rebuild_similar_jobs(options["batch_size"]):
+            self.stdout.write(f"{processed} jobs processed")
@@ -4,51 +4,65 @@ from datetime import datetime
 from django.core.management.base import BaseCommand
 from django.db import IntegrityError
 from django.template.loader import get_template
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template import Context
 
 from pyjobs.core.models import Job, JobApplication
-from pyjobs.core.email_utils import get_email_with_template
+from pyjobs.core.email_utils import get_emails_with_template
 from django.conf import settings
 from datetime import timedelta
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=100, help="Reminders sent at a time"
+        )
+
     def handle(self, *args, **options):
         job_qs = Job.objects.filter(is_challenging=True)
 
         if len(job_qs) == 0:
             return "False"
 
-        for job in job_qs:
-            job_applications = JobApplication.objects.filter(
-                job=job,
+        job_applications = list(
+            JobApplication.objects.filter(
+                job__in=job_qs,
                 challenge_response_at=None,
                 email_sent_at__gte=datetime.now() - timedelta(days=5),
                 email_sent_at__lte=datetime.now() + timedelta(days=3),
                 challenge_resent=False,
-            )
-
-            for job_app in job_applications:
-                person_email_context = {
-                    "vaga": job,
-                    "pessoa": job_app.user.profile,
-                    "mensagem": job_app,
-                }
-                template_person = "job_interest_challenge"
-                person_email_subject = (
-                    "Reenviando: Teste Técnico da empresa: {}!".format(job.company_name)
-                )
+            ).select_related("job", "user__profile")
+        )
+
+        batch_size = options["batch_size"]
+        with get_connection() as connection:
+            for start in range(0, len(job_applications), batch_size):
+                batch = job_applications[start : start + batch_size]
+                connection.send_messages(self.get_messages(batch))
+                # only marked once sent, a failed batch is retried next run
+                JobApplication.objects.filter(
+                    pk__in=[job_app.pk for job_app in batch]
+                ).update(challenge_resent=True)
 
-                job_app.challenge_resent = True
-                job_app.save()
+        return "True"
 
-                msg_email_person = get_email_with_template(
-                    template_person,
-                    person_email_context,
-                    person_email_subject,
+    def get_messages(self, job_applications):
+        template_person = "job_interest_challenge"
+        return get_emails_with_template(
+            template_person,
+            (
+                (
+                    {
+                        "vaga": job_app.job,
+                        "pessoa": job_app.user.profile,
+                        "mensagem": job_app,
+                    },
+                    "Reenviando: Teste Técnico da empresa: {}!".format(
+                        job_app.job.company_name
+                    ),
                     (job_app.user.email,),
                 )
-                msg_email_person.send()
-
-        return "True"
+                for job_app in job_applications
+            ),
+        )
@@ -8,7 +8,8 @@ from django.core.mail import EmailMultiAlternatives
 from django.template import Context
 
 from pyjobs.core.models import Job
-from pyjobs.marketing.models import MailingList
+from pyjobs.marketing.mailer import MAILING_CHUNK_SIZE, MAILING_WORKERS, BatchMailer
+from pyjobs.marketing.models import MailingList, MailingRun
 from pyjobs.marketing.utils import post_telegram_channel
 from django.conf import settings
 
@@ -28,22 +29,29 @@ def check_today_is_the_right_day():
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=MAILING_CHUNK_SIZE,
+            help="Messages sent per connection round",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=MAILING_WORKERS,
+            help="Concurrent connections to the email backend",
+        )
+
     def handle(self, *args, **options):
         if not check_today_is_the_right_day():
             return "False"
 
-        emails_mailing_lists = [mailing.email for mailing in MailingList.objects.all()]
+        mailing_lists = list(MailingList.objects.order_by("pk"))
 
-        if len(emails_mailing_lists) == 0:
+        if len(mailing_lists) == 0:
             return "False"
 
-        emails_mailing_replies = [
-            format_owner_email(email) for email in emails_mailing_lists
-        ]
-
-        to_emails = emails_mailing_replies
-        from_emails = emails_mailing_lists
-
         jobs = list(Job.get_premium_jobs())
 
         missing_jobs = 10 - len(jobs)
@@ -66,11 +74,25 @@ class Command(BaseCommand):
 
         text_content = plain_text.render(context)
 
-        for email_tup in zip(to_emails, from_emails):
-            msg = EmailMultiAlternatives(
-                subject, text_content, email_tup[0], [email_tup[1]]
+        run, _created = MailingRun.objects.get_or_create(
+            mailing="weekly_mailing", edition=datetime.today().date()
+        )
+        if run.finished_at:
+            return "True"
+
+        # sent from the owner's "+list" alias to the list itself
+        def build_message(mailing_list):
+            return EmailMultiAlternatives(
+                subject,
+                text_content,
+                format_owner_email(mailing_list.email),
+                [mailing_list.email],
             )
 
-            msg.send()
+        mailer = BatchMailer(options["chunk_size"], options["workers"])
+        sent, elapsed = mailer.send(run, mailing_lists, build_message)
+        self.stdout.write(
+            f"{sent} messages in {elapsed:.1f}s ({sent / max(elapsed, 1e-6):.1f} msgs/s)"
+        )
 
         return "True"
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from pyjobs.marketing.newsletter import (
+    get_newsletter_provider,
+    sync_newsletter_subscriptions,
+)
+
+
+class Command(BaseCommand):
+    help = "Sends the pending newsletter (un)subscriptions to MailerLite or Mailchimp"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Subscriptions per request, capped by the provider's limit",
+        )
+
+    def handle(self, *args, **options):
+        sync, _batch_size = get_newsletter_provider()
+        if sync is None:
+            self.stdout.write("No newsletter provider configured")
+            return
+
+        total_synced = total_failed = 0
+        for synced, failed in sync_newsletter_subscriptions(options["batch_size"]):
+            total_synced += synced
+            total_failed += failed
+        self.stdout.write(f"{total_synced} synced, {total_failed} to retry")
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 from django.db import models
 
+from pyjobs.core.search import search_jobs
+
 
 class PublicQuerySet(models.QuerySet):
     def public(self):
@@ -23,17 +25,11 @@ class PublicQuerySet(models.QuerySet):
             created_at__lte=datetime.today(),
         )
 
-    def search(self, term):
+    def search(self, term, rank=True):
         if not term:
             return self
 
-        params = (
-            models.Q(title__icontains=term)
-            | models.Q(workplace__icontains=term)
-            | models.Q(description__icontains=term)
-            | models.Q(requirements__icontains=term)
-        )
-        return self.filter(params)
+        return search_jobs(self, term, rank)
 
 
 class ProfilingQuerySet(models.QuerySet):
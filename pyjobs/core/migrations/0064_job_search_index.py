@@ -0,0 +1,61 @@
+from django.db import migrations
+
+FIELDS = ("title", "workplace", "description", "requirements")
+
+POSTGRES_VECTOR_SQL = " || ".join(
+    f"setweight(to_tsvector('simple', coalesce({field}, '')), '{weight}')"
+    for field, weight in zip(FIELDS, ("A", "B", "C", "C"))
+)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute("ALTER TABLE core_job ADD COLUMN search_vector tsvector")
+        schema_editor.execute(
+            "CREATE INDEX core_job_search_vector_gin ON core_job "
+            "USING gin(search_vector)"
+        )
+        schema_editor.execute(
+            f"UPDATE core_job SET search_vector = {POSTGRES_VECTOR_SQL}"
+        )
+
+    elif vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            if "ENABLE_FTS5" not in {row[0] for row in cursor.fetchall()}:
+                return
+
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE core_job_fts USING fts5("
+            f"{', '.join(FIELDS)}, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO core_job_fts (rowid, {', '.join(FIELDS)}) "
+            f"SELECT id, {', '.join(FIELDS)} FROM core_job"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS core_job_search_vector_gin")
+        schema_editor.execute(
+            "ALTER TABLE core_job DROP COLUMN IF EXISTS search_vector"
+        )
+
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS core_job_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0063_auto_20210511_1916"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 3.2.2 on 2026-10-18 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0064_job_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SimilarJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField(verbose_name="Similaridade")),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="similarities",
+                        to="core.job",
+                    ),
+                ),
+                (
+                    "similar",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="similar_to",
+                        to="core.job",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-score",),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="similarjob",
+            index=models.Index(
+                fields=["job", "-score"], name="core_simila_job_id_dcae2f_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="similarjob",
+            unique_together={("job", "similar")},
+        ),
+    ]
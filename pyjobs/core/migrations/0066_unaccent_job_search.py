@@ -0,0 +1,48 @@
+from django.db import migrations
+
+FIELDS = ("title", "workplace", "description", "requirements")
+
+
+def get_vector_sql(config):
+    return " || ".join(
+        f"setweight(to_tsvector('{config}', coalesce({field}, '')), '{weight}')"
+        for field, weight in zip(FIELDS, ("A", "B", "C", "C"))
+    )
+
+
+def create_unaccent_config(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    schema_editor.execute(
+        "CREATE TEXT SEARCH CONFIGURATION pyjobs_search (COPY = simple)"
+    )
+    schema_editor.execute(
+        "ALTER TEXT SEARCH CONFIGURATION pyjobs_search "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple"
+    )
+    schema_editor.execute(
+        f"UPDATE core_job SET search_vector = {get_vector_sql('pyjobs_search')}"
+    )
+
+
+def drop_unaccent_config(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        f"UPDATE core_job SET search_vector = {get_vector_sql('simple')}"
+    )
+    schema_editor.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS pyjobs_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0065_similarjob"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_unaccent_config, drop_unaccent_config),
+    ]
@@ -19,6 +19,7 @@ from pyjobs.settings import (
     FEEDBACK_TYPE,
 )
 from pyjobs.core.managers import PublicQuerySet, ProfilingQuerySet
+from pyjobs.core.search import update_job_search_index
 from django.utils.translation import gettext_lazy as _
 
 
@@ -202,6 +203,9 @@ class Job(models.Model):
     def get_index_display_jobs():
         return Job.objects.public().created_in_the_last(30)[:9]
 
+    def get_active_jobs(term=None):
+        return Job.objects.public().created_in_the_last(30).search(term)
+
     def get_publicly_available_jobs(term=None):
         return Job.objects.not_premium().created_in_the_last(30).search(term)
 
@@ -275,6 +279,23 @@ class Job(models.Model):
             self.unique_slug = slugify(f"{title_and_company} {uuid_str[:8]}")
 
         super(Job, self).save(*args, **kwargs)
+        update_job_search_index(self)
+
+
+class SimilarJob(models.Model):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="similarities")
+    similar = models.ForeignKey(
+        Job, on_delete=models.CASCADE, related_name="similar_to"
+    )
+    score = models.FloatField(_("Similaridade"))
+
+    class Meta:
+        unique_together = ("job", "similar")
+        ordering = ("-score",)
+        indexes = [models.Index(fields=["job", "-score"])]
+
+    def __str__(self):
+        return f"{self.job_id} ~ {self.similar_id} ({self.score:.2f})"
 
 
 class JobApplication(models.Model):
@@ -0,0 +1,102 @@
+"""
+Full page cache for the public pages seen by anonymous visitors.
+
+Entries live in the configured cache backend, so they are shared by every
+gunicorn worker. Instead of deleting keys on writes, each cached view depends
+on the *generation* of some models (a counter bumped by their ``post_save``
+and ``post_delete`` signals) and the generations are part of the cache key:
+once a ``Job`` changes, every key built from the old generation is simply
+never read again and expires on its own.
+
+The CSRF token rendered in the page (the language selector form) is swapped
+by a placeholder before storing and by the visitor's own token when serving.
+"""
+import re
+from functools import wraps
+from hashlib import md5
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.http import urlencode
+
+GENERATION_KEY = "page_cache_generation:{}"
+CSRF_PLACEHOLDER = b"__page_cache_csrf_token__"
+CSRF_INPUT_REGEX = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+
+
+def get_generation_key(model):
+    return GENERATION_KEY.format(model._meta.label_lower)
+
+
+def get_generations(models):
+    keys = [get_generation_key(model) for model in models]
+    generations = cache.get_many(keys)
+    return [generations.get(key, 0) for key in keys]
+
+
+def bump_generation(model):
+    key = get_generation_key(model)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key)
+
+
+def is_cacheable(request):
+    if request.method not in ("GET", "HEAD") or not hasattr(request, "user"):
+        return False
+    if request.user.is_authenticated:
+        return False
+    # flash messages are rendered once, the page must not outlive them
+    return not len(get_messages(request))
+
+
+def get_page_cache_key(request, models):
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    url = md5(f"{request.path}?{query}".encode()).hexdigest()
+    generations = ".".join(str(generation) for generation in get_generations(models))
+    return f"page_cache:v2:{getattr(request, 'LANGUAGE_CODE', '')}:{generations}:{url}"
+
+
+def cache_anonymous_page(*models):
+    """
+    Caches the responses of the decorated view for anonymous ``GET``/``HEAD``
+    requests until ``PAGE_CACHE_TIMEOUT`` or a change to any of ``models``.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not is_cacheable(request):
+                return view(request, *args, **kwargs)
+
+            key = get_page_cache_key(request, models)
+            cached = cache.get(key)
+            if cached is not None:
+                content, headers = cached
+                token = get_token(request).encode()
+                return HttpResponse(
+                    content.replace(CSRF_PLACEHOLDER, token), headers=headers
+                )
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                content = CSRF_INPUT_REGEX.sub(
+                    rb"\1" + CSRF_PLACEHOLDER + rb"\2", response.content
+                )
+                # the length changes with the token swapped in
+                headers = {
+                    header: value
+                    for header, value in response.items()
+                    if header.lower() != "content-length"
+                }
+                cache.set(key, (content, headers), settings.PAGE_CACHE_TIMEOUT)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,116 @@
+"""
+Per-process index of the ``Redirect`` table for ``RedirectFallbackMiddleware``.
+
+Most 404s are bots probing paths that never existed, so the fallback must not
+cost database queries. Each process keeps every redirect in a dict keyed by
+``(site_id, old_path)``: hits and misses are answered with one hash lookup.
+
+Like the active jobs snapshot, ``Redirect`` signals patch the local index and
+bump a version counter kept in the shared cache, so the other processes
+rebuild theirs on their next 404. Changes that skip the signals (``update``,
+``bulk_create``) are picked up after ``REDIRECT_INDEX_TTL`` seconds.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+REDIRECT_INDEX_VERSION_KEY = "redirect_index_version"
+
+
+def get_redirect_index_version():
+    return cache.get(REDIRECT_INDEX_VERSION_KEY, 0)
+
+
+def bump_redirect_index_version():
+    try:
+        return cache.incr(REDIRECT_INDEX_VERSION_KEY)
+    except ValueError:
+        cache.add(REDIRECT_INDEX_VERSION_KEY, 0, timeout=None)
+        return cache.incr(REDIRECT_INDEX_VERSION_KEY)
+
+
+class RedirectIndex:
+    def __init__(self, version=0):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.new_paths = {}  # (site_id, old_path) -> new_path
+        self.keys = {}  # pk -> (site_id, old_path), to follow edits
+
+    @classmethod
+    def build(cls, version=0):
+        from django.contrib.redirects.models import Redirect
+
+        index = cls(version)
+        rows = Redirect.objects.values_list("pk", "site_id", "old_path", "new_path")
+        for pk, site_id, old_path, new_path in rows.iterator():
+            index._set(pk, site_id, old_path, new_path)
+        return index
+
+    def __len__(self):
+        return len(self.new_paths)
+
+    def _set(self, pk, site_id, old_path, new_path):
+        key = (site_id, old_path)
+        self.keys[pk] = key
+        self.new_paths[key] = new_path
+
+    def get(self, site_id, old_path):
+        """Returns the ``new_path`` of the redirect (empty if the page is
+        gone) or ``None`` if there is no redirect for ``old_path``."""
+        return self.new_paths.get((site_id, old_path))
+
+    def remove(self, pk):
+        key = self.keys.pop(pk, None)
+        if key is not None:
+            del self.new_paths[key]
+
+    def upsert(self, redirect):
+        self.remove(redirect.pk)
+        self._set(redirect.pk, redirect.site_id, redirect.old_path, redirect.new_path)
+
+
+_index = None
+_index_lock = threading.RLock()
+
+
+def get_redirect_index():
+    global _index
+
+    version = get_redirect_index_version()
+    with _index_lock:
+        stale = (
+            _index is None
+            or _index.version != version
+            or time.monotonic() - _index.built_at > settings.REDIRECT_INDEX_TTL
+        )
+        if stale:
+            _index = RedirectIndex.build(version)
+        return _index
+
+
+def patch_redirect_index(patch):
+    """
+    Applies ``patch(index)`` to the local index and bumps the shared version
+    once the current transaction commits, so no process rebuilds its index
+    from rows that are not visible yet and a rollback patches nothing. The
+    local copy is only patched if it had seen every previous change,
+    otherwise it is dropped and rebuilt on the next 404.
+    """
+    transaction.on_commit(lambda: _patch_redirect_index(patch))
+
+
+def _patch_redirect_index(patch):
+    global _index
+
+    version = bump_redirect_index_version()
+    with _index_lock:
+        if _index is None:
+            return
+        if _index.version != version - 1:
+            _index = None
+            return
+        patch(_index)
+        _index.version = version
@@ -0,0 +1,186 @@
+"""
+Full-text search for jobs.
+
+PostgreSQL keeps a weighted ``tsvector`` in ``core_job.search_vector`` (GIN
+indexed) and SQLite keeps a FTS5 shadow table named ``core_job_fts``. Both are
+created by the ``0064_job_search_index`` migration and kept current by
+``Job.save``. Any other database falls back to the old ``icontains`` search.
+
+Accents are ignored on both backends: the FTS5 table is tokenized with
+``remove_diacritics`` and PostgreSQL uses the ``pyjobs_search`` configuration
+(``simple`` behind ``unaccent``, see ``0066_unaccent_job_search``). The search
+words are stripped of their accents too.
+"""
+import re
+import unicodedata
+
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.backends.signals import connection_created
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+SEARCH_FIELDS = ("title", "workplace", "description", "requirements")
+SEARCH_FTS_TABLE = "core_job_fts"
+SEARCH_MAX_WORDS = 8
+POSTGRES_SEARCH_CONFIG = "pyjobs_search"
+
+# title > workplace > description/requirements, same order on both backends
+POSTGRES_WEIGHTS = ("A", "B", "C", "C")
+SQLITE_WEIGHTS = (10.0, 5.0, 1.0, 1.0)
+
+WORD_REGEX = re.compile(r"\w+", re.UNICODE)
+
+POSTGRES_VECTOR_SQL = " || ".join(
+    f"setweight(to_tsvector('{POSTGRES_SEARCH_CONFIG}', coalesce({field}, '')), "
+    f"'{weight}')"
+    for field, weight in zip(SEARCH_FIELDS, POSTGRES_WEIGHTS)
+)
+
+
+def remove_accents(text):
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def get_search_words(term):
+    return WORD_REGEX.findall(remove_accents(term.lower()))[:SEARCH_MAX_WORDS]
+
+
+_fts_tables = {}  # database alias -> whether its FTS5 table exists
+
+
+@receiver(connection_created)
+@receiver(post_migrate)
+def forget_fts_tables(sender, connection=None, **kwargs):
+    """Checks again for the FTS5 table on new connections and migrations."""
+    if connection is None:
+        _fts_tables.clear()
+    else:
+        _fts_tables.pop(connection.alias, None)
+
+
+def _sqlite_fts_table_exists(connection):
+    if connection.alias not in _fts_tables:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [SEARCH_FTS_TABLE],
+            )
+            _fts_tables[connection.alias] = cursor.fetchone() is not None
+    return _fts_tables[connection.alias]
+
+
+def get_search_backend(using=DEFAULT_DB_ALIAS):
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        return "postgresql"
+
+    if connection.vendor == "sqlite" and _sqlite_fts_table_exists(connection):
+        return "sqlite"
+
+    return None
+
+
+def icontains_search(queryset, term):
+    params = (
+        models.Q(title__icontains=term)
+        | models.Q(workplace__icontains=term)
+        | models.Q(description__icontains=term)
+        | models.Q(requirements__icontains=term)
+    )
+    return queryset.filter(params)
+
+
+def _postgres_search(queryset, words, rank=True):
+    table = queryset.model._meta.db_table
+    tsquery = " & ".join(f"{word}:*" for word in words)
+
+    matches = RawSQL(
+        f"SELECT id FROM {table} "
+        f"WHERE search_vector @@ to_tsquery('{POSTGRES_SEARCH_CONFIG}', %s)",
+        (tsquery,),
+    )
+    queryset = queryset.filter(pk__in=matches)
+    if not rank:
+        return queryset
+
+    rank = RawSQL(
+        f"ts_rank({table}.search_vector, "
+        f"to_tsquery('{POSTGRES_SEARCH_CONFIG}', %s))",
+        (tsquery,),
+    )
+    return queryset.annotate(search_rank=rank)
+
+
+def _sqlite_search(queryset, words, rank=True):
+    table = queryset.model._meta.db_table
+    fts_query = " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+    weights = ", ".join(str(weight) for weight in SQLITE_WEIGHTS)
+
+    matches = RawSQL(
+        f"SELECT rowid FROM {SEARCH_FTS_TABLE} WHERE {SEARCH_FTS_TABLE} MATCH %s",
+        (fts_query,),
+    )
+    queryset = queryset.filter(pk__in=matches)
+    if not rank:
+        return queryset
+
+    # bm25() is "lower is better", negate it so both backends sort the same way
+    rank = RawSQL(
+        f"SELECT -bm25({SEARCH_FTS_TABLE}, {weights}) FROM {SEARCH_FTS_TABLE} "
+        f"WHERE {SEARCH_FTS_TABLE} MATCH %s AND {SEARCH_FTS_TABLE}.rowid = {table}.id",
+        (fts_query,),
+    )
+    return queryset.annotate(search_rank=rank)
+
+
+def search_jobs(queryset, term, rank=True):
+    """Filters ``queryset`` by ``term`` and orders it by relevance, or just
+    filters it without ``rank`` (e.g. to group the matches)."""
+    backend = get_search_backend(queryset.db)
+    words = get_search_words(term)
+
+    if backend is None or not words:
+        return icontains_search(queryset, term)
+
+    if backend == "postgresql":
+        queryset = _postgres_search(queryset, words, rank)
+    else:
+        queryset = _sqlite_search(queryset, words, rank)
+
+    if not rank:
+        return queryset
+    return queryset.order_by("-search_rank", "-created_at")
+
+
+def update_job_search_index(job):
+    using = job._state.db or DEFAULT_DB_ALIAS
+    backend = get_search_backend(using)
+    if backend is None or not job.pk:
+        return
+
+    table = job._meta.db_table
+    with connections[using].cursor() as cursor:
+        if backend == "postgresql":
+            cursor.execute(
+                f"UPDATE {table} SET search_vector = {POSTGRES_VECTOR_SQL} "
+                "WHERE id = %s",
+                [job.pk],
+            )
+            return
+
+        cursor.execute(f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid = %s", [job.pk])
+        cursor.execute(
+            f"INSERT INTO {SEARCH_FTS_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [job.pk] + [getattr(job, field) or "" for field in SEARCH_FIELDS],
+        )
+
+
+def remove_job_from_search_index(job_pk, using=DEFAULT_DB_ALIAS):
+    if get_search_backend(using) != "sqlite":
+        return
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid = %s", [job_pk])
@@ -0,0 +1,201 @@
+"""
+Precomputed "similar jobs" shown on the job details page.
+
+Two jobs are as similar as the Jaccard index of their skill sets. For every
+job ``SimilarJob`` keeps the ``SIMILAR_JOBS_LIMIT`` most similar jobs created
+in the last ``SIMILAR_JOBS_DAYS`` days, so ``job_view`` reads them with one
+indexed lookup. Rows are refreshed by the task queue when a job's skills
+change (which is also how new jobs get their skills) and
+``rebuild_similar_jobs`` recomputes the whole table.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+from heapq import nlargest
+
+from django.db import transaction
+from django.db.models import Count, Min
+
+from pyjobs.tasks.queue import task
+
+SIMILAR_JOBS_LIMIT = 10
+SIMILAR_JOBS_DAYS = 30
+
+
+def jaccard(skills, other_skills):
+    if not skills or not other_skills:
+        return 0.0
+    return len(skills & other_skills) / len(skills | other_skills)
+
+
+def get_window_start():
+    return datetime.now() - timedelta(days=SIMILAR_JOBS_DAYS)
+
+
+def get_job_skills(**filters):
+    """Returns ``{job_id: frozenset(skill_ids)}`` for the through-table rows
+    matching ``filters``."""
+    from pyjobs.core.models import Job
+
+    skills = defaultdict(set)
+    rows = Job.skills.through.objects.filter(**filters).values_list(
+        "job_id", "skill_id"
+    )
+    for job_id, skill_id in rows.iterator():
+        skills[job_id].add(skill_id)
+    return {job_id: frozenset(skill_ids) for job_id, skill_ids in skills.items()}
+
+
+def rank_similar_jobs(job_id, skills, candidates, limit=None):
+    """Returns the ``limit`` (``SIMILAR_JOBS_LIMIT``) best ``(score,
+    candidate_id)`` pairs."""
+    limit = limit or SIMILAR_JOBS_LIMIT
+    scores = (
+        (jaccard(skills, candidate_skills), candidate_id)
+        for candidate_id, candidate_skills in candidates.items()
+        if candidate_id != job_id
+    )
+    return nlargest(limit, (pair for pair in scores if pair[0] > 0))
+
+
+def get_jobs_sharing_skills(skills, **filters):
+    from pyjobs.core.models import Job
+
+    sharing = Job.skills.through.objects.filter(skill_id__in=skills, **filters)
+    return get_job_skills(job_id__in=sharing.values("job_id"))
+
+
+def offer_similar_job(job, skills):
+    """Adds ``job`` to the similar jobs of every recent job sharing a skill
+    with it, wherever it ranks among their ``SIMILAR_JOBS_LIMIT`` best. Rows
+    pointing to expired jobs are dropped first, they are not shown anymore
+    and must not keep the new job out."""
+    from pyjobs.core.models import SimilarJob
+
+    window_start = get_window_start()
+    related = get_jobs_sharing_skills(skills, job__created_at__gt=window_start)
+    related.pop(job.pk, None)
+    SimilarJob.objects.filter(
+        job_id__in=list(related), similar__created_at__lte=window_start
+    ).delete()
+    ranks = {
+        row["job_id"]: row
+        for row in SimilarJob.objects.filter(job_id__in=list(related))
+        .values("job_id")
+        .annotate(total=Count("pk"), lowest=Min("score"))
+    }
+
+    rows, crowded = [], []
+    for related_id, related_skills in related.items():
+        score = jaccard(related_skills, skills)
+        rank = ranks.get(related_id, {"total": 0, "lowest": 0})
+        if rank["total"] >= SIMILAR_JOBS_LIMIT:
+            if score <= rank["lowest"]:
+                continue
+            crowded.append(related_id)
+        rows.append(SimilarJob(job_id=related_id, similar_id=job.pk, score=score))
+
+    SimilarJob.objects.bulk_create(rows)
+    if crowded:
+        lowest = {}
+        rows = (
+            SimilarJob.objects.filter(job_id__in=crowded)
+            .order_by("job_id", "-score", "-similar_id")
+            .values_list("job_id", "pk")
+        )
+        for related_id, pk in rows:
+            lowest[related_id] = pk  # the last row of each job is its lowest
+        SimilarJob.objects.filter(pk__in=lowest.values()).delete()
+
+
+def fill_similar_jobs(job_id, skills):
+    """Recomputes the similar jobs of ``job_id`` alone, from its ``skills``."""
+    from pyjobs.core.models import SimilarJob
+
+    SimilarJob.objects.filter(job_id=job_id).delete()
+    if not skills:
+        return
+
+    candidates = get_jobs_sharing_skills(skills, job__created_at__gt=get_window_start())
+    SimilarJob.objects.bulk_create(
+        SimilarJob(job_id=job_id, similar_id=similar_id, score=score)
+        for score, similar_id in rank_similar_jobs(job_id, skills, candidates)
+    )
+
+
+@transaction.atomic
+def refresh_similar_jobs(job):
+    """
+    Recomputes the similar jobs of ``job`` and, if it is recent enough to be
+    recommended, offers it to every job sharing a skill with it. The jobs it
+    is no longer offered to get their lists refilled by the task queue.
+    """
+    from pyjobs.core.models import SimilarJob
+
+    skills = frozenset(job.skills.values_list("pk", flat=True))
+    offered_to = SimilarJob.objects.filter(similar=job)
+    previously_offered_to = set(offered_to.values_list("job_id", flat=True))
+    offered_to.delete()
+    fill_similar_jobs(job.pk, skills)
+
+    if skills and job.created_at > get_window_start():
+        offer_similar_job(job, skills)
+
+    dropped_from = previously_offered_to - set(
+        offered_to.values_list("job_id", flat=True)
+    )
+    for job_id in dropped_from:
+        fill_similar_jobs_of.enqueue_once(job_id=job_id)
+
+
+@task
+def refresh_similar_jobs_of(job_id):
+    from pyjobs.core.models import Job
+
+    job = Job.objects.filter(pk=job_id).first()
+    if job is not None:
+        refresh_similar_jobs(job)
+
+
+@task
+def fill_similar_jobs_of(job_id):
+    from pyjobs.core.models import Job
+
+    skills = Job.skills.through.objects.filter(job_id=job_id)
+    with transaction.atomic():
+        fill_similar_jobs(job_id, frozenset(skills.values_list("skill_id", flat=True)))
+
+
+def schedule_similar_jobs_refresh(job_id):
+    """Queues the refresh of ``job_id``, once even if its skills change many
+    times in a row (``set`` removes then adds them)."""
+    refresh_similar_jobs_of.enqueue_once(job_id=job_id)
+
+
+def rebuild_similar_jobs(batch_size=500):
+    """Recomputes the whole table, ``batch_size`` jobs at a time. Yields the
+    number of jobs processed after each batch."""
+    from pyjobs.core.models import Job, SimilarJob
+
+    candidates = get_job_skills(job__created_at__gt=get_window_start())
+    by_skill = defaultdict(set)
+    for candidate_id, skills in candidates.items():
+        for skill_id in skills:
+            by_skill[skill_id].add(candidate_id)
+
+    job_ids = list(Job.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(job_ids), batch_size):
+        batch = job_ids[start : start + batch_size]
+        rows = []
+        for job_id, skills in get_job_skills(job_id__in=batch).items():
+            related = set().union(*(by_skill[skill_id] for skill_id in skills))
+            rows.extend(
+                SimilarJob(job_id=job_id, similar_id=similar_id, score=score)
+                for score, similar_id in rank_similar_jobs(
+                    job_id, skills, {pk: candidates[pk] for pk in related}
+                )
+            )
+
+        with transaction.atomic():
+            SimilarJob.objects.filter(job_id__in=batch).delete()
+            SimilarJob.objects.bulk_create(rows, batch_size=batch_size)
+        yield start + len(batch)
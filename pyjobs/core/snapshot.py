@@ -0,0 +1,328 @@
+"""
+Per-process snapshot of the active jobs (public jobs from the last 30 days).
+
+The listings (``index``, ``jobs``, ``job_state_view`` and ``job_skill_view``)
+all read the same small set of rows, so instead of querying it on every hit
+each process keeps its columns in compact arrays, sorted by ``created_at``,
+and filters, splits premium jobs, orders and paginates them in memory. The
+database is only touched to hydrate the rows of the requested page.
+
+``Job`` signals patch the local snapshot and bump a version counter kept in
+the shared cache, so the other processes notice the change and rebuild theirs
+on their next access. Patches are applied to a copy that then replaces the
+snapshot, so the threads reading the current one never see it half patched.
+"""
+
+import copy
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+ACTIVE_JOBS_DAYS = 30
+SNAPSHOT_VERSION_KEY = "active_jobs_snapshot_version"
+
+COLUMNS = ("state", "salary_range", "job_level", "contract_form", "country")
+
+
+def get_snapshot_version():
+    return cache.get(SNAPSHOT_VERSION_KEY, 0)
+
+
+def bump_snapshot_version():
+    try:
+        return cache.incr(SNAPSHOT_VERSION_KEY)
+    except ValueError:
+        cache.add(SNAPSHOT_VERSION_KEY, 0, timeout=None)
+        return cache.incr(SNAPSHOT_VERSION_KEY)
+
+
+class ActiveJobsSnapshot:
+    def __init__(self, version=0):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.window_start = (
+            datetime.now() - timedelta(days=ACTIVE_JOBS_DAYS)
+        ).timestamp()
+
+        # every column is kept sorted by (created_at, id), oldest first
+        self.ids = array("q")
+        self.created_at = array("d")
+        self.state = array("b")
+        self.salary_range = array("b")
+        self.job_level = array("b")
+        self.contract_form = array("b")
+        self.country = array("q")
+        self.remote = bytearray()
+        self.premium = bytearray()
+        self.skills = []
+
+        self.skill_bits = {}
+        self.country_names = {}
+
+    @classmethod
+    def build(cls, version=0):
+        from pyjobs.core.models import Job
+
+        snapshot = cls(version)
+        rows = (
+            Job.objects.public()
+            .filter(created_at__gt=datetime.fromtimestamp(snapshot.window_start))
+            .order_by("created_at", "id")
+            .values_list("id", "created_at", "remote", "premium", *COLUMNS)
+        )
+        skills = {}
+        for job_id, skill_id in Job.skills.through.objects.filter(
+            job__public=True,
+            job__created_at__gt=datetime.fromtimestamp(snapshot.window_start),
+        ).values_list("job_id", "skill_id"):
+            skills[job_id] = skills.get(job_id, 0) | snapshot.skill_bit(skill_id)
+
+        for row in rows:
+            snapshot._append(*row, skills=skills.get(row[0], 0))
+
+        snapshot.country_names = dict(
+            Job._meta.get_field("country")
+            .related_model.objects.filter(pk__in=set(snapshot.country))
+            .values_list("pk", "name")
+        )
+        return snapshot
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __copy__(self):
+        """Copies the columns too, patching the copy leaves ``self`` intact."""
+        snapshot = ActiveJobsSnapshot.__new__(ActiveJobsSnapshot)
+        for name, value in self.__dict__.items():
+            if isinstance(value, dict):
+                value = dict(value)
+            elif isinstance(value, (array, bytearray, list)):
+                value = value[:]
+            setattr(snapshot, name, value)
+        return snapshot
+
+    def skill_bit(self, skill_id):
+        if skill_id not in self.skill_bits:
+            self.skill_bits[skill_id] = 1 << len(self.skill_bits)
+        return self.skill_bits[skill_id]
+
+    def skills_mask(self, skill_ids):
+        mask = 0
+        for skill_id in skill_ids:
+            mask |= self.skill_bit(skill_id)
+        return mask
+
+    def _append(self, job_id, created_at, remote, premium, *columns, skills=0):
+        self._insert(
+            len(self.ids), job_id, created_at, remote, premium, columns, skills
+        )
+
+    def _insert(self, index, job_id, created_at, remote, premium, columns, skills):
+        self.ids.insert(index, job_id)
+        self.created_at.insert(index, created_at.timestamp())
+        self.remote.insert(index, bool(remote))
+        self.premium.insert(index, bool(premium))
+        self.skills.insert(index, skills)
+        for name, value in zip(COLUMNS, columns):
+            getattr(self, name).insert(index, value)
+
+    def _remove_at(self, index):
+        for name in ("ids", "created_at", "remote", "premium", "skills") + COLUMNS:
+            del getattr(self, name)[index]
+
+    def position(self, job_id):
+        try:
+            return self.ids.index(job_id)
+        except ValueError:
+            return None
+
+    def remove(self, job_id):
+        index = self.position(job_id)
+        if index is not None:
+            self._remove_at(index)
+
+    def upsert(self, job):
+        """Patches the snapshot with a saved ``Job``, keeping its skills."""
+        index = self.position(job.pk)
+        skills = 0
+        if index is not None:
+            skills = self.skills[index]
+            self._remove_at(index)
+
+        created_at = job.created_at.timestamp()
+        if not job.public or created_at <= self.window_start:
+            return
+
+        index = bisect_left(self.created_at, created_at)
+        while (
+            index < len(self.ids)
+            and self.created_at[index] == created_at
+            and self.ids[index] < job.pk
+        ):
+            index += 1
+
+        columns = [getattr(job, name) for name in COLUMNS[:-1]] + [job.country_id]
+        self._insert(
+            index, job.pk, job.created_at, job.remote, job.premium, columns, skills
+        )
+        if job.country_id not in self.country_names:
+            self.country_names[job.country_id] = str(job.country)
+
+    def set_skills(self, job_id, skill_ids):
+        index = self.position(job_id)
+        if index is not None:
+            self.skills[index] = self.skills_mask(skill_ids)
+
+    def matches(self, index, premium=None, skill=None, **selection):
+        if premium is not None and self.premium[index] != premium:
+            return False
+        # readers must not register skills, another thread may be copying
+        if skill is not None and not self.skills[index] & self.skill_bits.get(skill, 0):
+            return False
+        for name, value in selection.items():
+            column = self.remote if name == "remote" else getattr(self, name)
+            if column[index] != value:
+                return False
+        return True
+
+    def active_indexes(self):
+        """Yields the indexes of the jobs inside the window, newest first."""
+        now = datetime.now()
+        window_start = (now - timedelta(days=ACTIVE_JOBS_DAYS)).timestamp()
+        now = now.timestamp()
+
+        for index in range(len(self.ids) - 1, -1, -1):
+            created_at = self.created_at[index]
+            if created_at > now:
+                continue
+            if created_at <= window_start:
+                break
+            yield index
+
+    def select(self, limit=None, **filters):
+        """
+        Returns the ids of the active jobs matching ``filters``, newest first.
+        Accepts ``premium``, ``skill`` (a skill id) and the facet/state columns.
+        """
+        ids = []
+        for index in self.active_indexes():
+            if self.matches(index, **filters):
+                ids.append(self.ids[index])
+                if limit is not None and len(ids) >= limit:
+                    break
+        return ids
+
+    def facet_rows(self, **filters):
+        """Groups the matching jobs the same way ``JobFilter.facet_rows`` does."""
+        groups = {}
+        for index in self.active_indexes():
+            if not self.matches(index, **filters):
+                continue
+            key = (
+                self.country[index],
+                self.contract_form[index],
+                bool(self.remote[index]),
+                self.salary_range[index],
+                self.job_level[index],
+            )
+            groups[key] = groups.get(key, 0) + 1
+
+        return [
+            {
+                "country": country,
+                "contract_form": contract_form,
+                "remote": remote,
+                "salary_range": salary_range,
+                "job_level": job_level,
+                "country__name": self.country_names.get(country),
+                "total": total,
+            }
+            for (
+                country,
+                contract_form,
+                remote,
+                salary_range,
+                job_level,
+            ), total in groups.items()
+        ]
+
+
+_snapshot = None
+_snapshot_lock = threading.RLock()
+
+
+def get_active_jobs_snapshot():
+    global _snapshot
+
+    version = get_snapshot_version()
+    window_start = (datetime.now() - timedelta(days=ACTIVE_JOBS_DAYS)).timestamp()
+    with _snapshot_lock:
+        stale = (
+            _snapshot is None
+            or _snapshot.version != version
+            # rows older than the build window were never loaded
+            or _snapshot.window_start > window_start
+            or time.monotonic() - _snapshot.built_at > settings.ACTIVE_JOBS_SNAPSHOT_TTL
+        )
+        if stale:
+            _snapshot = ActiveJobsSnapshot.build(version)
+        return _snapshot
+
+
+def invalidate_active_jobs_snapshot():
+    global _snapshot
+
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def patch_active_jobs_snapshot(patch):
+    """
+    Applies ``patch(snapshot)`` to the local snapshot and bumps the shared
+    version once the current transaction commits, so no process rebuilds its
+    snapshot from rows that are not visible yet. The local copy is only
+    patched if it had seen every previous change, otherwise (or if ``patch``
+    is None) it is dropped and rebuilt on the next access.
+    """
+    transaction.on_commit(lambda: _patch_active_jobs_snapshot(patch))
+
+
+def _patch_active_jobs_snapshot(patch):
+    global _snapshot
+
+    version = bump_snapshot_version()
+    with _snapshot_lock:
+        if _snapshot is None:
+            return
+        if patch is None or _snapshot.version != version - 1:
+            _snapshot = None
+            return
+        patched = copy.copy(_snapshot)
+        patch(patched)
+        patched.version = version
+        _snapshot = patched
+
+
+class StaleSnapshot(Exception):
+    pass
+
+
+def hydrate_jobs(ids):
+    """
+    Loads the ``Job`` rows for ``ids`` keeping their order. Raises
+    ``StaleSnapshot`` and drops the local snapshot if any row is gone without
+    a signal (a ``QuerySet.delete`` or a rolled back transaction).
+    """
+    from pyjobs.core.models import Job
+
+    jobs = Job.objects.in_bulk(ids)
+    if len(jobs) != len(ids):
+        invalidate_active_jobs_snapshot()
+        raise StaleSnapshot
+    return [jobs[job_id] for job_id in ids]
@@ -11,3 +11,17 @@ def merge_query_params(context, **kwargs):
         query_params[k] = v
 
     return query_params.urlencode()
+
+
+@register.simple_tag(takes_context=True)
+def toggle_query_param(context, name, value):
+    query_params = context["request"].GET.copy()
+    query_params.pop("page", None)
+    query_params.pop("cursor", None)
+
+    if query_params.get(name) == str(value):
+        query_params.pop(name)
+    else:
+        query_params[name] = value
+
+    return query_params.urlencode()
@@ -60,7 +60,7 @@ class TestSendingChallengesToOldApplicants(TestCase):
         )
         self.job.save()
 
-    @patch("pyjobs.core.admin.get_email_with_template")
+    @patch("pyjobs.core.admin.get_emails_with_template")
     def test_sending(self, _mocked_get_email_with_template):
         self.user = User.objects.create_user(
             username="jacob", email="jacob@gmail.com", password="top_secret"
@@ -4,9 +4,13 @@ from django.test import TestCase, override_settings
 from freezegun import freeze_time
 from six import StringIO
 from pyjobs.core.models import Job
-from pyjobs.marketing.models import Messages, MailingList
+from pyjobs.marketing.mailer import BatchMailer
+from pyjobs.marketing.models import Messages, MailingList, MailingRun
 from datetime import datetime, timedelta
 from pyjobs.core.management.commands.send_weekly_mailing import *
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends import locmem
 from django.core.management import call_command
 from model_bakery import baker as mommy
 import sys
@@ -79,3 +83,95 @@ class FeedbackRequestWithNoJobsTest(TestCase):
         sys.stdout = out
         call_command("send_weekly_mailing", stdout=out)
         self.assertEqual("False\n", out.getvalue())
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    WEBSITE_OWNER_EMAIL="owner@pyjobs.com.br",
+)
+class WeeklyMailingBatchTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        job = mommy.make(Job, public=True, premium=True)
+        Job.objects.filter(pk=job.pk).update(created_at=datetime(2019, 10, 29))
+        self.mailing_lists = [
+            MailingList.objects.create(
+                email=f"list{index}@pyjobs.com.br", name="pyjobs", slug="pyjobs"
+            )
+            for index in range(7)
+        ]
+
+    def get_recipients(self):
+        return sorted(message.to[0] for message in mail.outbox)
+
+    @freeze_time("2019-10-30")
+    def test_sends_one_message_per_list(self):
+        call_command("send_weekly_mailing", chunk_size=2, workers=3, stdout=StringIO())
+
+        self.assertEqual(
+            self.get_recipients(),
+            sorted(mailing.email for mailing in self.mailing_lists),
+        )
+        for message in mail.outbox:
+            self.assertEqual(message.from_email, format_owner_email(message.to[0]))
+
+        run = MailingRun.objects.get()
+        self.assertEqual(run.sent, 7)
+        self.assertEqual(run.last_recipient_id, self.mailing_lists[-1].pk)
+        self.assertIsNotNone(run.finished_at)
+
+    @freeze_time("2019-10-30")
+    def test_finished_run_is_not_sent_again(self):
+        call_command("send_weekly_mailing", stdout=StringIO())
+        call_command("send_weekly_mailing", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 7)
+
+    @freeze_time("2019-10-30")
+    def test_interrupted_run_resumes_after_the_checkpoint(self):
+        send_messages = locmem.EmailBackend.send_messages
+        calls = []
+
+        def fail_last_chunk(backend, messages):
+            calls.append(messages)
+            if len(calls) == 4:
+                raise ConnectionError
+            return send_messages(backend, messages)
+
+        with patch.object(locmem.EmailBackend, "send_messages", fail_last_chunk):
+            with self.assertRaises(ConnectionError):
+                call_command(
+                    "send_weekly_mailing", chunk_size=2, workers=1, stdout=StringIO()
+                )
+
+        run = MailingRun.objects.get()
+        self.assertEqual(run.last_recipient_id, self.mailing_lists[5].pk)
+        self.assertEqual(run.sent, 6)
+        self.assertIsNone(run.finished_at)
+
+        call_command("send_weekly_mailing", chunk_size=2, stdout=StringIO())
+        self.assertEqual(mail.outbox[-1].to, [self.mailing_lists[-1].email])
+        self.assertEqual(
+            self.get_recipients(),
+            sorted(mailing.email for mailing in self.mailing_lists),
+        )
+        run.refresh_from_db()
+        self.assertEqual(run.sent, 7)
+        self.assertIsNotNone(run.finished_at)
+
+    def test_reuses_one_connection_per_worker(self):
+        mailer = BatchMailer(chunk_size=1, workers=2)
+        run = MailingRun.objects.create(mailing="test", edition=datetime.today())
+        with patch("pyjobs.marketing.mailer.get_connection") as get_connection:
+            get_connection.return_value.send_messages.return_value = 1
+            sent, _elapsed = mailer.send(
+                run,
+                self.mailing_lists,
+                lambda mailing: EmailMultiAlternatives(to=[mailing.email]),
+            )
+
+        self.assertEqual(sent, 7)
+        self.assertLessEqual(get_connection.call_count, 2)
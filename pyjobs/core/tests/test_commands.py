@@ -11,6 +11,7 @@ from pyjobs.core.management.commands.send_weekly_mailing import (
 from model_bakery import baker as mommy
 from datetime import datetime, timedelta
 from django.contrib.auth.models import User
+from django.core import mail
 from django.core.management import call_command
 import sys
 
@@ -64,7 +65,9 @@ class SendTestReminderTest(TestCase):
         call_command("send_test_reminder", stdout=out)
         self.assertEqual("False\n", out.getvalue())
 
-    @patch("pyjobs.core.management.commands.send_test_reminder.get_email_with_template")
+    @patch(
+        "pyjobs.core.management.commands.send_test_reminder.get_emails_with_template"
+    )
     def test_changing_job_to_apply_test(self, _mocked_get_template):
         out = StringIO()
         sys.stdout = out
@@ -76,6 +79,39 @@ class SendTestReminderTest(TestCase):
         self.job_application.refresh_from_db()
         self.assertTrue(self.job_application.challenge_resent)
 
+    @patch("pyjobs.core.management.commands.send_test_reminder.get_connection")
+    def test_failed_reminders_are_not_marked_as_sent(self, _mocked_get_connection):
+        connection = _mocked_get_connection.return_value.__enter__.return_value
+        connection.send_messages.side_effect = ConnectionError
+        self.job.is_challenging = True
+        self.job.save()
+
+        with self.assertRaises(ConnectionError):
+            call_command("send_test_reminder", stdout=StringIO())
+
+        self.job_application.refresh_from_db()
+        self.assertFalse(self.job_application.challenge_resent)
+
+    def test_reminders_are_sent_in_batches(self):
+        for profile in mommy.make(Profile, _fill_optional=True, _quantity=2):
+            JobApplication.objects.create(
+                job=self.job,
+                user=profile.user,
+                email_sent_at=datetime.now() - timedelta(days=1),
+                challenge_resent=False,
+                challenge_response_at=None,
+            )
+        self.job.is_challenging = True
+        self.job.save()
+        mail.outbox = []
+
+        call_command("send_test_reminder", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(
+            JobApplication.objects.filter(challenge_resent=False).exists()
+        )
+
 
 class SendWeeklySummaryTest(TestCase):
     @patch("pyjobs.marketing.triggers.send_group_notification")
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from freezegun import freeze_time
+from model_bakery import baker as mommy
+
+from pyjobs.core.models import Country, Currency, Job
+
+
+class ConditionalGetTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        cache.clear()
+        self.job = mommy.make(
+            Job,
+            public=True,
+            premium=True,
+            premium_at=datetime(2020, 1, 2, 10, 30),
+            country=mommy.make(Country),
+            currency=mommy.make(Currency),
+        )
+
+    def assertNotModified(self, url):
+        response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+        self.assertIn("Last-Modified", response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(304, response.status_code)
+        self.assertIn("ETag", response)
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(304, response.status_code)
+
+    def test_api(self):
+        self.assertNotModified(reverse("api:job_list"))
+        self.assertNotModified(reverse("api:job_detail", args=[self.job.pk]))
+
+    def test_feeds(self):
+        self.assertNotModified("/feed/")
+        self.assertNotModified("/feed/premium/")
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_job_changes_expire_the_validators(self, *_mocks):
+        url = reverse("api:job_list")
+        with freeze_time("2020-01-01 12:00:00"):
+            etag = self.client.get(url)["ETag"]
+            with self.captureOnCommitCallbacks(execute=True):
+                self.job.title = "Django Developer"
+                self.job.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "Django Developer")
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_validators_expire_on_commit(self, *_mocks):
+        url = reverse("api:job_list")
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.job.title = "Django Developer"
+            self.job.save()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(304, response.status_code)
+
+        for callback in callbacks:
+            callback()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_changes_in_the_same_second_expire_last_modified(self, *_mocks):
+        url = reverse("api:job_list")
+        with freeze_time("2020-01-01 12:00:00.300"):
+            last_modified = self.client.get(url)["Last-Modified"]
+            with self.captureOnCommitCallbacks(execute=True):
+                self.job.title = "Django Developer"
+                self.job.save()
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "Django Developer")
+
+    def test_feed_validators_change_hourly(self):
+        with freeze_time(datetime.now() + timedelta(days=1)) as frozen_time:
+            etag = self.client.get("/feed/")["ETag"]
+            frozen_time.tick(60 * 60)
+            response = self.client.get("/feed/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+
+    def test_premium_feed_pubdate(self):
+        response = self.client.get("/feed/premium/")
+        self.assertContains(response, "<pubDate>Thu, 02 Jan 2020 10:30:00")
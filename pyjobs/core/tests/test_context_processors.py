@@ -0,0 +1,55 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from model_bakery import baker as mommy
+from social_django.models import UserSocialAuth
+
+from pyjobs.core.context_processors import append_social_info_to_context
+
+
+class SocialInfoContextTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("pythonista", password="secret")
+        mommy.make(UserSocialAuth, user=self.user, provider="github", uid="1")
+        self.request = RequestFactory().get("/")
+        self.request.COOKIES["sessionid"] = "session"
+        self.request.user = self.user
+
+    def test_values_are_not_resolved_unless_read(self):
+        with self.assertNumQueries(0):
+            append_social_info_to_context(self.request)
+
+    def test_visitors_without_session_cost_no_queries(self):
+        del self.request.COOKIES["sessionid"]
+        context = append_social_info_to_context(self.request)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(context["EMPTY_PROFILE"])
+            self.assertFalse(context["SOCIAL_AUTH"])
+
+    def test_social_login_state(self):
+        context = append_social_info_to_context(self.request)
+
+        self.assertTrue(context["SOCIAL_AUTH"])
+        self.assertTrue(context["EMPTY_PROFILE"])
+        self.assertTrue(context["GITHUB_LOGIN"])
+        self.assertFalse(context["LINKEDIN_LOGIN"])
+
+    def test_social_login_state_is_cached(self):
+        bool(append_social_info_to_context(self.request)["EMPTY_PROFILE"])
+        context = append_social_info_to_context(self.request)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(context["EMPTY_PROFILE"])
+            self.assertTrue(context["GITHUB_LOGIN"])
+            self.assertFalse(context["LINKEDIN_LOGIN"])
+
+    def test_profile_changes_invalidate_the_state(self):
+        bool(append_social_info_to_context(self.request)["EMPTY_PROFILE"])
+
+        self.user.profile.github = "https://github.com/pythonista"
+        self.user.profile.save()
+
+        context = append_social_info_to_context(self.request)
+        self.assertFalse(context["EMPTY_PROFILE"])
@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from model_bakery import baker as mommy
+
+from pyjobs.core.filters import JobFilter
+from pyjobs.core.models import Job, Country
+
+
+class JobFilterFacetsTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.country = mommy.make(Country, name="Brasil")
+        mommy.make(Job, country=self.country, contract_form=2, remote=True, job_level=2)
+        mommy.make(
+            Job, country=self.country, contract_form=2, remote=False, job_level=3
+        )
+        mommy.make(Job, country=self.country, contract_form=3, remote=True, job_level=3)
+
+    def get_counts(self, facets, name):
+        facet = next(facet for facet in facets if facet["name"] == name)
+        return {option["value"]: option["count"] for option in facet["options"]}
+
+    def test_facets_count_every_option(self):
+        facets = JobFilter({}, queryset=Job.objects.all()).facets()
+
+        self.assertEqual(self.get_counts(facets, "contract_form"), {2: 2, 3: 1})
+        self.assertEqual(self.get_counts(facets, "remote"), {True: 2, False: 1})
+        self.assertEqual(self.get_counts(facets, "country"), {self.country.pk: 3})
+
+    def test_facets_apply_the_other_selected_facets(self):
+        facets = JobFilter({"remote": "true"}, queryset=Job.objects.all()).facets()
+
+        self.assertEqual(self.get_counts(facets, "contract_form"), {2: 1, 3: 1})
+        self.assertEqual(self.get_counts(facets, "job_level"), {2: 1, 3: 1})
+        self.assertEqual(self.get_counts(facets, "remote"), {True: 2, False: 1})
+
+    def test_facets_mark_selected_options(self):
+        facets = JobFilter({"contract_form": "3"}, queryset=Job.objects.all()).facets()
+        facet = next(facet for facet in facets if facet["name"] == "contract_form")
+        selected = [
+            option["value"] for option in facet["options"] if option["selected"]
+        ]
+
+        self.assertEqual(selected, [3])
+
+    def test_facets_run_a_single_query(self):
+        with self.assertNumQueries(1):
+            JobFilter({"remote": "true"}, queryset=Job.objects.all()).facets()
@@ -1,9 +1,12 @@
+from asgiref.sync import async_to_sync
 from django.test import TestCase, override_settings
 from model_mommy import mommy
 from datetime import timedelta
+from time import monotonic
 
 import responses
 
+from pyjobs.core import http_client
 from pyjobs.core.forms import *
 from pyjobs.core.models import Skill, Profile, Job, Country, Currency
 from unittest.mock import patch
@@ -99,7 +102,37 @@ class RegisterFormTest(TestCase):
         self.assertFalse(form.is_valid("test"))
 
     @responses.activate
-    @patch("pyjobs.marketing.triggers.subscribe_user_to_mailer")
+    def test_recaptcha_verified_by_the_view_is_not_verified_again(self):
+        form = RegisterForm(data={})
+        self.assertFalse(form.is_valid("test", recaptcha_verified=False))
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    @patch.dict("pyjobs.core.http_client._clients", clear=True)
+    def test_recaptcha_is_not_verified_while_google_is_failing(self):
+        http_client.get_client(RECAPTCHA_VERIFY_URL).opened_at = monotonic()
+
+        self.assertFalse(verify_recaptcha("test"))
+        self.assertFalse(async_to_sync(averify_recaptcha)("test"))
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_unexpected_recaptcha_answers_are_not_verified(self):
+        responses.add(responses.POST, RECAPTCHA_VERIFY_URL, body="<html>")
+        self.assertFalse(verify_recaptcha("test"))
+
+        responses.replace(responses.POST, RECAPTCHA_VERIFY_URL, json={})
+        self.assertFalse(verify_recaptcha("test"))
+
+    @override_settings(RECAPTCHA_SECRET_KEY="my-secret")
+    @responses.activate
+    def test_missing_recaptcha_is_not_sent_to_google(self):
+        form = RegisterForm(data={})
+        self.assertFalse(form.is_valid(None))
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    @patch("pyjobs.marketing.triggers.record_subscription_intent")
     def test_valid_form(self, _mocked_subscription):
         responses.add(
             responses.POST,
@@ -131,7 +164,7 @@ class RegisterFormTest(TestCase):
         self.assertTrue(_mocked_subscription.called)
 
     @responses.activate
-    @patch("pyjobs.marketing.triggers.subscribe_user_to_mailer")
+    @patch("pyjobs.marketing.triggers.record_subscription_intent")
     def test_valid_form_but_without_mailer(self, _mocked_subscription):
         responses.add(
             responses.POST,
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import patch
+
+import requests
+import responses
+from django.test import SimpleTestCase
+
+from pyjobs.core import http_client
+
+URL = "https://api.example.com/posts/"
+
+
+@patch("pyjobs.core.http_client.sleep")
+@patch.dict("pyjobs.core.http_client._clients", clear=True)
+class HttpClientTest(SimpleTestCase):
+    def test_one_pooled_client_per_host(self, _sleep):
+        client = http_client.get_client(URL)
+        self.assertIs(http_client.get_client("https://api.example.com/other"), client)
+        self.assertIsNot(http_client.get_client("https://blog.example.com/"), client)
+
+    @patch("requests.Session.request")
+    def test_default_timeout(self, request, _sleep):
+        request.return_value.status_code = 200
+        http_client.get(URL)
+        self.assertEqual(
+            request.call_args.kwargs["timeout"], http_client.DEFAULT_TIMEOUT
+        )
+
+    @responses.activate
+    def test_idempotent_requests_are_retried(self, _sleep):
+        responses.add(responses.GET, URL, status=503)
+        responses.add(responses.GET, URL, body=requests.ConnectionError())
+        responses.add(responses.GET, URL, json={"posts": []})
+
+        response = http_client.get(URL)
+
+        self.assertEqual(response.json(), {"posts": []})
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(_sleep.call_count, 2)
+        metrics = http_client.get_metrics()["https://api.example.com"]
+        self.assertEqual((metrics["requests"], metrics["errors"]), (3, 2))
+        self.assertEqual(metrics["retries"], 2)
+
+    @responses.activate
+    def test_posts_are_not_retried(self, _sleep):
+        responses.add(responses.POST, URL, status=503)
+        self.assertEqual(http_client.post(URL).status_code, 503)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_last_response_is_returned_when_retries_run_out(self, _sleep):
+        responses.add(responses.GET, URL, status=503)
+        self.assertEqual(http_client.get(URL, retries=1).status_code, 503)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_circuit_breaker(self, _sleep):
+        responses.add(responses.GET, URL, body=requests.ConnectionError())
+
+        for _ in range(http_client.BREAKER_THRESHOLD):
+            with self.assertRaises(requests.ConnectionError):
+                http_client.get(URL, retries=0)
+
+        with self.assertRaises(http_client.CircuitOpen):
+            http_client.get(URL)
+        self.assertEqual(len(responses.calls), http_client.BREAKER_THRESHOLD)
+        self.assertEqual(
+            http_client.get_metrics()["https://api.example.com"]["rejected"], 1
+        )
+
+        responses.replace(responses.GET, URL, json={"posts": []})
+        cooled_down = http_client.monotonic() + http_client.BREAKER_COOLDOWN
+        with patch("pyjobs.core.http_client.monotonic", return_value=cooled_down):
+            self.assertEqual(http_client.get(URL).status_code, 200)
+        self.assertEqual(http_client.get(URL).status_code, 200)
+
+    @responses.activate
+    def test_async_requests_go_through_the_same_client(self, _sleep):
+        responses.add(responses.GET, URL, status=503)
+        responses.add(responses.GET, URL, json={"posts": []})
+
+        response = asyncio.run(http_client.aget(URL))
+
+        self.assertEqual(response.json(), {"posts": []})
+        metrics = http_client.get_metrics()["https://api.example.com"]
+        self.assertEqual((metrics["requests"], metrics["retries"]), (2, 1))
@@ -8,6 +8,7 @@ from django.test import TestCase
 from model_bakery import baker as mommy
 from model_mommy.recipe import Recipe
 
+from pyjobs.core.filters import JobFilter
 from pyjobs.core.models import Job, Profile, Skill, JobError, Currency, Country
 
 
@@ -338,3 +339,79 @@ class JobManagerTest(TestCase):
 
         self.assertIn(self.job, qs)
         self.assertIn(self.job, qs_term)
+
+
+class JobSearchTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.title_job = Job.objects.create(
+            title="Desenvolvedor Django",
+            workplace="Sao Paulo",
+            company_name="XPTO",
+            company_email="vm@xpto.com",
+            description="Job bem maneiro",
+        )
+        self.description_job = Job.objects.create(
+            title="Desenvolvedor Backend",
+            workplace="Recife",
+            company_name="ACME",
+            company_email="vm@acme.com",
+            description="Vamos usar Django e Celery",
+        )
+        self.other_job = Job.objects.create(
+            title="Desenvolvedor Flask",
+            workplace="Curitiba",
+            company_name="Foo",
+            company_email="vm@foo.com",
+            description="Microsserviços",
+        )
+
+    def test_search_filters_by_term(self):
+        results = list(Job.objects.search("django"))
+        self.assertIn(self.title_job, results)
+        self.assertIn(self.description_job, results)
+        self.assertNotIn(self.other_job, results)
+
+    def test_search_ranks_title_matches_first(self):
+        results = list(Job.objects.search("django"))
+        self.assertEqual(results[0], self.title_job)
+
+    def test_search_matches_prefixes_and_accents(self):
+        self.assertIn(self.other_job, Job.objects.search("microsservicos"))
+        self.assertIn(self.description_job, Job.objects.search("cel"))
+
+    def test_search_requires_every_word(self):
+        results = list(Job.objects.search("django recife"))
+        self.assertEqual(results, [self.description_job])
+
+    def test_search_index_follows_job_save(self):
+        self.other_job.title = "Desenvolvedor Django Senior"
+        self.other_job.save()
+        self.assertIn(self.other_job, Job.objects.search("django"))
+
+    def test_search_index_follows_job_delete(self):
+        pk = self.title_job.pk
+        self.title_job.delete()
+        self.assertNotIn(pk, Job.objects.search("django").values_list("pk", flat=True))
+
+    def test_search_without_words_falls_back_to_icontains(self):
+        self.assertFalse(Job.objects.search("+++").exists())
+
+    def test_postgres_search_ignores_accents(self):
+        with patch("pyjobs.core.search.get_search_backend", return_value="postgresql"):
+            sql = str(Job.objects.search("Microsserviços").query)
+        self.assertIn("to_tsquery('pyjobs_search', microsservicos:*)", sql)
+        self.assertIn("ts_rank(core_job.search_vector", sql)
+
+    def test_title_filter_searches_every_field(self):
+        job_filter = JobFilter({"title": "celery"}, queryset=Job.objects.all())
+        self.assertEqual(list(job_filter.qs), [self.description_job])
+
+    def test_facets_count_the_search_matches(self):
+        job_filter = JobFilter({"title": "django"}, queryset=Job.objects.all())
+        job_filter.is_valid()
+        self.assertEqual(sum(row["total"] for row in job_filter.facet_rows()), 2)
@@ -187,6 +187,20 @@ class PyJobsContact(TestCase):
         content = response.content.decode("utf-8")
         self.assertTrue("Mensagem enviada com sucesso" in content)
 
+    @override_settings(RECAPTCHA_SECRET_KEY="my-secret")
+    @patch("pyjobs.core.views.ContactForm")
+    @responses.activate
+    def test_recaptcha_is_verified_before_the_view(self, _mocked_form):
+        responses.add(
+            responses.POST,
+            "https://www.google.com/recaptcha/api/siteverify",
+            json={"success": False},
+            status=200,
+        )
+        self.client.post("/contact/", {"g-recaptcha-response": "token"})
+        self.assertEqual(len(responses.calls), 1)
+        _mocked_form.return_value.is_valid.assert_called_once_with("token", False)
+
 
 class PyJobsMultipleJobsPagesTest(TestCase):
     @patch("pyjobs.marketing.triggers.post_telegram_channel")
@@ -197,9 +211,15 @@ class PyJobsMultipleJobsPagesTest(TestCase):
     ):
         self.country = mommy.make(Country)
         self.currency = mommy.make(Currency)
-        self.job = mommy.make(
-            Job, public=True, country=self.country, currency=self.currency, _quantity=20
-        )
+        # the active jobs snapshot is only patched once the jobs are committed
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job = mommy.make(
+                Job,
+                public=True,
+                country=self.country,
+                currency=self.currency,
+                _quantity=20,
+            )
         self.client = Client()
 
     def test_first_page(self):
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.utils.cache import patch_vary_headers
+from django.urls import reverse
+from model_bakery import baker as mommy
+
+from pyjobs.core.models import Job, Skill
+from pyjobs.core.page_cache import (
+    CSRF_PLACEHOLDER,
+    cache_anonymous_page,
+    get_generations,
+)
+
+
+class PageCacheTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        cache.clear()
+        self.job = mommy.make(Job, public=True, title="Django Developer")
+        self.url = reverse("jobs")
+
+    def test_second_hit_is_served_from_the_cache(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertContains(response, "Django Developer")
+
+    def test_query_string_order_does_not_matter(self):
+        self.client.get(self.url, {"remote": "true", "job_level": "1"})
+
+        with self.assertNumQueries(0):
+            self.client.get(f"{self.url}?job_level=1&remote=true")
+
+    def test_csrf_token_is_not_shared(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertNotIn(CSRF_PLACEHOLDER, response.content)
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_job_changes_expire_the_pages(self, *_mocks):
+        self.client.get(self.url)
+        generations = get_generations([Job, Skill])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.title = "Flask Developer"
+            self.job.save()
+            # a request before the commit must not cache the old rows anew
+            self.assertEqual(get_generations([Job, Skill]), generations)
+
+        self.assertNotEqual(get_generations([Job, Skill]), generations)
+        self.assertContains(self.client.get(self.url), "Flask Developer")
+
+    def test_authenticated_users_are_not_cached(self):
+        user = User.objects.create_user("pythonista", password="secret")
+        self.client.force_login(user)
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertIsNotNone(response.context)
+
+    def test_headers_are_restored(self):
+        calls = []
+
+        @cache_anonymous_page(Job)
+        def view(request):
+            calls.append(request)
+            response = HttpResponse("page")
+            response["Content-Language"] = "pt-br"
+            patch_vary_headers(response, ["Accept-Language"])
+            return response
+
+        for _ in range(2):
+            request = RequestFactory().get("/headers/")
+            request.user = AnonymousUser()
+            response = view(request)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(response["Content-Language"], "pt-br")
+        self.assertEqual(response["Vary"], "Accept-Language")
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from model_bakery import baker as mommy
+
+from pyjobs.core.models import Job
+from pyjobs.core.pagination import (
+    InvalidCursor,
+    KeysetPaginator,
+    decode_cursor,
+)
+
+
+class KeysetPaginatorTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        mommy.make(Job, _quantity=5, public=True)
+        # rows sharing a created_at are ordered by id
+        Job.objects.update(created_at=datetime(2021, 5, 1, 10, 0))
+        self.ids = list(Job.objects.order_by("-id").values_list("id", flat=True))
+        self.paginator = KeysetPaginator(Job.objects.all(), 2)
+
+    def test_walks_forward_and_backwards(self):
+        first = self.paginator.page()
+        second = self.paginator.page(first.next_cursor)
+        third = self.paginator.page(second.next_cursor)
+
+        self.assertEqual([job.pk for job in first], self.ids[:2])
+        self.assertEqual([job.pk for job in second], self.ids[2:4])
+        self.assertEqual([job.pk for job in third], self.ids[4:])
+        self.assertFalse(first.has_previous())
+        self.assertFalse(third.has_next())
+        self.assertIsNone(third.next_cursor)
+
+        back = self.paginator.page(third.previous_cursor)
+        self.assertEqual([job.pk for job in back], self.ids[2:4])
+        self.assertTrue(back.has_next())
+        self.assertTrue(back.has_previous())
+
+    def test_page_never_counts(self):
+        cursor = self.paginator.page().next_cursor
+
+        with self.assertNumQueries(1):
+            list(self.paginator.page(cursor))
+
+    def test_estimated_count(self):
+        self.assertEqual(self.paginator.estimated_count, 5)
+
+    def test_invalid_cursor(self):
+        for cursor in ("foo", "bm90IGEgY3Vyc29y", "eHwyMDIxLTA1LTAxfDE"):
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+
+class JobsViewCursorTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        mommy.make(Job, _quantity=15, public=True, title="Python Developer")
+
+    def test_listing_is_paginated_by_cursor(self):
+        response = self.client.get(reverse("jobs"), {"cursor": ""})
+        next_cursor = response.context["publicly_available_jobs"].next_cursor
+
+        self.assertEqual(len(response.context["publicly_available_jobs"]), 10)
+        self.assertContains(response, f"cursor={next_cursor}")
+
+        response = self.client.get(reverse("jobs"), {"cursor": next_cursor})
+        self.assertEqual(len(response.context["publicly_available_jobs"]), 5)
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_title_search_keeps_the_relevance_order(self, *_mocks):
+        best_match = mommy.make(Job, public=True, title="Python Python Developer")
+        # the oldest job, first anyway
+        Job.objects.filter(pk=best_match.pk).update(
+            created_at=datetime.now() - timedelta(days=5)
+        )
+
+        response = self.client.get(reverse("jobs"), {"title": "python"})
+        jobs = response.context["publicly_available_jobs"]
+        self.assertEqual(jobs[0], best_match)
+        self.assertEqual(len(jobs), 10)
+        self.assertEqual(list(response.context["pages"]), [1, 2])
+
+        response = self.client.get(reverse("jobs"), {"title": "python", "page": 2})
+        self.assertEqual(len(response.context["publicly_available_jobs"]), 6)
+
+    def test_invalid_cursor_redirects(self):
+        response = self.client.get(reverse("jobs"), {"cursor": "foo"})
+
+        self.assertRedirects(response, "/")
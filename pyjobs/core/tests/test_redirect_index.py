@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.redirects.models import Redirect
+from django.contrib.sites.shortcuts import get_current_site
+from django.http import HttpResponse, HttpResponseNotFound
+from django.test import RequestFactory, TestCase
+
+from pyjobs.core.redirect_index import bump_redirect_index_version, get_redirect_index
+from pyjobs.middleware import RedirectFallbackMiddleware
+
+
+@patch("pyjobs.core.redirect_index._index", None)
+class RedirectIndexTest(TestCase):
+    def setUp(self):
+        self.middleware = RedirectFallbackMiddleware(lambda request: HttpResponse())
+        self.redirect = Redirect.objects.create(
+            site_id=settings.SITE_ID, old_path="/old/", new_path="/new/"
+        )
+
+    def get(self, path):
+        request = RequestFactory().get(path)
+        return self.middleware.process_response(request, HttpResponseNotFound())
+
+    def warm_up(self):
+        get_redirect_index()
+        get_current_site(RequestFactory().get("/"))
+
+    def test_redirects_are_served_without_queries(self):
+        self.warm_up()
+        with self.assertNumQueries(0):
+            response = self.get("/old/?page=2")
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response["Location"], "/new/?page=2")
+
+    def test_misses_are_answered_without_queries(self):
+        self.warm_up()
+        with self.assertNumQueries(0):
+            response = self.get("/wp-login.php")
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "/")
+
+    def test_slash_is_appended(self):
+        self.assertEqual(self.get("/old")["Location"], "/new/")
+
+    def test_gone_pages(self):
+        Redirect.objects.create(
+            site_id=settings.SITE_ID, old_path="/gone/", new_path=""
+        )
+        self.assertEqual(self.get("/gone/").status_code, 410)
+
+    def test_signals_patch_the_local_index(self):
+        self.warm_up()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.redirect.old_path = "/older/"
+            self.redirect.save()
+            Redirect.objects.create(
+                site_id=settings.SITE_ID, old_path="/other/", new_path="/new/"
+            )
+            # nothing is patched before the transaction commits
+            self.assertEqual(self.get("/old/")["Location"], "/new/")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get("/older/")["Location"], "/new/")
+            self.assertEqual(self.get("/old/")["Location"], "/")
+            self.assertEqual(self.get("/other/")["Location"], "/new/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.redirect.delete()
+        self.assertEqual(self.get("/older/")["Location"], "/")
+
+    def test_rolled_back_changes_are_not_indexed(self):
+        self.warm_up()
+        with self.captureOnCommitCallbacks() as callbacks:
+            Redirect.objects.create(
+                site_id=settings.SITE_ID, old_path="/other/", new_path="/new/"
+            )
+        # the test transaction is rolled back, its callbacks never run
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.get("/other/")["Location"], "/")
+
+    def test_changes_from_other_processes_rebuild_the_index(self):
+        self.warm_up()
+        Redirect.objects.filter(pk=self.redirect.pk).update(new_path="/newer/")
+        self.assertEqual(self.get("/old/")["Location"], "/new/")
+
+        bump_redirect_index_version()
+        self.assertEqual(self.get("/old/")["Location"], "/newer/")
@@ -5,11 +5,14 @@ from django.http import HttpRequest
 from django.test import Client, TestCase, override_settings
 from django.urls import resolve, reverse
 from django.contrib.redirects.models import Redirect
+from django.core.management import call_command
 from django.conf import settings
+from django.core.cache import cache
 from model_bakery import baker as mommy
 import responses
 import json
 from datetime import datetime, timedelta
+from pyjobs.core.job_redirects import get_job_slug
 from pyjobs.core.models import Job, Profile, JobApplication
 from pyjobs.core.views import index, jobs
 from pyjobs.core.forms import JobApplicationForm
@@ -24,6 +27,7 @@ class RedirectTest(TestCase):
     def setUp(
         self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
     ):
+        cache.clear()  # job pks are reused between tests
         self.job = Job(
             title="Vaga 1",
             workplace="Sao Paulo",
@@ -44,3 +48,56 @@ class RedirectTest(TestCase):
         response = self.client.get(self.job_old_url, follow=True)
         self.assertEquals(response.redirect_chain[0][0], self.job_new_url)
         self.assertEquals(response.redirect_chain[0][1], 301)
+
+    def test_no_redirect_rows_are_created(self):
+        self.assertFalse(Redirect.objects.exists())
+
+    def test_other_job_urls_are_redirected(self):
+        old_url = reverse("applied_users_details", kwargs={"unique_slug": self.job.pk})
+        response = self.client.get(f"{old_url}?page=2")
+        new_url = reverse(
+            "applied_users_details", kwargs={"unique_slug": self.job.unique_slug}
+        )
+        self.assertRedirects(
+            response, f"{new_url}?page=2", 301, fetch_redirect_response=False
+        )
+
+    def test_unknown_jobs_go_home(self):
+        response = self.client.get(reverse("job_view", kwargs={"unique_slug": 999}))
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
+
+    def test_slug_is_cached_until_the_job_changes(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_job_slug(self.job.pk), self.job.unique_slug)
+            self.assertEqual(get_job_slug(self.job.pk), self.job.unique_slug)
+
+        old_slug = self.job.unique_slug
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.unique_slug = "vaga-1-xpto"
+            self.job.save()
+            # expired on commit, a request before it would cache the old slug
+            self.assertEqual(get_job_slug(self.job.pk), old_slug)
+        self.assertEqual(get_job_slug(self.job.pk), "vaga-1-xpto")
+
+    def test_prune_job_redirects(self):
+        def create_redirect(old_path, new_path):
+            return Redirect.objects.create(
+                site_id=settings.SITE_ID, old_path=old_path, new_path=new_path
+            )
+
+        create_redirect(self.job_old_url, self.job_new_url)
+        create_redirect(
+            reverse("thumbnail_view", kwargs={"unique_slug": self.job.pk}),
+            reverse("thumbnail_view", kwargs={"unique_slug": self.job.unique_slug}),
+        )
+        create_redirect("/job/999/", "/job/vaga-que-sumiu/")
+        custom = create_redirect(f"/job/{self.job.pk}/app/", "/jobs/")
+        other = create_redirect("/vagas/", "/jobs/")
+
+        out = io.StringIO()
+        call_command("prune_job_redirects", batch_size=2, stdout=out)
+
+        self.assertEqual(set(Redirect.objects.all()), {custom, other})
+        self.assertIn("5 redirects checked, 3 deleted", out.getvalue())
+        response = self.client.get(self.job_old_url)
+        self.assertRedirects(response, self.job_new_url, 301, 200)
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery import baker as mommy
+
+from pyjobs.core.models import Job, SimilarJob, Skill
+from pyjobs.core.similarity import jaccard, refresh_similar_jobs_of
+from pyjobs.tasks.models import Task
+from pyjobs.tasks.queue import PENDING, get_task_name, run_pending_tasks
+
+
+class SimilarJobsTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.python, self.django, self.flask = mommy.make(Skill, _quantity=3)
+        self.job = mommy.make(Job, public=True)
+        self.job.skills.set([self.python, self.django])
+        self.django_job = mommy.make(Job, public=True)
+        self.django_job.skills.set([self.python, self.django])
+        self.flask_job = mommy.make(Job, public=True)
+        self.flask_job.skills.set([self.python, self.flask])
+        self.go_job = mommy.make(Job, public=True)
+        run_pending_tasks(limit=100)
+
+    def get_similar(self, job):
+        return list(
+            SimilarJob.objects.filter(job=job).values_list("similar_id", "score")
+        )
+
+    def get_pending_refreshes(self):
+        return list(
+            Task.objects.filter(
+                name=get_task_name(refresh_similar_jobs_of), status=PENDING
+            ).values_list("payload", flat=True)
+        )
+
+    def test_jaccard(self):
+        self.assertEqual(jaccard({1, 2}, {2, 3}), 1 / 3)
+        self.assertEqual(jaccard(set(), {1}), 0)
+
+    def test_skills_changes_refresh_the_table(self):
+        self.assertEqual(
+            self.get_similar(self.job),
+            [(self.django_job.pk, 1.0), (self.flask_job.pk, 1 / 3)],
+        )
+        self.assertIn((self.job.pk, 1 / 3), self.get_similar(self.flask_job))
+        self.assertEqual(self.get_similar(self.go_job), [])
+
+    def test_removing_skills_drops_the_job(self):
+        self.flask_job.skills.clear()
+        run_pending_tasks()
+
+        self.assertEqual(self.get_similar(self.flask_job), [])
+        self.assertNotIn(
+            self.flask_job.pk,
+            [similar for similar, _ in self.get_similar(self.job)],
+        )
+
+    def test_skills_changes_are_refreshed_by_the_queue(self):
+        self.flask_job.skills.set([self.django])
+
+        self.assertIn((self.flask_job.pk, 1 / 3), self.get_similar(self.job))
+        self.assertEqual(self.get_pending_refreshes(), [{"job_id": self.flask_job.pk}])
+
+        run_pending_tasks()
+
+        self.assertIn((self.flask_job.pk, 1 / 2), self.get_similar(self.job))
+        self.assertEqual(self.get_pending_refreshes(), [])
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_expired_jobs_do_not_crowd_out_new_ones(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        Job.objects.filter(pk=self.django_job.pk).update(
+            created_at=datetime.now() - timedelta(days=31)
+        )
+        with patch("pyjobs.core.similarity.SIMILAR_JOBS_LIMIT", 2):
+            job = mommy.make(Job, public=True)
+            job.skills.set([self.python, *mommy.make(Skill, _quantity=2)])
+            run_pending_tasks(limit=100)
+
+        self.assertEqual(
+            self.get_similar(self.job), [(self.flask_job.pk, 1 / 3), (job.pk, 1 / 4)]
+        )
+
+    def test_jobs_losing_a_similar_job_are_refilled(self):
+        with patch("pyjobs.core.similarity.SIMILAR_JOBS_LIMIT", 1):
+            call_command("rebuild_similar_jobs", stdout=StringIO())
+            self.assertEqual(self.get_similar(self.job), [(self.django_job.pk, 1.0)])
+
+            self.django_job.skills.set([self.flask])
+            run_pending_tasks()  # the refresh of django_job
+            run_pending_tasks()  # the refill of the jobs it was dropped from
+
+        self.assertEqual(self.get_similar(self.job), [(self.flask_job.pk, 1 / 3)])
+
+    def test_rebuild_command(self):
+        expected = {job.pk: self.get_similar(job) for job in Job.objects.all()}
+        SimilarJob.objects.all().delete()
+
+        call_command("rebuild_similar_jobs", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(
+            {job.pk: self.get_similar(job) for job in Job.objects.all()}, expected
+        )
+
+    def test_old_jobs_are_not_recommended(self):
+        Job.objects.filter(pk=self.django_job.pk).update(
+            created_at=datetime.now() - timedelta(days=31)
+        )
+        call_command("rebuild_similar_jobs", stdout=StringIO())
+
+        self.assertEqual(self.get_similar(self.job), [(self.flask_job.pk, 1 / 3)])
+
+    def test_job_view_reads_the_table(self):
+        response = self.client.get(f"/job/{self.job.unique_slug}/")
+
+        self.assertEqual(
+            list(response.context["similar_jobs"]), [self.django_job, self.flask_job]
+        )
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from model_bakery import baker as mommy
+
+from pyjobs.core.filters import JobFilter
+from pyjobs.core.models import Job, Skill
+from pyjobs.core.snapshot import (
+    ActiveJobsSnapshot,
+    get_active_jobs_snapshot,
+    invalidate_active_jobs_snapshot,
+)
+
+
+class ActiveJobsSnapshotTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        cache.clear()
+        invalidate_active_jobs_snapshot()
+        self.skill = mommy.make(Skill, name="Django")
+        self.old_job = mommy.make(Job, state=24, public=True)
+        self.new_job = mommy.make(Job, state=24, remote=True, public=True)
+        self.premium_job = mommy.make(Job, state=18, premium=True, public=True)
+        mommy.make(Job, public=False)
+        self.new_job.skills.add(self.skill)
+
+    def tearDown(self):
+        invalidate_active_jobs_snapshot()
+
+    def test_select_returns_public_jobs_newest_first(self):
+        snapshot = ActiveJobsSnapshot.build()
+
+        self.assertEqual(
+            snapshot.select(),
+            [self.premium_job.pk, self.new_job.pk, self.old_job.pk],
+        )
+
+    def test_select_filters(self):
+        snapshot = ActiveJobsSnapshot.build()
+
+        self.assertEqual(snapshot.select(premium=True), [self.premium_job.pk])
+        self.assertEqual(snapshot.select(state=24, remote=True), [self.new_job.pk])
+        self.assertEqual(snapshot.select(skill=self.skill.pk), [self.new_job.pk])
+        self.assertEqual(snapshot.select(limit=1), [self.premium_job.pk])
+
+    def test_select_ignores_jobs_out_of_the_window(self):
+        snapshot = ActiveJobsSnapshot.build()
+        self.old_job.created_at = datetime.now() - timedelta(days=31)
+        snapshot.upsert(self.old_job)
+
+        self.assertNotIn(self.old_job.pk, snapshot.select())
+
+    def test_build_runs_a_fixed_number_of_queries(self):
+        with self.assertNumQueries(3):
+            ActiveJobsSnapshot.build()
+
+    def test_facet_rows_match_the_database(self):
+        snapshot = ActiveJobsSnapshot.build()
+        job_filter = JobFilter({"remote": "true"}, queryset=Job.get_active_jobs())
+
+        self.assertEqual(
+            job_filter.facets(rows=snapshot.facet_rows()), job_filter.facets()
+        )
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_signals_patch_the_snapshot(self, *_mocks):
+        snapshot = get_active_jobs_snapshot()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job = mommy.make(Job, public=True)
+            job.skills.add(self.skill)
+            self.old_job.delete()
+            self.new_job.public = False
+            self.new_job.save()
+
+            # nothing is patched before the transaction commits
+            self.assertEqual(len(snapshot.select()), 3)
+
+        patched = get_active_jobs_snapshot()
+        self.assertEqual(patched.select(skill=self.skill.pk), [job.pk])
+        self.assertEqual(patched.select(), [job.pk, self.premium_job.pk])
+        # requests still reading the previous snapshot see it unchanged
+        self.assertEqual(len(snapshot.select()), 3)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_active_jobs_snapshot(), patched)
+
+    def test_job_listing_is_served_from_the_snapshot(self):
+        get_active_jobs_snapshot()
+
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("jobs"))
+
+        self.assertEqual(
+            [job.pk for job in response.context["publicly_available_jobs"]],
+            [self.new_job.pk, self.old_job.pk],
+        )
+        self.assertEqual(
+            [job.pk for job in response.context["premium_available_jobs"]],
+            [self.premium_job.pk],
+        )
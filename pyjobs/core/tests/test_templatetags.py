@@ -35,3 +35,34 @@ class TestMergeQueryParamsTag(SimpleTestCase):
             '<a class="page-link" href="/?description=descricao&salary_range=1&page=10">1</a>',
             rendered_template,
         )
+
+
+class TestToggleQueryParamTag(SimpleTestCase):
+    def setUp(self):
+        self.rf = RequestFactory()
+        self.template = Template(
+            "{% load core_tags %}"
+            '<a href="/?{% toggle_query_param "remote" "True" %}">remote</a>'
+        )
+
+    def test_add_param_and_reset_page(self):
+        request = self.rf.get("/", {"salary_range": 1, "page": 2})
+        rendered_template = self.template.render(Context({"request": request}))
+
+        self.assertInHTML(
+            '<a href="/?salary_range=1&remote=True">remote</a>', rendered_template
+        )
+
+    def test_add_param_and_reset_cursor(self):
+        request = self.rf.get("/", {"salary_range": 1, "cursor": "abc"})
+        rendered_template = self.template.render(Context({"request": request}))
+
+        self.assertInHTML(
+            '<a href="/?salary_range=1&remote=True">remote</a>', rendered_template
+        )
+
+    def test_remove_selected_param(self):
+        request = self.rf.get("/", {"salary_range": 1, "remote": "True"})
+        rendered_template = self.template.render(Context({"request": request}))
+
+        self.assertInHTML('<a href="/?salary_range=1">remote</a>', rendered_template)
@@ -0,0 +1,98 @@
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils.translation import override
+from model_bakery import baker as mommy
+
+from pyjobs.core.models import Job
+from pyjobs.core.thumbnails import get_thumbnail_key, is_thumbnail_cached
+from pyjobs.core.utils import generate_thumbnail
+
+
+class ThumbnailCacheTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        self.folder = TemporaryDirectory()
+        self.settings = override_settings(THUMBNAILS_CACHE_FOLDER=self.folder.name)
+        self.settings.enable()
+        self.job = mommy.make(Job, title="Desenvolvedor Python")
+        self.url = f"/thumb/{self.job.unique_slug}/"
+
+    def tearDown(self):
+        self.settings.disable()
+        self.folder.cleanup()
+
+    def test_key_depends_on_the_inputs(self):
+        key = get_thumbnail_key("job", "Python")
+
+        self.assertEqual(key, get_thumbnail_key("job", "Python"))
+        self.assertNotEqual(key, get_thumbnail_key("quiz", "Python"))
+        self.assertNotEqual(key, get_thumbnail_key("job", "Django"))
+        with override("en"):
+            self.assertNotEqual(key, get_thumbnail_key("job", "Python"))
+
+    @patch("pyjobs.core.views.generate_thumbnail", wraps=generate_thumbnail)
+    def test_thumbnail_is_rendered_once(self, mocked_generate_thumbnail):
+        first = self.client.get(self.url)
+        second = self.client.get(self.url)
+
+        self.assertEqual(mocked_generate_thumbnail.call_count, 1)
+        self.assertEqual(first["Content-Type"], "image/png")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_conditional_requests(self):
+        response = self.client.get(self.url)
+
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+        not_modified = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    @patch("pyjobs.core.views.generate_thumbnail")
+    def test_unknown_jobs_go_home(self, mocked_generate_thumbnail):
+        # the view raises Http404, RedirectFallbackMiddleware sends it home
+        response = self.client.get("/thumb/foo/")
+
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
+        mocked_generate_thumbnail.assert_not_called()
+
+    def test_prerender_command(self):
+        out = StringIO()
+        call_command("prerender_thumbnails", processes=2, stdout=out)
+
+        self.assertIn("2 thumbnails rendered, 0 already cached", out.getvalue())
+        for language in ("pt", "en"):
+            with override(language):
+                self.assertTrue(is_thumbnail_cached("job", self.job.title))
+
+        out = StringIO()
+        call_command("prerender_thumbnails", processes=2, stdout=out)
+        self.assertIn("0 thumbnails rendered, 2 already cached", out.getvalue())
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_prerender_on_create(self, *_mocks):
+        with override_settings(PRERENDER_THUMBNAILS_ON_CREATE=True):
+            job = mommy.make(Job, title="Desenvolvedora Django", public=True)
+
+        self.assertTrue(is_thumbnail_cached("job", job.title))
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_no_prerender_on_create_by_default(self, *_mocks):
+        job = mommy.make(Job, title="Desenvolvedora Django", public=True)
+
+        self.assertFalse(is_thumbnail_cached("job", job.title))
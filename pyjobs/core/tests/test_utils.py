@@ -66,6 +66,44 @@ class HTMLEmailSenderTest(TestCase):
         self.assertTrue(msg.subject == self.subject)
         self.assertTrue(msg.to == self.to_emails)
 
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_bulk_rendering_matches_one_by_one(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        from benchmarks.legacy import render_legacy_email
+
+        jobs = mommy.make(Job, _quantity=2)
+        emails = [
+            ({"vaga": jobs[count % 2]}, f"Subject {count}", [f"{count}@localhost"])
+            for count in range(4)
+        ]
+
+        messages = get_emails_with_template(self.template_name, emails)
+
+        self.assertEqual(len(messages), 4)
+        for message, email in zip(messages, emails):
+            legacy = render_legacy_email(self.template_name, *email)
+            self.assertEqual(message.subject, legacy.subject)
+            self.assertEqual(message.to, legacy.to)
+            self.assertEqual(message.body, legacy.body)
+            self.assertEqual(message.alternatives, legacy.alternatives)
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_bulk_rendering_computes_job_urls_once(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        job = mommy.make(Job)
+        emails = [({"vaga": job}, self.subject, self.to_emails)] * 3
+
+        with patch.object(Job, "close_hash", return_value="a" * 128) as close_hash:
+            get_emails_with_template(self.template_name, emails)
+
+        close_hash.assert_called_once()
+
 
 class ThumbnailCreationTest(TestCase):
     @patch("pyjobs.marketing.triggers.send_group_notification")
@@ -87,3 +125,15 @@ class ThumbnailCreationTest(TestCase):
     def test_if_generated_object_is_valid(self):
         generated_thumbnail = generate_thumbnail(self.job)
         self.assertIsInstance(generated_thumbnail, Image.Image)
+
+    def test_compositor_draws_the_same_as_the_legacy_code(self):
+        from benchmarks.legacy import render_legacy_thumbnail
+
+        generated_thumbnail = generate_thumbnail(self.job)
+        legacy_thumbnail = render_legacy_thumbnail("job", self.job.title)
+        self.assertEqual(generated_thumbnail.tobytes(), legacy_thumbnail.tobytes())
+
+    def test_compositor_is_built_once(self):
+        compositor = get_thumbnail_compositor("job")
+        generate_thumbnail(self.job)
+        self.assertIs(get_thumbnail_compositor("job"), compositor)
@@ -1,8 +1,9 @@
+from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
 from django.http import HttpRequest
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 from django.urls import resolve, reverse
 from model_bakery import baker as mommy
 import responses
@@ -28,6 +29,13 @@ class ThumbnailTestingViews(TestCase):
         )
         self.job.save()
         self.client = Client()
+        self.thumbnails_folder = TemporaryDirectory()
+        self.addCleanup(self.thumbnails_folder.cleanup)
+        thumbnails_settings = override_settings(
+            THUMBNAILS_CACHE_FOLDER=self.thumbnails_folder.name
+        )
+        thumbnails_settings.enable()
+        self.addCleanup(thumbnails_settings.disable)
 
     def test_return_thumbnail_endpoint_status_code(self):
         response = self.client.get(
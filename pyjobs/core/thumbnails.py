@@ -0,0 +1,120 @@
+"""
+Render cache for the social network thumbnails.
+
+A thumbnail only depends on its kind (job or quiz), its title, the website
+name and the active language, so the PNG is rendered once per combination and
+kept on disk under ``THUMBNAILS_CACHE_FOLDER``, named after a hash of those
+inputs. The same hash is the response's ETag: crawlers coming back with it
+get a 304 without the file even being opened.
+"""
+
+import os
+from hashlib import sha256
+from multiprocessing import Pool, cpu_count
+from tempfile import NamedTemporaryFile
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_response_headers
+from django.utils.http import http_date
+from django.db import connections
+from django.utils import translation
+from django.utils.translation import get_language
+
+# bump when the drawing code changes so old renders are not served
+THUMBNAIL_RENDER_VERSION = 1
+THUMBNAIL_MAX_AGE = 60 * 60 * 24
+
+
+def get_thumbnail_key(kind, title):
+    inputs = "\0".join(
+        map(
+            str,
+            (
+                THUMBNAIL_RENDER_VERSION,
+                kind,
+                title,
+                settings.WEBSITE_NAME,
+                get_language(),
+            ),
+        )
+    )
+    return sha256(inputs.encode()).hexdigest()
+
+
+def get_thumbnail_path(key):
+    return os.path.join(settings.THUMBNAILS_CACHE_FOLDER, key[:2], f"{key}.png")
+
+
+def save_thumbnail(path, image):
+    """Writes the PNG atomically, concurrent renders of the same key are fine."""
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    with NamedTemporaryFile(dir=folder, suffix=".tmp", delete=False) as temporary:
+        image.save(temporary, "PNG")
+    os.replace(temporary.name, path)
+
+
+def get_thumbnail(kind, title, render):
+    """Returns the cache path of the thumbnail, calling ``render()`` to draw
+    it (a PIL image) if it was not cached yet."""
+    path = get_thumbnail_path(get_thumbnail_key(kind, title))
+    if not os.path.exists(path):
+        save_thumbnail(path, render())
+    return path
+
+
+def thumbnail_response(request, kind, title, render):
+    key = get_thumbnail_key(kind, title)
+    etag = f'"{key}"'
+
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        return response
+
+    path = get_thumbnail(kind, title, render)
+    last_modified = os.path.getmtime(path)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified)
+    )
+    if response is None:
+        with open(path, "rb") as thumbnail:
+            response = HttpResponse(thumbnail.read(), content_type="image/png")
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_response_headers(response, THUMBNAIL_MAX_AGE)
+    return response
+
+
+def is_thumbnail_cached(kind, title):
+    return os.path.exists(get_thumbnail_path(get_thumbnail_key(kind, title)))
+
+
+def prerender_thumbnail(task):
+    """Renders one ``(kind, title, language)`` thumbnail unless it is cached.
+    Returns whether it was rendered."""
+    from pyjobs.core.utils import get_thumbnail_compositor
+
+    kind, title, language = task
+    with translation.override(language):
+        if is_thumbnail_cached(kind, title):
+            return False
+        get_thumbnail(kind, title, lambda: get_thumbnail_compositor(kind).render(title))
+    return True
+
+
+def prerender_thumbnails(tasks, processes=None):
+    """
+    Renders the ``(kind, title, language)`` thumbnails across a pool of
+    processes, one per CPU by default. Yields whether each one was rendered.
+    """
+    # the forked workers must not share the parent's database connections
+    connections.close_all()
+    with Pool(processes or cpu_count()) as pool:
+        yield from pool.imap_unordered(prerender_thumbnail, tasks, chunksize=16)
+
+
+def prerender_job_thumbnail(job):
+    for language, _name in settings.LANGUAGES:
+        prerender_thumbnail(("job", job.title, language))
@@ -1,13 +1,25 @@
 from django.conf import settings
-from django.db.models.signals import post_save, pre_save
+from django.contrib.redirects.models import Redirect
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from github import Github
 
 from webpush import send_group_notification
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import User
-from pyjobs.core.models import Profile
+from pyjobs.core.conditional_get import touch_jobs_changed_at
+from pyjobs.core.context_processors import invalidate_social_login_state
+from pyjobs.core.job_redirects import invalidate_job_slug
+from pyjobs.core.models import Job, Profile, Skill
+from pyjobs.core.page_cache import bump_generation
+from pyjobs.core.redirect_index import patch_redirect_index
+from pyjobs.core.search import remove_job_from_search_index
+from pyjobs.core.similarity import schedule_similar_jobs_refresh
+from pyjobs.core.snapshot import patch_active_jobs_snapshot
+from pyjobs.core.thumbnails import prerender_job_thumbnail
 
+from pyjobs.partners.models import Partner
 from social_django.models import UserSocialAuth
 
 
@@ -17,3 +29,105 @@ def new_user_created_via_social_network(sender, instance, created, **kwargs):
         return
 
     Profile.objects.create(user=instance.user)
+
+
+@receiver(post_delete, sender=Job)
+def remove_deleted_job_from_search_index(sender, instance, using, **kwargs):
+    remove_job_from_search_index(instance.pk, using)
+
+
+@receiver(post_save, sender=Job)
+def update_active_jobs_snapshot(sender, instance, **kwargs):
+    patch_active_jobs_snapshot(lambda snapshot: snapshot.upsert(instance))
+
+
+@receiver(post_delete, sender=Job)
+def remove_deleted_job_from_active_jobs_snapshot(sender, instance, **kwargs):
+    pk = instance.pk  # patched on commit, once Django has cleared instance.pk
+    patch_active_jobs_snapshot(lambda snapshot: snapshot.remove(pk))
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def update_active_jobs_snapshot_skills(sender, instance, action, reverse, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if reverse:
+        # skill.job_set changed, the affected jobs are not at hand
+        patch_active_jobs_snapshot(None)
+        return
+
+    skill_ids = list(instance.skills.values_list("pk", flat=True))
+    patch_active_jobs_snapshot(
+        lambda snapshot: snapshot.set_skills(instance.pk, skill_ids)
+    )
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def expire_cached_job_slug(sender, instance, **kwargs):
+    # before the commit a concurrent request would cache the old slug again
+    pk = instance.pk
+    transaction.on_commit(lambda: invalidate_job_slug(pk))
+
+
+@receiver(post_save, sender=Redirect)
+def update_redirect_index(sender, instance, **kwargs):
+    patch_redirect_index(lambda index: index.upsert(instance))
+
+
+@receiver(post_delete, sender=Redirect)
+def remove_deleted_redirect_from_index(sender, instance, **kwargs):
+    pk = instance.pk  # patched on commit, once Django has cleared instance.pk
+    patch_redirect_index(lambda index: index.remove(pk))
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=Partner)
+@receiver(post_delete, sender=Partner)
+def expire_cached_pages(sender, **kwargs):
+    # a request racing the commit would cache the old rows under the new key
+    transaction.on_commit(lambda: bump_generation(sender))
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def expire_conditional_get_validators(sender, **kwargs):
+    # a request validated before the commit would keep the old page cached
+    transaction.on_commit(touch_jobs_changed_at)
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def expire_cached_pages_on_skills_change(sender, action, **kwargs):
+    if action.startswith("post_"):
+        transaction.on_commit(lambda: bump_generation(Job))
+
+
+@receiver(post_save, sender=UserSocialAuth)
+@receiver(post_delete, sender=UserSocialAuth)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def expire_social_login_state(sender, instance, **kwargs):
+    invalidate_social_login_state(instance.user_id)
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def update_similar_jobs(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        schedule_similar_jobs_refresh(instance.pk)
+        return
+
+    for job_id in pk_set or ():
+        schedule_similar_jobs_refresh(job_id)
+
+
+@receiver(post_save, sender=Job)
+def prerender_new_job_thumbnail(sender, instance, created, **kwargs):
+    if created and instance.public and settings.PRERENDER_THUMBNAILS_ON_CREATE:
+        prerender_job_thumbnail(instance)
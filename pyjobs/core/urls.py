@@ -3,6 +3,7 @@ from django.contrib.sitemaps import Sitemap
 from django.contrib.sitemaps.views import sitemap
 from django.urls import reverse
 
+from pyjobs.blog.cache import BlogUnavailable, get_blog_response
 from pyjobs.core.models import Job, Skill
 from pyjobs.core.views import *
 
@@ -13,7 +14,12 @@ class BlogBasedSitemap(Sitemap):
 
     def items(self):
         posts = []
-        post_request = requests.get(f"{settings.BLOG_API_URL}posts/").json()
+        try:
+            status_code, post_request = get_blog_response("posts/")
+        except BlogUnavailable:
+            return posts
+        if status_code != 200:
+            return posts
         for post in post_request["posts"]:
             posts.append(post["slug"])
 
@@ -101,14 +107,14 @@ urlpatterns = [
     url(r"^privacy/$", privacy, name="privacy"),
     url(r"^summary/$", summary_view, name="job_view"),
     url(r"^services/$", services_view, name="services"),
-    url(r"^contact/$", contact, name="contact"),
+    url(r"^contact/$", async_contact, name="contact"),
     url(r"^user/$", pythonistas_area, name="pythonistas_area"),
-    url(r"^user/signup/$", pythonistas_signup, name="pythonistas_signup"),
+    url(r"^user/signup/$", async_pythonistas_signup, name="pythonistas_signup"),
     url(r"^user/password/$", pythonista_change_password, name="change_password"),
     url(r"^user/info/$", pythonista_change_info, name="change_info"),
     url(r"^user/applied-to/$", pythonista_applied_info, name="applied_to_info"),
     url(r"^user/proficiency/$", pythonistas_proficiency, name="user_proficiency"),
-    url(r"^job/create/$", job_creation, name="job_creation"),
+    url(r"^job/create/$", async_job_creation, name="job_creation"),
     url(r"^jobs/location/(?P<state>[-\w\d]+)/$", job_state_view, name="job_state_view"),
     url(
         r"^jobs/skill/(?P<unique_slug>[-\w\d]+)/$",
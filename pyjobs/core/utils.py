@@ -1,102 +1,83 @@
 import textwrap
 from django.conf import settings
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 from PIL import Image, ImageDraw, ImageFont
 
+THUMBNAIL_SIZE = (1280, 720)
+THUMBNAIL_KINDS = {
+    "job": ("thumb_base.png", _("Nova Oportunidade:")),
+    "quiz": ("thumb_quiz.jpg", _("Quiz:")),
+}
+
+
+class ThumbnailCompositor:
+    """
+    Draws the thumbnails of one kind (see ``THUMBNAIL_KINDS``). The fonts and
+    the resized, darkened base image are loaded once, and the header and
+    footer, which only change with the language and the website name, are
+    drawn once on a copy of it. Rendering a title copies that layer and draws
+    the title lines.
+    """
+
+    def __init__(self, base_image, header):
+        folder = settings.THUMBNAILS_BASE_FOLDER
+        self.font = ImageFont.truetype(f"{folder}Montserrat/Montserrat-Medium.ttf", 60)
+        self.bold_font = ImageFont.truetype(
+            f"{folder}Montserrat/Montserrat-Bold.ttf", 60
+        )
+        self.header = header
+
+        canvas = Image.open(f"{folder}{base_image}").resize(THUMBNAIL_SIZE)
+        overlay = Image.new("RGB", THUMBNAIL_SIZE, color=0)
+        overlay.putalpha(175)
+        canvas.paste(overlay, (0, 0), overlay)
+        self.canvas = canvas
+        self.layers = {}
+
+    def draw_centered(self, draw, text, top, font, **kwargs):
+        width, _height = draw.textsize(text, font=font)
+        draw.text(((THUMBNAIL_SIZE[0] - width) / 2, top), text, font=font, **kwargs)
+
+    def get_layer(self):
+        key = (get_language(), settings.WEBSITE_NAME)
+        if key not in self.layers:
+            layer = self.canvas.copy()
+            draw = ImageDraw.Draw(layer)
+            self.draw_centered(draw, str(self.header), 90, self.font, fill="white")
+            self.draw_centered(
+                draw,
+                " ".join([str(_("Via")), settings.WEBSITE_NAME]),
+                500,
+                self.font,
+                fill="white",
+            )
+            self.layers[key] = layer
+        return self.layers[key]
+
+    def render(self, title):
+        image = self.get_layer().copy()
+        draw = ImageDraw.Draw(image)
+
+        offset = 225
+        for line in textwrap.wrap(title, width=25):
+            self.draw_centered(draw, line, offset, self.bold_font)
+            offset += self.bold_font.getsize(line)[1]
+
+        return image
+
+
+_compositors = {}
+
+
+def get_thumbnail_compositor(kind):
+    if kind not in _compositors:
+        _compositors[kind] = ThumbnailCompositor(*THUMBNAIL_KINDS[kind])
+    return _compositors[kind]
 
-def generate_thumbnail(job):
-    font_path = "{}Montserrat/Montserrat-Medium.ttf".format(
-        settings.THUMBNAILS_BASE_FOLDER
-    )
-    font_bold_path = "{}Montserrat/Montserrat-Bold.ttf".format(
-        settings.THUMBNAILS_BASE_FOLDER
-    )
-
-    font_med_cntr = ImageFont.truetype(font_path, 60)
-    font_bold_cntr = ImageFont.truetype(font_bold_path, 60)
-
-    im = Image.open("{}thumb_base.png".format(settings.THUMBNAILS_BASE_FOLDER))
-    im = im.resize((1280, 720))
-
-    image_overlay = Image.new("RGB", (1280, 720), color=0)
-
-    image_overlay.putalpha(175)
-
-    im.paste(image_overlay, (0, 0), image_overlay)
 
-    draw = ImageDraw.Draw(im)
-
-    w, nothing = draw.textsize(str(_("Nova Oportunidade:")), font=font_med_cntr)
-    draw.text(
-        ((1280 - w) / 2, 90),
-        text=str(_("Nova Oportunidade:")),
-        fill="white",
-        font=font_med_cntr,
-    )
-
-    offset = 225
-    for line in textwrap.wrap(job.title, width=25):
-        w, nothing = draw.textsize(line, font=font_bold_cntr)
-        draw.text(((1280 - w) / 2, offset), line, font=font_bold_cntr)
-        offset += font_bold_cntr.getsize(line)[1]
-
-    w, nothing = draw.textsize(
-        " ".join([str(_("Via")), settings.WEBSITE_NAME]), font=font_med_cntr
-    )
-    draw.text(
-        ((1280 - w) / 2, 500),
-        text=" ".join([str(_("Via")), settings.WEBSITE_NAME]),
-        fill="white",
-        font=font_med_cntr,
-    )
-
-    return im
+def generate_thumbnail(job):
+    return get_thumbnail_compositor("job").render(job.title)
 
 
 def generate_thumbnail_quiz(quiz):
-    font_path = "{}Montserrat/Montserrat-Medium.ttf".format(
-        settings.THUMBNAILS_BASE_FOLDER
-    )
-    font_bold_path = "{}Montserrat/Montserrat-Bold.ttf".format(
-        settings.THUMBNAILS_BASE_FOLDER
-    )
-
-    font_med_cntr = ImageFont.truetype(font_path, 60)
-    font_bold_cntr = ImageFont.truetype(font_bold_path, 60)
-
-    im = Image.open("{}thumb_quiz.jpg".format(settings.THUMBNAILS_BASE_FOLDER))
-    im = im.resize((1280, 720))
-
-    image_overlay = Image.new("RGB", (1280, 720), color=0)
-
-    image_overlay.putalpha(175)
-
-    im.paste(image_overlay, (0, 0), image_overlay)
-
-    draw = ImageDraw.Draw(im)
-
-    w, nothing = draw.textsize(str(_("Quiz:")), font=font_med_cntr)
-    draw.text(
-        ((1280 - w) / 2, 90),
-        text=str(_("Quiz:")),
-        fill="white",
-        font=font_med_cntr,
-    )
-
-    offset = 225
-    for line in textwrap.wrap(quiz.name, width=25):
-        w, nothing = draw.textsize(line, font=font_bold_cntr)
-        draw.text(((1280 - w) / 2, offset), line, font=font_bold_cntr)
-        offset += font_bold_cntr.getsize(line)[1]
-
-    w, nothing = draw.textsize(
-        " ".join([str(_("Via")), settings.WEBSITE_NAME]), font=font_med_cntr
-    )
-    draw.text(
-        ((1280 - w) / 2, 500),
-        text=" ".join([str(_("Via")), settings.WEBSITE_NAME]),
-        fill="white",
-        font=font_med_cntr,
-    )
-
-    return im
+    return get_thumbnail_compositor("quiz").render(quiz.name)
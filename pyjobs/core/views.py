@@ -1,5 +1,6 @@
 import csv
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import login, update_session_auth_hash, authenticate
@@ -10,15 +11,25 @@ from django.contrib.sites.models import Site
 from django.contrib.syndication.views import Feed
 from django.core.paginator import Paginator
 from django.http import Http404, HttpResponse
-from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404, redirect, render, resolve_url
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from datetime import datetime, timedelta
 
+from pyjobs.core.conditional_get import jobs_conditional_get
 from pyjobs.core.forms import *
 from pyjobs.core.models import Job, JobApplication, Profile, Skill, SkillProficiency
 from pyjobs.core.filters import JobFilter
+from pyjobs.core.page_cache import cache_anonymous_page
+from pyjobs.core.pagination import InvalidCursor, KeysetPaginator
+from pyjobs.core.snapshot import (
+    StaleSnapshot,
+    get_active_jobs_snapshot,
+    hydrate_jobs,
+)
+from pyjobs.core.thumbnails import thumbnail_response
 from pyjobs.core.utils import generate_thumbnail
+from pyjobs.marketing.push import get_skill_group, get_state_group
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import activate
 from social_django.models import UserSocialAuth
@@ -32,11 +43,21 @@ except:
 
 WEBPUSH_CONTEXT = {"group": "general"}
 
+# the feeds list the jobs of the last days, their validators also change
+# hourly so the jobs that age out leave the readers' copies
+FEED_VALIDATORS_PERIOD = 60 * 60
 
+
+@cache_anonymous_page(Job, Skill)
 def index(request):
-    publicly_available_jobs = Job.get_index_display_jobs()
+    try:
+        publicly_available_jobs = hydrate_jobs(
+            get_active_jobs_snapshot().select(limit=9)
+        )
+    except StaleSnapshot:
+        publicly_available_jobs = Job.get_index_display_jobs()
 
-    user_filtered_query_set = JobFilter(request.GET, queryset=publicly_available_jobs)
+    user_filtered_query_set = JobFilter(request.GET, queryset=Job.objects.none())
 
     context_dict = {
         "publicly_available_jobs": publicly_available_jobs,
@@ -55,41 +76,134 @@ def privacy(request):
     )
 
 
-def jobs(request):
-    publicly_available_jobs = Job.get_publicly_available_jobs()
-    publicly_available_premium_jobs = Job.get_premium_jobs()
+def _snapshot_listing(job_filter, page_number, filters):
+    snapshot = get_active_jobs_snapshot()
+    selection = job_filter.get_facet_selection()
+
+    paginator = Paginator(snapshot.select(premium=False, **filters, **selection), 10)
+    if page_number > paginator.num_pages:
+        return None
 
-    user_filtered_query_set = JobFilter(request.GET, queryset=publicly_available_jobs)
-    premium_filtered_query_set = JobFilter(
-        request.GET, queryset=publicly_available_premium_jobs
+    public_jobs_to_display = paginator.page(page_number)
+    public_jobs_to_display.object_list = hydrate_jobs(
+        public_jobs_to_display.object_list
     )
+    return {
+        "publicly_available_jobs": public_jobs_to_display,
+        "premium_available_jobs": hydrate_jobs(
+            snapshot.select(premium=True, limit=10, **filters, **selection)
+        ),
+        "pages": paginator.page_range,
+        "this_page": page_number,
+        "facets": job_filter.facets(rows=snapshot.facet_rows(**filters)),
+    }
 
-    paginator = Paginator(user_filtered_query_set.qs, 10)
-    premium_paginator = Paginator(premium_filtered_query_set.qs, 10)
 
-    try:
-        page_number = int(request.GET.get("page", 1))
-    except ValueError:
-        return redirect("/")
+def _queryset_listing(request, filters):
+    if "skill" in filters:
+        filters = {"skills": filters["skill"]}
 
-    if page_number > paginator.num_pages:
-        return redirect("/")
+    publicly_available_jobs = JobFilter(
+        request.GET, queryset=Job.get_publicly_available_jobs().filter(**filters)
+    ).qs
+    publicly_available_premium_jobs = JobFilter(
+        request.GET, queryset=Job.get_premium_jobs().filter(**filters)
+    ).qs
+    facets = JobFilter(
+        request.GET, queryset=Job.get_active_jobs().filter(**filters)
+    ).facets()
 
-    public_jobs_to_display = paginator.page(page_number)
-    premium_jobs_to_display = premium_paginator.page(1)
+    try:
+        public_jobs_to_display = KeysetPaginator(publicly_available_jobs, 10).page(
+            request.GET.get("cursor")
+        )
+    except InvalidCursor:
+        return None
 
-    context_dict = {
+    return {
         "publicly_available_jobs": public_jobs_to_display,
-        "premium_available_jobs": premium_jobs_to_display,
+        "premium_available_jobs": KeysetPaginator(
+            publicly_available_premium_jobs, 10
+        ).page(),
+        "pages": None,
+        "facets": facets,
+    }
+
+
+def _search_listing(job_filter, page_number, filters):
+    """Title searches are ordered by relevance, which a keyset over
+    ``(created_at, id)`` would throw away, so they are paginated by offset."""
+    if "skill" in filters:
+        filters = {"skills": filters["skill"]}
+
+    data = job_filter.data
+    paginator = Paginator(
+        JobFilter(
+            data, queryset=Job.get_publicly_available_jobs().filter(**filters)
+        ).qs,
+        10,
+    )
+    if page_number not in paginator.page_range:
+        return None
+
+    return {
+        "publicly_available_jobs": paginator.page(page_number),
+        "premium_available_jobs": JobFilter(
+            data, queryset=Job.get_premium_jobs().filter(**filters)
+        ).qs[:10],
         "pages": paginator.page_range,
         "this_page": page_number,
-        "filter": user_filtered_query_set,
-        "webpush": WEBPUSH_CONTEXT,
+        "facets": JobFilter(
+            data, queryset=Job.get_active_jobs().filter(**filters)
+        ).facets(),
     }
 
+
+def get_job_listing(request, **filters):
+    """
+    Returns the context shared by the listing views (the page of regular
+    jobs, the premium jobs, the pagination and the facets), or None for an
+    invalid page. ``filters`` narrows the active jobs by ``state`` or
+    ``skill`` (a pk).
+
+    Listings without a title search are served from the in-memory snapshot
+    of the active jobs and paginated by page number. Title searches hit the
+    database and keep their relevance order, paginated by page number too.
+    Requests carrying a ``cursor`` are paginated by keyset (see
+    ``pyjobs.core.pagination``).
+    """
+    job_filter = JobFilter(request.GET, queryset=Job.get_active_jobs())
+    if "cursor" in request.GET or not job_filter.is_valid():
+        return _queryset_listing(request, filters)
+
+    try:
+        page_number = int(request.GET.get("page", 1))
+    except ValueError:
+        return None
+
+    if job_filter.form.cleaned_data.get("title"):
+        return _search_listing(job_filter, page_number, filters)
+
+    try:
+        return _snapshot_listing(job_filter, page_number, filters)
+    except StaleSnapshot:
+        # the snapshot was dropped and is rebuilt by the second attempt
+        return _snapshot_listing(job_filter, page_number, filters)
+
+
+@cache_anonymous_page(Job, Skill)
+def jobs(request):
+    context_dict = get_job_listing(request)
+    if context_dict is None:
+        return redirect("/")
+
+    context_dict["filter"] = JobFilter(request.GET, queryset=Job.objects.none())
+    context_dict["webpush"] = WEBPUSH_CONTEXT
+
     return render(request, template_name="jobs.html", context=context_dict)
 
 
+@cache_anonymous_page(Job, Skill)
 def job_state_view(request, state):
     states = {
         "acre": (0, "Acre"),
@@ -124,34 +238,12 @@ def job_state_view(request, state):
     if state not in states.keys():
         return redirect("/")
 
-    publicly_available_jobs = Job.get_publicly_available_jobs().filter(
-        state=states[state][0]
-    )
-    publicly_available_premium_jobs = Job.get_premium_jobs().filter(
-        state=states[state][0]
-    )
-
-    paginator = Paginator(publicly_available_jobs, 10)
-    premium_paginator = Paginator(publicly_available_premium_jobs, 10)
-
-    try:
-        page_number = int(request.GET.get("page", 1))
-    except ValueError:
-        return redirect("/")
-
-    if page_number > paginator.num_pages:
+    context_dict = get_job_listing(request, state=states[state][0])
+    if context_dict is None:
         return redirect("/")
 
-    public_jobs_to_display = paginator.page(page_number)
-    premium_jobs_to_display = premium_paginator.page(1)
-
-    context_dict = {
-        "publicly_available_jobs": public_jobs_to_display,
-        "premium_available_jobs": premium_jobs_to_display,
-        "pages": paginator.page_range,
-        "state": states[state][1],
-        "webpush": WEBPUSH_CONTEXT,
-    }
+    context_dict["state"] = states[state][1]
+    context_dict["webpush"] = {"group": get_state_group(states[state][0])}
 
     return render(
         request,
@@ -177,7 +269,9 @@ def job_creation(request):
     if request.method == "POST":
         g_recaptcha_response = request.POST.get("g-recaptcha-response")
 
-        if context["new_job_form"].is_valid(g_recaptcha_response):
+        if context["new_job_form"].is_valid(
+            g_recaptcha_response, getattr(request, "recaptcha_verified", None)
+        ):
             context["new_job_form"].save()
             return render(
                 request, template_name="job_created.html", context=context, status=201
@@ -201,6 +295,7 @@ def robots_view(request):
     return render(request, template_name="robots.txt")
 
 
+@cache_anonymous_page(Job, Skill)
 def job_view(request, unique_slug):
     job = get_object_or_404(Job, unique_slug=unique_slug)
     context = {
@@ -229,15 +324,10 @@ def job_view(request, unique_slug):
     context["title"] = context["job"].title
     context["description"] = context["job"].description
 
-    context["similar_jobs"] = (
-        Job.objects.filter(
-            Q(skills__in=context["job"].skills.all()),
-            ~Q(id=context["job"].id),
-            Q(created_at__gt=datetime.now() - timedelta(days=30)),
-        )
-        .annotate(num_skills=Count("skills"))
-        .order_by("-num_skills")[:3]
-    )
+    context["similar_jobs"] = Job.objects.filter(
+        similar_to__job=context["job"],
+        created_at__gt=datetime.now() - timedelta(days=30),
+    ).order_by("-similar_to__score")[:3]
 
     if request.method == "POST":
         context["job"].apply(request.user)
@@ -252,6 +342,7 @@ def job_view(request, unique_slug):
     return render(request, template_name="job_details.html", context=context)
 
 
+@cache_anonymous_page(Job, Skill)
 def summary_view(request):
     jobs = Job()
     context = {"jobs": jobs.get_weekly_summary(), "webpush": WEBPUSH_CONTEXT}
@@ -306,7 +397,9 @@ def contact(request):
 
     recaptcha_response = request.POST.get("g-recaptcha-response")
 
-    if request.method == "POST" and context["form"].is_valid(recaptcha_response):
+    if request.method == "POST" and context["form"].is_valid(
+        recaptcha_response, getattr(request, "recaptcha_verified", None)
+    ):
         context["form"].save()
         context["message_first"] = _("Mensagem enviada com sucesso")
         context["message_second"] = _("Vá para a home do site!")
@@ -330,7 +423,9 @@ def pythonistas_signup(request):
 
     g_recaptcha_response = request.POST.get("g-recaptcha-response")
 
-    if request.method == "POST" and context["form"].is_valid(g_recaptcha_response):
+    if request.method == "POST" and context["form"].is_valid(
+        g_recaptcha_response, getattr(request, "recaptcha_verified", None)
+    ):
         user = context["form"].save()
         login(request, user, backend="django.contrib.auth.backends.ModelBackend")
         return redirect("/")
@@ -338,6 +433,28 @@ def pythonistas_signup(request):
     return render(request, "user_area/pythonistas-signup.html", context)
 
 
+def verify_recaptcha_first(view):
+    """
+    Async version of a view validating a ``CustomModelForm``: the reCAPTCHA
+    of a POST is verified without blocking the worker, then ``view`` runs with
+    the result in ``request.recaptcha_verified``.
+    """
+
+    async def async_view(request, *args, **kwargs):
+        if request.method == "POST" and is_recaptcha_enabled():
+            request.recaptcha_verified = await averify_recaptcha(
+                request.POST.get("g-recaptcha-response")
+            )
+        return await sync_to_async(view)(request, *args, **kwargs)
+
+    return async_view
+
+
+async_job_creation = verify_recaptcha_first(job_creation)
+async_contact = verify_recaptcha_first(contact)
+async_pythonistas_signup = verify_recaptcha_first(pythonistas_signup)
+
+
 @login_required
 def pythonista_change_password(request):
     template_name = "user_area/pythonistas-area-password-change.html"
@@ -438,6 +555,10 @@ class JobsFeed(Feed):
         settings.WEBSITE_WORKING_LANGUAGE, settings.WEBSITE_NAME
     )
 
+    @method_decorator(jobs_conditional_get(period=FEED_VALIDATORS_PERIOD))
+    def __call__(self, request, *args, **kwargs):
+        return super().__call__(request, *args, **kwargs)
+
     def items(self):
         return Job.get_feed_jobs()
 
@@ -463,6 +584,10 @@ class PremiumJobsFeed(Feed):
         settings.WEBSITE_WORKING_LANGUAGE, settings.WEBSITE_NAME
     )
 
+    @method_decorator(jobs_conditional_get(period=FEED_VALIDATORS_PERIOD))
+    def __call__(self, request, *args, **kwargs):
+        return super().__call__(request, *args, **kwargs)
+
     def items(self):
         return Job.get_premium_jobs()
 
@@ -476,7 +601,7 @@ class PremiumJobsFeed(Feed):
         return reverse("job_view", args=[item.pk])
 
     def item_pubdate(self, item):
-        return datetime.now()
+        return item.premium_at or item.created_at
 
 
 @login_required
@@ -561,12 +686,10 @@ def get_job_applications(request, unique_slug):
 
 
 def thumbnail_view(request, unique_slug):
-    job = Job.objects.filter(unique_slug=unique_slug).first()
-    im = generate_thumbnail(job=job)
-
-    response = HttpResponse(content_type="image/png")
-    im.save(response, "PNG")
-    return response
+    job = get_object_or_404(Job, unique_slug=unique_slug)
+    return thumbnail_response(
+        request, "job", job.title, lambda: generate_thumbnail(job=job)
+    )
 
 
 def handler_404(request, exception):
@@ -609,6 +732,7 @@ def job_application_feedback(request, pk):
     return render(request, "job_application_feedback.html", context)
 
 
+@cache_anonymous_page(Job, Skill)
 def job_skill_view(request, unique_slug):
     """
     This view will return jobs related to a certain skill,
@@ -619,30 +743,12 @@ def job_skill_view(request, unique_slug):
     if not skill:
         return redirect("/")
 
-    publicly_available_jobs = Job.get_publicly_available_jobs().filter(skills=skill)
-    publicly_available_premium_jobs = Job.get_premium_jobs().filter(skills=skill)
-
-    paginator = Paginator(publicly_available_jobs, 10)
-    premium_paginator = Paginator(publicly_available_premium_jobs, 10)
-
-    try:
-        page_number = int(request.GET.get("page", 1))
-    except ValueError:
-        return redirect("/")
-
-    if page_number > paginator.num_pages:
+    context_dict = get_job_listing(request, skill=skill.pk)
+    if context_dict is None:
         return redirect("/")
 
-    public_jobs_to_display = paginator.page(page_number)
-    premium_jobs_to_display = premium_paginator.page(1)
-
-    context_dict = {
-        "publicly_available_jobs": public_jobs_to_display,
-        "premium_available_jobs": premium_jobs_to_display,
-        "pages": paginator.page_range,
-        "skill": skill,
-        "webpush": WEBPUSH_CONTEXT,
-    }
+    context_dict["skill"] = skill
+    context_dict["webpush"] = {"group": get_skill_group(skill)}
 
     return render(
         request,
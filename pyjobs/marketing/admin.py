@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Contact, Messages, MailingList, Share, CustomerQuote, PushMessage
+from .models import MailingRun, NewsletterSubscription
 
 
 class MailingListsAdmin(admin.ModelAdmin):
@@ -14,9 +15,20 @@ class MessagesAdmin(admin.ModelAdmin):
     list_display = ("message_title", "message_type")
 
 
+class MailingRunAdmin(admin.ModelAdmin):
+    list_display = ("mailing", "edition", "sent", "started_at", "finished_at")
+
+
+class NewsletterSubscriptionAdmin(admin.ModelAdmin):
+    list_display = ("email", "subscribed", "status", "attempts", "created_at")
+    list_filter = ("status", "subscribed")
+
+
 admin.site.register(Contact)
 admin.site.register(Messages, MessagesAdmin)
 admin.site.register(MailingList, MailingListsAdmin)
 admin.site.register(Share, SharingAdmin)
 admin.site.register(CustomerQuote)
 admin.site.register(PushMessage)
+admin.site.register(MailingRun, MailingRunAdmin)
+admin.site.register(NewsletterSubscription, NewsletterSubscriptionAdmin)
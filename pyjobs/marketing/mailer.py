@@ -0,0 +1,106 @@
+"""
+Batch mailer for the mailings sent to many recipients at once.
+
+Messages are split in chunks sent by a pool of threads, each one opening a
+single backend connection (one SMTP session, one ESP client) and reusing it
+for every chunk it sends instead of connecting once per message.
+
+Progress is checkpointed in a ``MailingRun``: chunks are built in recipient
+order and, as they finish, the run advances to the last recipient of the
+longest prefix of finished chunks. An interrupted run starts again right after
+it, so at most the chunks that were in flight are sent twice.
+"""
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from time import perf_counter
+
+from django.core.mail import get_connection
+
+MAILING_CHUNK_SIZE = 100
+MAILING_WORKERS = 4
+
+
+def get_chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class BatchMailer:
+    def __init__(self, chunk_size=MAILING_CHUNK_SIZE, workers=MAILING_WORKERS):
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+
+    def get_connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = get_connection()
+            connection.open()
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def send_chunk(self, messages):
+        connection = self.get_connection()
+        for message in messages:
+            message.connection = connection
+        return connection.send_messages(messages) or 0
+
+    def send(self, run, recipients, build_message):
+        """
+        Sends ``build_message(recipient)`` to each of ``recipients`` (model
+        instances ordered by ``pk``) after ``run.last_recipient_id``. Returns
+        the number of messages sent and how many seconds it took.
+        """
+        recipients = [
+            recipient
+            for recipient in recipients
+            if recipient.pk > run.last_recipient_id
+        ]
+        chunks = list(get_chunks(recipients, self.chunk_size))
+        finished, checkpoint, total = set(), 0, 0
+        start = perf_counter()
+
+        try:
+            with ThreadPoolExecutor(self.workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.send_chunk, [build_message(item) for item in chunk]
+                    ): index
+                    for index, chunk in enumerate(chunks)
+                }
+                pending, error = set(futures), None
+                while pending and error is None:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    sent = 0
+                    for future in done:
+                        if future.exception() is not None:
+                            error = error or future.exception()
+                            continue
+                        sent += future.result()
+                        finished.add(futures[future])
+
+                    while checkpoint in finished:
+                        checkpoint += 1
+                    if checkpoint:
+                        run.last_recipient_id = chunks[checkpoint - 1][-1].pk
+                    run.sent += sent
+                    run.save(update_fields=["last_recipient_id", "sent"])
+                    total += sent
+
+                if error is not None:
+                    for future in pending:
+                        future.cancel()
+                    raise error
+        finally:
+            for connection in self.connections:
+                connection.close()
+            self.connections = []
+
+        run.finished_at = datetime.now()
+        run.save(update_fields=["finished_at"])
+        return total, perf_counter() - start
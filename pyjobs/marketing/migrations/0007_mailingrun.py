@@ -0,0 +1,50 @@
+# Generated by Django 3.2.2 on 2026-10-18 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("marketing", "0006_pushmessage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MailingRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("mailing", models.CharField(max_length=100, verbose_name="Envio")),
+                ("edition", models.DateField(verbose_name="Edição")),
+                (
+                    "last_recipient_id",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Envios interrompidos recomeçam após este destinatário",
+                        verbose_name="Último destinatário enviado",
+                    ),
+                ),
+                (
+                    "sent",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Mensagens enviadas"
+                    ),
+                ),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Execução de envio",
+                "verbose_name_plural": "Execuções de envio",
+                "unique_together": {("mailing", "edition")},
+            },
+        ),
+    ]
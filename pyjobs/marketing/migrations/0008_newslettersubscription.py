@@ -0,0 +1,88 @@
+# Generated by Django 3.2.2 on 2026-10-18 13:40
+
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("marketing", "0007_mailingrun"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NewsletterSubscription",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("email", models.EmailField(max_length=254, verbose_name="Email")),
+                (
+                    "subscribed",
+                    models.BooleanField(default=True, verbose_name="Inscrever?"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendente"),
+                            ("synced", "Sincronizada"),
+                            ("failed", "Falhou"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="Tentativas"),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, default="", verbose_name="Último erro"
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=datetime.datetime.now, verbose_name="Próxima tentativa"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("synced_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="newsletter_subscriptions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Inscrição na newsletter",
+                "verbose_name_plural": "Inscrições na newsletter",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="newslettersubscription",
+            index=models.Index(
+                fields=["status", "next_attempt_at"],
+                name="marketing_n_status_3db389_idx",
+            ),
+        ),
+    ]
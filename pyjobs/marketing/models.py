@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from django.db import models
 from django.dispatch import receiver
 from django.conf import settings
@@ -80,6 +82,63 @@ class PushMessage(models.Model):
     url = models.URLField(_("Link para a vaga"))
 
 
+class MailingRun(models.Model):
+    mailing = models.CharField(_("Envio"), max_length=100)
+    edition = models.DateField(_("Edição"))
+    last_recipient_id = models.PositiveIntegerField(
+        _("Último destinatário enviado"),
+        default=0,
+        help_text=_("Envios interrompidos recomeçam após este destinatário"),
+    )
+    sent = models.PositiveIntegerField(_("Mensagens enviadas"), default=0)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ("mailing", "edition")
+        verbose_name = _("Execução de envio")
+        verbose_name_plural = _("Execuções de envio")
+
+
+SYNC_PENDING, SYNC_DONE, SYNC_FAILED = "pending", "synced", "failed"
+
+SYNC_STATUS = (
+    (SYNC_PENDING, _("Pendente")),
+    (SYNC_DONE, _("Sincronizada")),
+    (SYNC_FAILED, _("Falhou")),
+)
+
+
+class NewsletterSubscription(models.Model):
+    """A (un)subscription waiting to be sent to the newsletter provider by
+    ``sync_newsletter_subscriptions``."""
+
+    user = models.ForeignKey(
+        User,
+        related_name="newsletter_subscriptions",
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+    )
+    email = models.EmailField(_("Email"))
+    subscribed = models.BooleanField(_("Inscrever?"), default=True)
+    status = models.CharField(
+        _("Status"), max_length=10, choices=SYNC_STATUS, default=SYNC_PENDING
+    )
+    attempts = models.PositiveIntegerField(_("Tentativas"), default=0)
+    last_error = models.TextField(_("Último erro"), blank=True, default="")
+    next_attempt_at = models.DateTimeField(
+        _("Próxima tentativa"), default=datetime.now
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    synced_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+        verbose_name = _("Inscrição na newsletter")
+        verbose_name_plural = _("Inscrições na newsletter")
+
+
 @receiver(post_save, sender=Contact)
 def new_contact(sender, instance, created, **kwargs):
     email_context = {"mensagem": instance}
@@ -1,8 +1,18 @@
+from datetime import datetime
+from urllib.parse import quote
+
 from django.conf import settings
-import requests
 import json
 from mailchimp3 import MailChimp
 
+from pyjobs.core import http_client
+from pyjobs.tasks.queue import get_retry_delay
+
+MAILERLITE_URL = "https://api.mailerlite.com/api/v2/{}"
+MAILERLITE_BATCH_SIZE = 50
+MAILCHIMP_BATCH_SIZE = 500
+NEWSLETTER_MAX_ATTEMPTS = 8
+
 
 def subscribe_user_to_mailer(profile):
     status = True
@@ -17,7 +27,7 @@ def subscribe_user_to_mailer(profile):
     }
 
     try:
-        req = requests.post(
+        req = http_client.post(
             "https://api.mailerlite.com/api/v2/subscribers",
             data=content,
             headers=headers,
@@ -46,3 +56,154 @@ def subscribe_user_to_chimp(profile):
     except:  # TODO specify which errors can be raised at this point
         status = False
     return status
+
+
+def record_subscription_intent(user, email, subscribed):
+    """Queues the (un)subscription of ``email``, replacing a pending one for
+    the same address since only the latest intent matters."""
+    from pyjobs.marketing.models import SYNC_PENDING, NewsletterSubscription
+
+    if not email:
+        return None
+
+    intent, _created = NewsletterSubscription.objects.update_or_create(
+        email=email,
+        status=SYNC_PENDING,
+        defaults={
+            "user": user,
+            "subscribed": subscribed,
+            "attempts": 0,
+            "next_attempt_at": datetime.now(),
+        },
+    )
+    return intent
+
+
+def get_mailerlite_request(intent):
+    if intent.subscribed:
+        return {
+            "method": "POST",
+            "path": "api/v2/subscribers",
+            "body": {"email": intent.email},
+        }
+    return {
+        "method": "PUT",
+        "path": f"api/v2/subscribers/{quote(intent.email, safe='')}",
+        "body": {"type": "unsubscribed"},
+    }
+
+
+def sync_with_mailerlite(intents):
+    """Sends ``intents`` through MailerLite's batch endpoint, returns the error
+    of each intent (``None`` when it was accepted)."""
+    response = http_client.post(
+        MAILERLITE_URL.format("batch"),
+        data=json.dumps({"requests": [get_mailerlite_request(i) for i in intents]}),
+        headers={
+            "content-type": "application/json",
+            "x-mailerlite-apikey": settings.MAILERLITE_API_KEY,
+        },
+    )
+    response.raise_for_status()
+
+    errors = []
+    for result in response.json():
+        if 200 <= result.get("code", 500) < 300:
+            errors.append(None)
+        else:
+            errors.append(json.dumps(result.get("body")))
+    return errors
+
+
+def sync_with_mailchimp(intents):
+    client = MailChimp(settings.MAILCHIMP_API_KEY, settings.MAILCHIMP_USERNAME)
+    response = client.lists.update_members(
+        settings.MAILCHIMP_LIST_KEY,
+        {
+            "members": [
+                {
+                    "email_address": intent.email,
+                    "status": "subscribed" if intent.subscribed else "unsubscribed",
+                }
+                for intent in intents
+            ],
+            "update_existing": True,
+        },
+    )
+    errors = {
+        error["email_address"]: error.get("error", "")
+        for error in response.get("errors", [])
+    }
+    return [errors.get(intent.email) for intent in intents]
+
+
+def get_newsletter_provider():
+    """Returns ``(sync, batch_size)`` of the configured provider, if any."""
+    if settings.MAILERLITE_API_KEY:
+        return sync_with_mailerlite, MAILERLITE_BATCH_SIZE
+
+    configs = (
+        settings.MAILCHIMP_API_KEY,
+        settings.MAILCHIMP_USERNAME,
+        settings.MAILCHIMP_LIST_KEY,
+    )
+    if all(configs):
+        return sync_with_mailchimp, MAILCHIMP_BATCH_SIZE
+
+    return None, 0
+
+
+def save_sync_result(intent, error):
+    from pyjobs.marketing.models import SYNC_DONE, SYNC_FAILED
+
+    intent.attempts += 1
+    if error is None:
+        intent.status, intent.synced_at, intent.last_error = (
+            SYNC_DONE,
+            datetime.now(),
+            "",
+        )
+    else:
+        intent.last_error = error
+        if intent.attempts >= NEWSLETTER_MAX_ATTEMPTS:
+            intent.status = SYNC_FAILED
+        else:
+            intent.next_attempt_at = datetime.now() + get_retry_delay(intent.attempts)
+    intent.save()
+
+
+def sync_newsletter_subscriptions(batch_size=None):
+    """
+    Sends the due pending intents to the provider in batches. A batch that
+    fails as a whole (timeout, 5xx) is retried later with backoff, as is each
+    row the provider rejected. Yields ``(synced, failed)`` per batch.
+    """
+    from pyjobs.marketing.models import SYNC_PENDING, NewsletterSubscription
+
+    sync, provider_batch_size = get_newsletter_provider()
+    if sync is None:
+        return
+
+    batch_size = min(batch_size or provider_batch_size, provider_batch_size)
+    last_pk = 0
+    while True:
+        intents = list(
+            NewsletterSubscription.objects.filter(
+                status=SYNC_PENDING,
+                next_attempt_at__lte=datetime.now(),
+                pk__gt=last_pk,
+            ).order_by("pk")[:batch_size]
+        )
+        if not intents:
+            return
+        last_pk = intents[-1].pk
+
+        try:
+            errors = sync(intents)
+        except Exception as error:
+            errors = [repr(error)] * len(intents)
+
+        for intent, error in zip(intents, errors):
+            save_sync_result(intent, error)
+        failed = sum(error is not None for error in errors)
+        yield len(intents) - failed, failed
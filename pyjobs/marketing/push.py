@@ -0,0 +1,176 @@
+"""
+Web push fan-out.
+
+``django-webpush`` sends a group notification one subscription at a time and
+only forgets endpoints answering 410, so every broadcast waits on each push
+service in turn and keeps retrying endpoints that are gone. ``PushDispatcher``
+delivers to every subscription of the given groups across a bounded thread
+pool, deletes the ones answering 404 or 410 and reports the delivery rate.
+
+Besides ``general`` subscribers can join topic groups: the skill and state
+listings subscribe their visitors to ``skill-<pk>`` and ``state-<number>``
+so new jobs only reach those who asked for them. Messages written in the
+admin are for everybody and go to every group.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from django.conf import settings
+from pywebpush import WebPushException, webpush
+from webpush.models import Group, SubscriptionInfo
+
+logger = logging.getLogger(__name__)
+
+GENERAL_GROUP = "general"
+PUSH_WORKERS = 16
+PUSH_TIMEOUT = 10
+DEAD_SUBSCRIPTION_STATUS = (404, 410)
+
+SENT, FAILED, DEAD = "sent", "failed", "dead"
+
+
+def get_skill_group(skill):
+    return f"skill-{skill.pk}"
+
+
+def get_state_group(state):
+    return f"state-{state}"
+
+
+def get_job_groups(job):
+    """Every group interested in ``job``: everybody, its skills and state."""
+    return [
+        GENERAL_GROUP,
+        get_state_group(job.state),
+        *(get_skill_group(skill) for skill in job.skills.all()),
+    ]
+
+
+def get_all_groups():
+    """Every group, topic subscribers never joined ``general``."""
+    return list(Group.objects.values_list("name", flat=True))
+
+
+def get_vapid_data():
+    webpush_settings = getattr(settings, "WEBPUSH_SETTINGS", {})
+    private_key = webpush_settings.get("VAPID_PRIVATE_KEY")
+    if not private_key:
+        return {}
+    return {
+        "vapid_private_key": private_key,
+        "vapid_claims": {
+            "sub": "mailto:{}".format(webpush_settings.get("VAPID_ADMIN_EMAIL"))
+        },
+    }
+
+
+def get_subscription_info(subscription):
+    return {
+        "endpoint": subscription.endpoint,
+        "keys": {"p256dh": subscription.p256dh, "auth": subscription.auth},
+    }
+
+
+class DispatchReport:
+    def __init__(self):
+        self.sent = self.failed = self.dead = 0
+        self.pruned = []
+        self.elapsed = 0.0
+
+    @property
+    def total(self):
+        return self.sent + self.failed + self.dead
+
+    @property
+    def rate(self):
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.sent} sent, {self.failed} failed, {self.dead} gone "
+            f"in {self.elapsed:.2f}s ({self.rate:.1f} pushes/s)"
+        )
+
+
+class PushDispatcher:
+    def __init__(self, workers=PUSH_WORKERS, timeout=PUSH_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+
+    def get_subscriptions(self, group_names):
+        """Returns ``{endpoint: [subscription, ...]}``, a browser subscribed
+        to several groups gets the notification only once."""
+        subscriptions = {}
+        for subscription in SubscriptionInfo.objects.filter(
+            webpush_info__group__name__in=group_names
+        ).distinct():
+            subscriptions.setdefault(subscription.endpoint, []).append(subscription)
+        return subscriptions
+
+    def push(self, subscription_info, payload, ttl, vapid_data):
+        try:
+            webpush(
+                subscription_info=subscription_info,
+                data=payload,
+                ttl=ttl,
+                timeout=self.timeout,
+                **vapid_data,
+            )
+        except WebPushException as error:
+            status = getattr(error.response, "status_code", None)
+            if status in DEAD_SUBSCRIPTION_STATUS:
+                return DEAD
+            logger.warning(
+                "Push to %s failed: %s", subscription_info["endpoint"], error
+            )
+            return FAILED
+        except Exception:
+            logger.warning(
+                "Push to %s failed", subscription_info["endpoint"], exc_info=True
+            )
+            return FAILED
+        return SENT
+
+    def dispatch(self, group_names, payload, ttl=0):
+        """Pushes ``payload`` (a dict) to the subscribers of ``group_names``
+        and returns a ``DispatchReport``."""
+        report = DispatchReport()
+        subscriptions = self.get_subscriptions(group_names)
+        if not subscriptions:
+            return report
+
+        payload, vapid_data = json.dumps(payload), get_vapid_data()
+        start = perf_counter()
+        with ThreadPoolExecutor(min(self.workers, len(subscriptions))) as executor:
+            results = executor.map(
+                lambda same_endpoint: self.push(
+                    get_subscription_info(same_endpoint[0]), payload, ttl, vapid_data
+                ),
+                subscriptions.values(),
+            )
+            for same_endpoint, result in zip(subscriptions.values(), results):
+                if result == SENT:
+                    report.sent += 1
+                elif result == FAILED:
+                    report.failed += 1
+                else:
+                    report.dead += 1
+                    report.pruned.extend(
+                        subscription.pk for subscription in same_endpoint
+                    )
+        report.elapsed = perf_counter() - start
+
+        SubscriptionInfo.objects.filter(pk__in=report.pruned).delete()
+        logger.info("Push to %s: %s", ", ".join(group_names), report)
+        return report
+
+
+def send_group_notification(group_name, payload, ttl=0):
+    """Same signature as ``webpush.send_group_notification``, ``group_name``
+    may also be a list of groups."""
+    if isinstance(group_name, str):
+        group_name = [group_name]
+    return PushDispatcher().dispatch(group_name, payload, ttl)
@@ -1,13 +1,28 @@
+import json
+from datetime import datetime
+from io import StringIO
 from unittest.mock import patch, call
 
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase, override_settings
 from unittest.mock import patch
 import responses
+from pyjobs.core.http_client import BREAKER_THRESHOLD
 from pyjobs.core.models import Job, Profile
+from pyjobs.marketing.models import (
+    SYNC_DONE,
+    SYNC_FAILED,
+    SYNC_PENDING,
+    NewsletterSubscription,
+)
 from pyjobs.marketing.newsletter import (
+    NEWSLETTER_MAX_ATTEMPTS,
+    get_mailerlite_request,
+    record_subscription_intent,
     subscribe_user_to_chimp,
     subscribe_user_to_mailer,
+    sync_newsletter_subscriptions,
 )
 from django.conf import settings
 
@@ -83,10 +98,156 @@ class NewsletterMailerliteTest(TestCase):
         }
 
     @override_settings(MAILERLITE_API_KEY="AAA")
-    @patch("pyjobs.marketing.newsletter.requests.post")
+    @patch("pyjobs.marketing.newsletter.http_client.post")
     @responses.activate
     def test_subscribe_user_to_mailer(self, _mocked_post):
         _mocked_post.return_value = Exception()
         _mocked_post.side_effect = Exception()
         out = subscribe_user_to_mailer(self.profile)
         self.assertFalse(out)
+
+
+@patch.dict("pyjobs.core.http_client._clients", clear=True)
+class NewsletterSubscriptionSyncTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="v@m.com", email="v@m.com", password="top_secret"
+        )
+        self.profile = Profile.objects.create(user=self.user, on_mailing_list=True)
+
+    def get_intents(self):
+        return list(
+            NewsletterSubscription.objects.order_by("pk").values_list(
+                "email", "subscribed", "status"
+            )
+        )
+
+    def test_intent_recorded_only_on_changes(self):
+        self.assertEqual(self.get_intents(), [("v@m.com", True, SYNC_PENDING)])
+
+        self.profile.github = "http://www.github.com/vmesel"
+        self.profile.save()
+        self.user.first_name = "Vinicius"
+        self.user.save()
+        self.assertEqual(len(self.get_intents()), 1)
+
+        self.profile.on_mailing_list = False
+        self.profile.save()
+        self.assertEqual(self.get_intents(), [("v@m.com", False, SYNC_PENDING)])
+
+    def test_email_change_moves_the_subscription(self):
+        NewsletterSubscription.objects.update(status=SYNC_DONE)
+        self.user.email = "vm@m.com"
+        self.user.save()
+
+        self.assertEqual(
+            self.get_intents()[1:],
+            [("v@m.com", False, SYNC_PENDING), ("vm@m.com", True, SYNC_PENDING)],
+        )
+
+    def test_no_provider_configured(self):
+        out = StringIO()
+        call_command("sync_newsletter_subscriptions", stdout=out)
+        self.assertIn("No newsletter provider", out.getvalue())
+        self.assertEqual(self.get_intents(), [("v@m.com", True, SYNC_PENDING)])
+
+    @override_settings(MAILERLITE_API_KEY="AAA")
+    @responses.activate
+    def test_mailerlite_batch(self):
+        record_subscription_intent(None, "gone@m.com", False)
+        record_subscription_intent(None, "invalid", True)
+        responses.add(
+            responses.POST,
+            "https://api.mailerlite.com/api/v2/batch",
+            json=[
+                {"code": 200, "body": {}},
+                {"code": 200, "body": {}},
+                {"code": 400, "body": {"error": {"message": "Invalid email"}}},
+            ],
+        )
+
+        out = StringIO()
+        call_command("sync_newsletter_subscriptions", stdout=out)
+
+        self.assertEqual(out.getvalue(), "2 synced, 1 to retry\n")
+        batch = json.loads(responses.calls[0].request.body)["requests"]
+        self.assertEqual(
+            batch,
+            [
+                {
+                    "method": "POST",
+                    "path": "api/v2/subscribers",
+                    "body": {"email": "v@m.com"},
+                },
+                {
+                    "method": "PUT",
+                    "path": "api/v2/subscribers/gone%40m.com",
+                    "body": {"type": "unsubscribed"},
+                },
+                {
+                    "method": "POST",
+                    "path": "api/v2/subscribers",
+                    "body": {"email": "invalid"},
+                },
+            ],
+        )
+        invalid = NewsletterSubscription.objects.get(email="invalid")
+        self.assertEqual((invalid.status, invalid.attempts), (SYNC_PENDING, 1))
+        self.assertIn("Invalid email", invalid.last_error)
+        self.assertGreater(invalid.next_attempt_at, datetime.now())
+        self.assertEqual(
+            NewsletterSubscription.objects.filter(status=SYNC_DONE).count(), 2
+        )
+
+    def test_mailerlite_unsubscribe_path_is_quoted(self):
+        record_subscription_intent(None, "a/b?c#d@m.com", False)
+        intent = NewsletterSubscription.objects.get(email="a/b?c#d@m.com")
+
+        self.assertEqual(
+            get_mailerlite_request(intent)["path"],
+            "api/v2/subscribers/a%2Fb%3Fc%23d%40m.com",
+        )
+
+    @override_settings(MAILERLITE_API_KEY="AAA")
+    @responses.activate
+    def test_failed_batch_is_retried_until_the_limit(self):
+        responses.add(
+            responses.POST, "https://api.mailerlite.com/api/v2/batch", status=503
+        )
+
+        for _ in range(NEWSLETTER_MAX_ATTEMPTS):
+            NewsletterSubscription.objects.update(next_attempt_at=datetime.now())
+            list(sync_newsletter_subscriptions())
+
+        intent = NewsletterSubscription.objects.get()
+        self.assertEqual(intent.status, SYNC_FAILED)
+        self.assertEqual(intent.attempts, NEWSLETTER_MAX_ATTEMPTS)
+        self.assertIn("CircuitOpen", intent.last_error)
+        self.assertEqual(len(responses.calls), BREAKER_THRESHOLD)
+
+    @override_settings(
+        MAILCHIMP_API_KEY="AAA", MAILCHIMP_USERNAME="BBB", MAILCHIMP_LIST_KEY="CCC"
+    )
+    @patch("pyjobs.marketing.newsletter.MailChimp")
+    def test_mailchimp_batch(self, patched_mc):
+        record_subscription_intent(None, "gone@m.com", False)
+        update_members = patched_mc.return_value.lists.update_members
+        update_members.return_value = {
+            "errors": [{"email_address": "gone@m.com", "error": "Not a member"}]
+        }
+
+        self.assertEqual(list(sync_newsletter_subscriptions()), [(1, 1)])
+        update_members.assert_called_once_with(
+            "CCC",
+            {
+                "members": [
+                    {"email_address": "v@m.com", "status": "subscribed"},
+                    {"email_address": "gone@m.com", "status": "unsubscribed"},
+                ],
+                "update_existing": True,
+            },
+        )
+        self.assertEqual(
+            NewsletterSubscription.objects.get(email="gone@m.com").last_error,
+            "Not a member",
+        )
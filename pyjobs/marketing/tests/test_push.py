@@ -0,0 +1,179 @@
+import json
+import os
+from base64 import urlsafe_b64encode
+from unittest.mock import patch
+
+import responses
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from model_bakery import baker as mommy
+from webpush.models import Group, PushInformation, SubscriptionInfo
+
+from pyjobs.core.models import Job, Skill
+from pyjobs.marketing.models import PushMessage
+from pyjobs.marketing.push import (
+    PushDispatcher,
+    get_job_groups,
+    get_skill_group,
+    get_state_group,
+    send_group_notification,
+)
+from pyjobs.marketing.triggers import send_new_job_push_notification
+from pyjobs.tasks.queue import run_pending_tasks
+
+PUSH_SERVICE = "https://push.example.com/{}"
+
+
+def b64(data):
+    return urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def subscribe(name, *group_names):
+    public_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+    subscription = SubscriptionInfo.objects.create(
+        browser="firefox",
+        endpoint=PUSH_SERVICE.format(name),
+        p256dh=b64(
+            public_key.public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+        ),
+        auth=b64(os.urandom(16)),
+    )
+    for group_name in group_names:
+        group, _ = Group.objects.get_or_create(name=group_name)
+        PushInformation.objects.create(subscription=subscription, group=group)
+    return subscription
+
+
+def encode_in_clear(web_pusher, data, content_encoding="aes128gcm"):
+    return {"body": data.encode()}
+
+
+# the push service is faked, encrypting for it would only test pywebpush
+@patch("pywebpush.WebPusher.encode", encode_in_clear)
+class PushDispatcherTest(TestCase):
+    def setUp(self):
+        self.alive = subscribe("alive", "general", "skill-1")
+        self.gone = subscribe("gone", "general")
+        self.missing = subscribe("missing", "skill-1")
+        self.broken = subscribe("broken", "general")
+        self.other_skill = subscribe("other", "skill-2")
+
+    def add_push_service(self):
+        for name, status in (
+            ("alive", 201),
+            ("gone", 410),
+            ("missing", 404),
+            ("broken", 500),
+            ("other", 201),
+        ):
+            responses.add(responses.POST, PUSH_SERVICE.format(name), status=status)
+
+    def get_pushed_endpoints(self):
+        return sorted(call.request.url for call in responses.calls)
+
+    @responses.activate
+    def test_pushes_to_each_subscriber_of_the_groups_once(self):
+        self.add_push_service()
+        report = PushDispatcher(workers=3).dispatch(
+            ["general", "skill-1"], {"head": "Nova Vaga!"}, ttl=60
+        )
+
+        self.assertEqual(
+            self.get_pushed_endpoints(),
+            sorted(
+                PUSH_SERVICE.format(name)
+                for name in ("alive", "gone", "missing", "broken")
+            ),
+        )
+        self.assertEqual((report.sent, report.failed, report.dead), (1, 1, 2))
+        self.assertEqual(report.total, 4)
+        self.assertGreater(report.rate, 0)
+
+    @responses.activate
+    def test_dead_subscriptions_are_pruned(self):
+        self.add_push_service()
+        send_group_notification(["general", "skill-1"], {"head": "Nova Vaga!"})
+
+        self.assertEqual(
+            set(SubscriptionInfo.objects.values_list("pk", flat=True)),
+            {self.alive.pk, self.broken.pk, self.other_skill.pk},
+        )
+        self.assertFalse(PushInformation.objects.filter(subscription=self.gone.pk))
+
+    @responses.activate
+    def test_single_group_keeps_the_webpush_signature(self):
+        self.add_push_service()
+        report = send_group_notification(
+            group_name="skill-2", payload={"head": "Nova Vaga!"}, ttl=1000
+        )
+
+        self.assertEqual(report.sent, 1)
+        self.assertEqual(self.get_pushed_endpoints(), [PUSH_SERVICE.format("other")])
+        request = responses.calls[0].request
+        self.assertEqual(json.loads(request.body), {"head": "Nova Vaga!"})
+        self.assertEqual(request.headers["ttl"], "1000")
+
+    @responses.activate
+    def test_push_messages_reach_every_group(self):
+        self.add_push_service()
+        PushMessage.objects.create(
+            head="PyJobs", body="Novidades!", url="https://pyjobs.com.br/"
+        )
+        self.assertEqual(len(responses.calls), 0)
+
+        run_pending_tasks()
+
+        self.assertEqual(
+            self.get_pushed_endpoints(),
+            sorted(
+                PUSH_SERVICE.format(name)
+                for name in ("alive", "gone", "missing", "broken", "other")
+            ),
+        )
+
+    def test_no_subscribers(self):
+        report = PushDispatcher().dispatch(["state-3"], {"head": "Nova Vaga!"})
+        self.assertEqual(report.total, 0)
+
+
+class PushTopicsTest(TestCase):
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def setUp(
+        self, _mocked_send_group_push, _mock_github, _mocked_post_telegram_channel
+    ):
+        cache.clear()
+        self.skill = mommy.make(Skill, name="Django", unique_slug="django")
+        self.job = mommy.make(Job, public=True, state=24)
+        self.job.skills.add(self.skill)
+
+    def test_job_groups(self):
+        self.assertEqual(
+            get_job_groups(self.job),
+            ["general", "state-24", get_skill_group(self.skill)],
+        )
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    def test_new_job_is_pushed_to_its_topics(self, _mocked_send_group_push):
+        send_new_job_push_notification(job_id=self.job.pk, language="pt-br")
+
+        _mocked_send_group_push.assert_called_once()
+        self.assertEqual(
+            _mocked_send_group_push.call_args.kwargs["group_name"],
+            get_job_groups(self.job),
+        )
+
+    def test_listings_subscribe_to_their_topic(self):
+        response = self.client.get(
+            reverse("job_skill_view", args=[self.skill.unique_slug])
+        )
+        self.assertEqual(
+            response.context["webpush"]["group"], get_skill_group(self.skill)
+        )
+
+        response = self.client.get(reverse("job_state_view", args=["sao-paulo"]))
+        self.assertEqual(response.context["webpush"]["group"], get_state_group(24))
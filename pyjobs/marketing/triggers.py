@@ -4,27 +4,61 @@ from django.conf import settings
 from django.core.mail import send_mail
 from django.db import models
 from django.db.models.signals import post_save, pre_save
+from django.contrib.auth.models import User
 from django.dispatch import receiver
-from raven.contrib.django.raven_compat.models import client
-from pyjobs.core.management.commands.generate_job_slugs_and_redirects import (
-    create_job_redirect,
-)
-from pyjobs.marketing.newsletter import subscribe_user_to_mailer
+from django.utils import translation
+from pyjobs.marketing.newsletter import record_subscription_intent
 from pyjobs.marketing.models import Messages, PushMessage
+from pyjobs.marketing.push import (
+    get_all_groups,
+    get_job_groups,
+    send_group_notification,
+)
 from pyjobs.core.models import Job, JobApplication, Profile
 from pyjobs.marketing.utils import post_telegram_channel
 from pyjobs.core.email_utils import get_email_with_template
+from pyjobs.tasks.queue import task
 
 from github import Github
 
-from webpush import send_group_notification
 from django.utils.translation import gettext_lazy as _
 
 
-@receiver(post_save, sender=Profile)
-def add_user_to_mailchimp(sender, instance, created, **kwargs):
-    if instance.on_mailing_list:
-        subscribe_user_to_mailer(instance)
+@receiver(pre_save, sender=Profile)
+def mailing_list_option_changed(sender, instance, update_fields=None, **kwargs):
+    """Queues the newsletter (un)subscription, synced in batches by
+    ``sync_newsletter_subscriptions``, only when the option changed."""
+    if update_fields and "on_mailing_list" not in update_fields:
+        return
+
+    was_on_mailing_list = (
+        Profile.objects.filter(pk=instance.pk)
+        .values_list("on_mailing_list", flat=True)
+        .first()
+        if instance.pk
+        else False
+    )
+    if bool(was_on_mailing_list) != instance.on_mailing_list:
+        record_subscription_intent(
+            instance.user, instance.user.email, instance.on_mailing_list
+        )
+
+
+@receiver(pre_save, sender=User)
+def subscribed_email_changed(sender, instance, update_fields=None, **kwargs):
+    # logins save the user with update_fields=["last_login"]
+    if not instance.pk or (update_fields and "email" not in update_fields):
+        return
+
+    old_email = (
+        User.objects.filter(pk=instance.pk).values_list("email", flat=True).first()
+    )
+    if old_email == instance.email:
+        return
+
+    if Profile.objects.filter(user=instance, on_mailing_list=True).exists():
+        record_subscription_intent(instance, old_email, False)
+        record_subscription_intent(instance, instance.email, True)
 
 
 @receiver(post_save, sender=JobApplication)
@@ -70,6 +104,9 @@ def send_email_notifing_job_application(sender, instance, created, **kwargs):
 
 def send_offer_email_template(job):
     message = Messages.objects.filter(message_type="offer").first()
+    if message is None:
+        return
+
     message_text = message.message_content.format(company=job.company_name)
     message_title = message.message_title.format(title=job.title)
     send_mail(
@@ -115,59 +152,102 @@ def send_job_to_github_issues(job):
     job.save()
 
 
-@receiver(post_save, sender=Job)
-def test(sender, instance, created, **kwargs):
-    if not created or not instance.receive_emails:
-        return False
+def get_new_job(job_id, language):
+    translation.activate(language)
+    return Job.objects.filter(pk=job_id).first()
+
+
+@task(max_attempts=1)
+def post_new_job_to_telegram(job_id, language):
+    job = get_new_job(job_id, language)
+    if job is None:
+        return
 
     message_text = " ".join(
         map(
             str,
             [
                 _("Nova oportunidade!"),
-                instance.title,
+                job.title,
                 " - ",
-                instance.company_name,
+                job.company_name,
                 _("em"),
-                instance.workplace,
+                job.workplace,
                 "\n",
-                f"{settings.WEBSITE_HOME_URL}/job/{instance.unique_slug}/",
+                f"{settings.WEBSITE_HOME_URL}/job/{job.unique_slug}/",
             ],
         )
     )
     post_telegram_channel(message_text)
 
+
+@task
+def send_published_job_email(job_id, language):
+    job = get_new_job(job_id, language)
+    if job is None:
+        return
+
     msg = get_email_with_template(
         "published_job",
-        {"vaga": instance},
+        {"vaga": job},
         " ".join(
             map(str, [_("Sua oportunidade está disponível no"), settings.WEBSITE_NAME])
         ),
-        [instance.company_email],
+        [job.company_email],
     )
+    msg.send()
+
+
+@task(max_attempts=1)
+def create_new_job_github_issue(job_id, language):
+    job = get_new_job(job_id, language)
+    if job is None or job.issue_number:
+        return
+
+    send_job_to_github_issues(job)
+
+
+@task
+def send_new_job_push_notification(job_id, language):
+    job = get_new_job(job_id, language)
+    if job is None:
+        return
 
     payload = {
-        "head": " ".join(map(str, [_("Nova Vaga!"), instance.title])),
-        "body": instance.description,
-        "url": f"{settings.WEBSITE_HOME_URL}/job/{instance.pk}/",
+        "head": " ".join(map(str, [_("Nova Vaga!"), job.title])),
+        "body": job.description,
+        "url": f"{settings.WEBSITE_HOME_URL}/job/{job.pk}/",
     }
+    send_group_notification(group_name=get_job_groups(job), payload=payload, ttl=1000)
+
+
+@task
+def send_new_job_offer_email(job_id, language):
+    job = get_new_job(job_id, language)
+    if job is None:
+        return
+
+    send_offer_email_template(job)
+
+
+NEW_JOB_TASKS = (
+    post_new_job_to_telegram,
+    send_published_job_email,
+    create_new_job_github_issue,
+    send_new_job_push_notification,
+    send_new_job_offer_email,
+)
 
-    msg.send()
-    if not instance.issue_number:
-        try:
-            send_job_to_github_issues(instance)
-        except:
-            pass
-
-    try:
-        send_group_notification(group_name="general", payload=payload, ttl=1000)
-    except:
-        pass
-
-    try:
-        send_offer_email_template(instance)
-    except:
-        client.captureException()
+
+@receiver(post_save, sender=Job)
+def test(sender, instance, created, **kwargs):
+    """Announces new jobs. The announcements are only queued here, in the same
+    transaction as the job, and sent by ``run_worker``."""
+    if not created or not instance.receive_emails:
+        return False
+
+    for new_job_task in NEW_JOB_TASKS:
+        new_job_task.enqueue(job_id=instance.pk, language=translation.get_language())
 
     return True
 
@@ -203,22 +283,23 @@ def feedback_was_created(sender, instance, **kwargs):
         msg.send()
 
 
-@receiver(post_save, sender=PushMessage)
-def send_push_message(sender, instance, **kwargs):
-    if not instance.id:
+@task(max_attempts=1)
+def broadcast_push_message(push_message_id):
+    push_message = PushMessage.objects.filter(pk=push_message_id).first()
+    if push_message is None:
         return
 
     payload = {
-        "head": instance.head,
-        "body": instance.body,
-        "url": instance.url,
+        "head": push_message.head,
+        "body": push_message.body,
+        "url": push_message.url,
     }
-    send_group_notification(group_name="general", payload=payload, ttl=1000)
+    send_group_notification(group_name=get_all_groups(), payload=payload, ttl=1000)
 
 
-@receiver(post_save, sender=Job)
-def new_job_was_created(sender, instance, created, **kwargs):
-    if not created:
+@receiver(post_save, sender=PushMessage)
+def send_push_message(sender, instance, **kwargs):
+    if not instance.id:
         return
 
-    create_job_redirect(instance)
+    broadcast_push_message.enqueue(push_message_id=instance.pk)
@@ -3,11 +3,13 @@ import urllib.parse
 from django import http
 from django.conf import settings
 from django.contrib.redirects.middleware import RedirectFallbackMiddleware
-from django.contrib.redirects.models import Redirect
 from django.contrib.sites.shortcuts import get_current_site
 from django.middleware.gzip import GZipMiddleware
 from django.shortcuts import redirect
 
+from pyjobs.core.job_redirects import get_job_redirect
+from pyjobs.core.redirect_index import get_redirect_index
+
 MAX_AGE = getattr(settings, "CACHE_CONTROL_MAX_AGE", 2592000)
 
 
@@ -27,37 +29,31 @@ class RedirectFallbackMiddleware(RedirectFallbackMiddleware):
             full_path = parsed_url.path
 
         current_site = get_current_site(request)
-
-        r = None
-        try:
-            r = Redirect.objects.get(site=current_site, old_path=full_path)
-        except Redirect.DoesNotExist:
-            pass
-        if r is None and settings.APPEND_SLASH and not request.path.endswith("/"):
-            try:
-                if parsed_url is not None:
-                    r = Redirect.objects.get(
-                        site=current_site,
-                        old_path=full_path,
-                    )
-                else:
-                    r = Redirect.objects.get(
-                        site=current_site,
-                        old_path=request.get_full_path(force_append_slash=True),
-                    )
-            except Redirect.DoesNotExist:
-                pass
-
-        if r is not None:
-            if r.new_path == "":
+        index = get_redirect_index()
+
+        new_path = index.get(current_site.id, full_path)
+        if (
+            new_path is None
+            and parsed_url is None
+            and settings.APPEND_SLASH
+            and not request.path.endswith("/")
+        ):
+            new_path = index.get(
+                current_site.id, request.get_full_path(force_append_slash=True)
+            )
+        if new_path is None:
+            new_path = get_job_redirect(request)
+
+        if new_path is not None:
+            if new_path == "":
                 return self.response_gone_class()
 
             # Adding back the query parameters to redirecting path
             if parsed_url is not None:
-                new_path_with_query_params = r.new_path + "?" + parsed_url.query
+                new_path_with_query_params = new_path + "?" + parsed_url.query
                 return self.response_redirect_class(new_path_with_query_params)
 
             # Handles redirections for urls without query parameters
-            return self.response_redirect_class(r.new_path)
+            return self.response_redirect_class(new_path)
 
         return redirect("/")
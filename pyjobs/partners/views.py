@@ -1,7 +1,10 @@
 from django.shortcuts import render
+
+from pyjobs.core.page_cache import cache_anonymous_page
 from .models import Partner
 
 
+@cache_anonymous_page(Partner)
 def get_all_partners(request):
     context = {"partners": Partner.objects.all()}
     return render(request, template_name="partners.html", context=context)
@@ -56,6 +56,7 @@ INSTALLED_APPS = [
     "pyjobs.profiler",
     "pyjobs.synchronizer",
     "pyjobs.assessment",
+    "pyjobs.tasks",
     "widget_tweaks",
     "social_django",
     "django_select2",
@@ -83,7 +84,25 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "pyjobs.urls"
 
-CACHE_BACKEND = "locmem:///"
+# use a shared backend (e.g. memcached) in production so the page cache and
+# the snapshot versions are seen by every worker
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+# seconds an anonymous page is kept by pyjobs.core.page_cache
+PAGE_CACHE_TIMEOUT = config("PAGE_CACHE_TIMEOUT", default=600, cast=int)
+
+# seconds a process keeps its in-memory snapshot of the active jobs
+ACTIVE_JOBS_SNAPSHOT_TTL = config("ACTIVE_JOBS_SNAPSHOT_TTL", default=300, cast=int)
+
+# seconds a process keeps its in-memory index of the Redirect table
+REDIRECT_INDEX_TTL = config("REDIRECT_INDEX_TTL", default=3600, cast=int)
 
 TEMPLATES = [
     {
@@ -119,6 +138,13 @@ DATABASES = {
 
 
 THUMBNAILS_BASE_FOLDER = "%s/pyjobs/core/thumb/" % (BASE_DIR)
+THUMBNAILS_CACHE_FOLDER = config(
+    "THUMBNAILS_CACHE_FOLDER", default="%s/thumbnails_cache/" % (BASE_DIR)
+)
+# render the thumbnails of new jobs before they are announced
+PRERENDER_THUMBNAILS_ON_CREATE = config(
+    "PRERENDER_THUMBNAILS_ON_CREATE", default=False, cast=bool
+)
 
 # Password validation
 # https://docs.djangoproject.com/en/1.11/ref/settings/#auth-password-validators
@@ -328,3 +354,18 @@ SOCIAL_AUTH_LINKEDIN_OAUTH2_EXTRA_DATA = [
     ("publicProfileUrl", "profile_url"),
 ]
 BLOG_API_URL = config("BLOG_API_URL", default=None)
+# seconds a blog API response is served before being refreshed in background
+BLOG_CACHE_TTL = config("BLOG_CACHE_TTL", default=300, cast=int)
+
+# dotted path to the json.dumps-like function encoding the API listings, a
+# faster drop-in like orjson.dumps can be used if installed
+API_JSON_DUMPS = config("API_JSON_DUMPS", default="json.dumps")
+
+# seconds a process trusts a verified (or rejected) API key without a query
+API_KEY_CACHE_TTL = config("API_KEY_CACHE_TTL", default=60, cast=int)
+
+# requests an API key can burst, and how many per second it gets back. The
+# buckets live in the default cache, which must be shared by the processes
+# (not the LocMemCache default) for the limit to hold
+API_RATE_LIMIT_BURST = config("API_RATE_LIMIT_BURST", default=60, cast=int)
+API_RATE_LIMIT_RATE = config("API_RATE_LIMIT_RATE", default=2, cast=float)
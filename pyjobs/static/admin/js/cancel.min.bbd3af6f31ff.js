@@ -0,0 +1,3 @@
+'use strict';{function ready(fn){if(document.readyState!=='loading'){fn();}else{document.addEventListener('DOMContentLoaded',fn);}}
+ready(function(){function handleClick(event){event.preventDefault();if(window.location.search.indexOf('&_popup=1')===-1){window.history.back();}else{window.close();}}
+document.querySelectorAll('.cancel-link').forEach(function(el){el.addEventListener('click',handleClick);});});}
\ No newline at end of file
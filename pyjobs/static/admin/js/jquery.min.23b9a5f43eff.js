@@ -0,0 +1 @@
+'use strict';window.django={jQuery:jQuery.noConflict(true)};
\ No newline at end of file
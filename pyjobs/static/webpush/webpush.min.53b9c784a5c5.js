@@ -0,0 +1,14 @@
+var isPushEnabled=false,registration,subBtn;window.addEventListener('load',function(){subBtn=document.getElementById('webpush-subscribe-button');subBtn.addEventListener('click',function(){subBtn.disabled=true;if(isPushEnabled){return unsubscribe(registration);}
+return subscribe(registration);});if('serviceWorker'in navigator){const serviceWorker=document.querySelector('meta[name="service-worker-js"]').content;navigator.serviceWorker.register(serviceWorker).then(function(reg){registration=reg;initialiseState(reg);});}
+function initialiseState(reg){if(!(reg.showNotification)){subBtn.textContent=document.getElementById('push-subscribe').getAttribute("data-push-subscribe-label");return;}
+if(Notification.permission==='denied'){subBtn.textContent=document.getElementById('push-subscribe').getAttribute("data-push-subscribe-label");subBtn.disabled=false;return;}
+if(!('PushManager'in window)){subBtn.textContent=document.getElementById('push-subscribe').getAttribute("data-push-subscribe-label");subBtn.disabled=false;return;}
+reg.pushManager.getSubscription().then(function(subscription){if(subscription){postSubscribeObj('subscribe',subscription,function(response){if(response.status===201){subBtn.textContent=document.getElementById('push-unsubscribe').getAttribute("data-push-unsubscribe-label");subBtn.disabled=false;isPushEnabled=true;}});}});}});function showMessage(message){const messageBox=document.getElementById('webpush-message');if(messageBox){messageBox.textContent=message;messageBox.style.display='block';}}
+function subscribe(reg){reg.pushManager.getSubscription().then(function(subscription){var metaObj,applicationServerKey,options;if(subscription){return subscription;}
+metaObj=document.querySelector('meta[name="django-webpush-vapid-key"]');applicationServerKey=metaObj.content;options={userVisibleOnly:true};if(applicationServerKey){options.applicationServerKey=urlB64ToUint8Array(applicationServerKey)}
+reg.pushManager.subscribe(options).then(function(subscription){postSubscribeObj('subscribe',subscription,function(response){if(response.status===201){subBtn.textContent=document.getElementById('push-unsubscribe').getAttribute("data-push-unsubscribe-label");subBtn.disabled=false;isPushEnabled=true;}});}).catch(function(){console.log('Subscription error.',arguments)})});}
+function urlB64ToUint8Array(base64String){const padding='='.repeat((4-base64String.length%4)%4);const base64=(base64String+padding).replace(/\-/g,'+').replace(/_/g,'/');const rawData=window.atob(base64);const outputArray=new Uint8Array(rawData.length);for(var i=0;i<rawData.length;++i){outputArray[i]=rawData.charCodeAt(i);}
+return outputArray;}
+function unsubscribe(reg){reg.pushManager.getSubscription().then(function(subscription){if(!subscription){subBtn.disabled=false;return;}
+postSubscribeObj('unsubscribe',subscription,function(response){if(response.status===202){subscription.unsubscribe().then(function(successful){subBtn.textContent=document.getElementById('push-subscribe').getAttribute("data-push-subscribe-label");isPushEnabled=false;subBtn.disabled=false;}).catch(function(error){subBtn.textContent=document.getElementById('push-unsubscribe').getAttribute("data-push-unsubscribe-label");subBtn.disabled=false;});}});})}
+function postSubscribeObj(statusType,subscription,callback){var browser=navigator.userAgent.match(/(firefox|msie|chrome|safari|trident)/ig)[0].toLowerCase(),data={status_type:statusType,subscription:subscription.toJSON(),browser:browser,group:subBtn.dataset.group};fetch(subBtn.dataset.url,{method:'post',headers:{'Content-Type':'application/json'},body:JSON.stringify(data),credentials:'include'}).then(callback);}
\ No newline at end of file
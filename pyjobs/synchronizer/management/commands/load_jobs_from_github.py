@@ -14,6 +14,7 @@ from pyjobs.core.models import Job, Skill
 
 LINK_REGEX = r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»“”‘’]))"
 EMAIL_REGEX = r"[\w\.-]+@[\w\.-]+"
+GITHUB_TIMEOUT = 10
 
 
 def section_reshaping(sections, issue_content):
@@ -158,7 +159,7 @@ class Command(BaseCommand):
         if not settings.GITHUB_ACCESS_TOKEN or not settings.GITHUB_DEFAULT_REPO:
             return "False"
 
-        g = Github(settings.GITHUB_ACCESS_TOKEN)
+        g = Github(settings.GITHUB_ACCESS_TOKEN, timeout=GITHUB_TIMEOUT)
         repo = g.get_repo(settings.GITHUB_DEFAULT_REPO)
 
         minimum_date = datetime.now() - timedelta(days=30)
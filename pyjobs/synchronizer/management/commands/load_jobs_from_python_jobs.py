@@ -3,10 +3,10 @@ import re
 from datetime import datetime, timedelta
 from pprint import pprint
 
-import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from pyjobs.core import http_client
 from pyjobs.core.models import Job, Skill, Country
 
 from bs4 import BeautifulSoup as bs
@@ -35,7 +35,7 @@ class Command(BaseCommand):
         dictionary.
         """
         link = job_dict.pop("link")
-        request = requests.get(link)
+        request = http_client.get(link)
         content = request.content
 
         soup = bs(content, "html")
@@ -88,7 +88,7 @@ class Command(BaseCommand):
 
     def get_all_jobs(self):
         feed = "https://www.python.org/jobs/feed/rss/"
-        request = requests.get(feed)
+        request = http_client.get(feed)
         xml = request.content
         soup = bs(xml, "xml")
 
@@ -4,10 +4,10 @@ from datetime import datetime, timedelta
 from pprint import pprint
 
 import mistune
-import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from pyjobs.core import http_client
 from pyjobs.core.models import Job, Skill, Country
 
 
@@ -16,7 +16,7 @@ class Command(BaseCommand):
         headers = {
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS 11.1.0; rv:42.0) Gecko/20100101 Firefox/42.0"
         }
-        response = requests.get(
+        response = http_client.get(
             f"https://remoteok.io/api?tag={settings.GITHUB_ISSUES_LABELS}",
             headers=headers,
         )
@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from pyjobs.tasks.models import Task
+
+
+class TaskAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "status",
+        "attempts",
+        "created_at",
+        "run_at",
+        "queue_latency",
+        "duration",
+    )
+    list_filter = ("status", "name")
+    readonly_fields = ("created_at", "started_at", "finished_at")
+
+
+admin.site.register(Task, TaskAdmin)
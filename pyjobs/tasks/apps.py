@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class TasksConfig(AppConfig):
+    name = "pyjobs.tasks"
+    verbose_name = _("Tarefas em segundo plano")
@@ -0,0 +1,82 @@
+import threading
+from time import perf_counter, sleep
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from pyjobs.tasks.queue import run_pending_tasks
+
+
+class Command(BaseCommand):
+    help = "Runs the queued background tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=4, help="Concurrent worker threads"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=10, help="Tasks claimed at a time"
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Exit when the queue is empty"
+        )
+
+    def report(self, task):
+        self.stdout.write(
+            f"{task.name} #{task.pk} {task.status} "
+            f"(attempt {task.attempts}, waited {task.queue_latency:.2f}s, "
+            f"ran {task.duration:.2f}s)"
+        )
+
+    def work(self, batch_size, poll_interval, once):
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                tasks = run_pending_tasks(batch_size)
+                with self.lock:
+                    self.processed += len(tasks)
+                    for task in tasks:
+                        self.report(task)
+                if tasks:
+                    continue
+                if once:
+                    return
+                self.stopping.wait(poll_interval)
+        finally:
+            connection.close()
+
+    def handle(self, *args, **options):
+        self.stopping = threading.Event()
+        self.lock = threading.Lock()
+        self.processed = 0
+        workers = [
+            threading.Thread(
+                target=self.work,
+                args=(options["batch_size"], options["poll_interval"], options["once"]),
+                daemon=True,
+            )
+            for _ in range(options["workers"])
+        ]
+
+        start = perf_counter()
+        for worker in workers:
+            worker.start()
+        try:
+            while any(worker.is_alive() for worker in workers):
+                sleep(0.5)
+        except KeyboardInterrupt:
+            self.stopping.set()
+            for worker in workers:
+                worker.join()
+
+        elapsed = perf_counter() - start
+        self.stdout.write(
+            f"{self.processed} tasks in {elapsed:.1f}s "
+            f"({self.processed / elapsed:.1f} tasks/s)"
+        )
@@ -0,0 +1,101 @@
+# Generated by Django 3.2.2 on 2026-10-18 11:02
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Task",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200, verbose_name="Tarefa")),
+                (
+                    "payload",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="Parâmetros"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendente"),
+                            ("running", "Executando"),
+                            ("done", "Concluída"),
+                            ("failed", "Falhou"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="Tentativas"),
+                ),
+                (
+                    "max_attempts",
+                    models.PositiveIntegerField(
+                        default=5, verbose_name="Máximo de tentativas"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, default="", verbose_name="Último erro"
+                    ),
+                ),
+                (
+                    "run_at",
+                    models.DateTimeField(
+                        default=datetime.datetime.now,
+                        verbose_name="Executar a partir de",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "queue_latency",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Do enfileiramento até a última execução começar",
+                        null=True,
+                        verbose_name="Tempo na fila (s)",
+                    ),
+                ),
+                (
+                    "duration",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="Duração (s)"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tarefa",
+                "verbose_name_plural": "Tarefas",
+                "ordering": ("run_at", "id"),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "run_at"], name="tasks_task_status_de4ee3_idx"
+            ),
+        ),
+    ]
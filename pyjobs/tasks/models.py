@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+TASK_STATUS = (
+    (PENDING, _("Pendente")),
+    (RUNNING, _("Executando")),
+    (DONE, _("Concluída")),
+    (FAILED, _("Falhou")),
+)
+
+
+class Task(models.Model):
+    name = models.CharField(_("Tarefa"), max_length=200)
+    payload = models.JSONField(_("Parâmetros"), default=dict, blank=True)
+    status = models.CharField(
+        _("Status"), max_length=10, choices=TASK_STATUS, default=PENDING
+    )
+    attempts = models.PositiveIntegerField(_("Tentativas"), default=0)
+    max_attempts = models.PositiveIntegerField(_("Máximo de tentativas"), default=5)
+    last_error = models.TextField(_("Último erro"), blank=True, default="")
+    run_at = models.DateTimeField(_("Executar a partir de"), default=datetime.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    queue_latency = models.FloatField(
+        _("Tempo na fila (s)"),
+        blank=True,
+        null=True,
+        help_text=_("Do enfileiramento até a última execução começar"),
+    )
+    duration = models.FloatField(_("Duração (s)"), blank=True, null=True)
+
+    class Meta:
+        ordering = ("run_at", "id")
+        indexes = [models.Index(fields=["status", "run_at"])]
+        verbose_name = _("Tarefa")
+        verbose_name_plural = _("Tarefas")
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
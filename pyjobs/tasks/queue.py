@@ -0,0 +1,150 @@
+"""
+Transactional outbox for side effects that should not run inside a request.
+
+``enqueue`` only inserts a ``Task`` row, so when it is called from a signal
+the task is committed (or rolled back) together with the change that caused
+it. ``run_worker`` drains the table: rows are claimed with
+``SELECT ... FOR UPDATE SKIP LOCKED`` so any number of workers can share it,
+failures are retried with exponential backoff and every task records how long
+it waited in the queue and how long it ran. Rows left running by a worker that
+died are claimed again after ``RUNNING_TIMEOUT`` seconds.
+"""
+
+import logging
+import random
+import traceback
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import translation
+from raven.contrib.django.raven_compat.models import client
+
+from pyjobs.tasks.models import DONE, FAILED, PENDING, RUNNING, Task
+
+logger = logging.getLogger(__name__)
+
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 60 * 60
+RUNNING_TIMEOUT = 15 * 60
+MAX_ATTEMPTS = 5
+
+_registry = {}
+
+
+class UnknownTask(Exception):
+    pass
+
+
+def task(function=None, *, max_attempts=MAX_ATTEMPTS):
+    """Registers ``function`` so it can be enqueued by its dotted name, also
+    available as ``function.enqueue(**payload)``. Side effects that are not
+    safe to repeat (posting somewhere) should use ``@task(max_attempts=1)``."""
+    if function is None:
+        return lambda function: task(function, max_attempts=max_attempts)
+
+    _registry[get_task_name(function)] = function
+    function.max_attempts = max_attempts
+    function.enqueue = lambda **payload: enqueue(function, **payload)
+    function.enqueue_once = lambda **payload: enqueue_once(function, **payload)
+    return function
+
+
+def get_task_name(function):
+    return f"{function.__module__}.{function.__name__}"
+
+
+def enqueue(function, max_attempts=None, **payload):
+    """Stores a call to the registered ``function`` with the JSON serializable
+    keyword arguments in ``payload``."""
+    name = get_task_name(function)
+    if name not in _registry:
+        raise UnknownTask(name)
+    if max_attempts is None:
+        max_attempts = _registry[name].max_attempts
+    return Task.objects.create(name=name, payload=payload, max_attempts=max_attempts)
+
+
+def enqueue_once(function, **payload):
+    """Like ``enqueue``, unless the same call is already pending."""
+    pending = Task.objects.filter(
+        name=get_task_name(function), payload=payload, status=PENDING
+    )
+    if pending.exists():
+        return None
+    return enqueue(function, **payload)
+
+
+def get_retry_delay(attempts):
+    delay = min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+    return timedelta(seconds=delay * random.uniform(0.5, 1))
+
+
+def claim_tasks(limit=10):
+    """Marks up to ``limit`` due tasks as running and returns them. Rows locked
+    by another worker are skipped instead of waited for. Tasks running for
+    longer than ``RUNNING_TIMEOUT`` lost their worker and are due again,
+    unless they used all their attempts."""
+    now = datetime.now()
+    stale = Q(status=RUNNING, started_at__lt=now - timedelta(seconds=RUNNING_TIMEOUT))
+    with transaction.atomic():
+        Task.objects.filter(stale, attempts__gte=F("max_attempts")).update(
+            status=FAILED, finished_at=now, last_error="Worker timed out"
+        )
+        due = Q(status=PENDING, run_at__lte=now) | stale
+        ids = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(due)
+            .order_by("run_at", "id")
+            .values_list("pk", flat=True)[:limit]
+        )
+        # where SKIP LOCKED is not supported (SQLite) two workers may pick the
+        # same ids: each row is claimed by whoever updates it while still due
+        claimed = []
+        for pk in ids:
+            if Task.objects.filter(due, pk=pk).update(
+                status=RUNNING, started_at=now, attempts=F("attempts") + 1
+            ):
+                claimed.append(pk)
+    return list(Task.objects.filter(pk__in=claimed))
+
+
+def run_task(task):
+    started_at = datetime.now()
+    task.queue_latency = (started_at - task.created_at).total_seconds()
+
+    try:
+        function = _registry.get(task.name)
+        if function is None:
+            raise UnknownTask(task.name)
+        # tasks may activate the language they were enqueued with
+        with translation.override(settings.LANGUAGE_CODE):
+            function(**task.payload)
+    except Exception:
+        task.last_error = traceback.format_exc()
+        if task.attempts < task.max_attempts:
+            task.status = PENDING
+            task.run_at = datetime.now() + get_retry_delay(task.attempts)
+        else:
+            task.status = FAILED
+        logger.warning("Task %s #%s failed", task.name, task.pk, exc_info=True)
+        client.captureException(
+            extra={
+                "task": task.name,
+                "payload": task.payload,
+                "attempts": task.attempts,
+            }
+        )
+    else:
+        task.status = DONE
+
+    task.finished_at = datetime.now()
+    task.duration = (task.finished_at - started_at).total_seconds()
+    task.save()
+    return task
+
+
+def run_pending_tasks(limit=10):
+    """Claims and runs one batch of tasks, returns them."""
+    return [run_task(claimed) for claimed in claim_tasks(limit)]
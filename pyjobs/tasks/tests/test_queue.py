@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase
+from model_bakery import baker as mommy
+
+from pyjobs.core.models import Job
+from pyjobs.marketing.triggers import (
+    NEW_JOB_TASKS,
+    post_new_job_to_telegram,
+    send_new_job_push_notification,
+)
+from pyjobs.tasks.models import DONE, FAILED, PENDING, RUNNING, Task
+from pyjobs.tasks.queue import (
+    RUNNING_TIMEOUT,
+    claim_tasks,
+    get_task_name,
+    run_pending_tasks,
+)
+
+
+class TaskQueueTest(TestCase):
+    def setUp(self):
+        self.job = mommy.make(Job, public=True)
+
+    def run_due_tasks(self):
+        Task.objects.filter(status=PENDING).update(run_at=datetime.now())
+        return run_pending_tasks(limit=100)
+
+    def test_new_job_enqueues_its_announcements(self):
+        self.assertEqual(
+            sorted(Task.objects.values_list("name", flat=True)),
+            sorted(get_task_name(function) for function in NEW_JOB_TASKS),
+        )
+        for task in Task.objects.all():
+            self.assertEqual(task.payload["job_id"], self.job.pk)
+            self.assertEqual(task.status, PENDING)
+
+    def test_no_tasks_when_the_job_does_not_receive_emails(self):
+        Task.objects.all().delete()
+        mommy.make(Job, receive_emails=False)
+        self.assertFalse(Task.objects.exists())
+
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    @patch("pyjobs.marketing.triggers.send_job_to_github_issues")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_worker_runs_the_announcements(
+        self, _mocked_post_telegram_channel, _mock_github, _mocked_send_group_push
+    ):
+        tasks = run_pending_tasks(limit=100)
+
+        self.assertEqual(len(tasks), len(NEW_JOB_TASKS))
+        self.assertEqual(Task.objects.exclude(status=DONE).count(), 0)
+        _mocked_post_telegram_channel.assert_called_once()
+        _mock_github.assert_called_once_with(self.job)
+        _mocked_send_group_push.assert_called_once()
+        self.assertEqual(mail.outbox[0].to, [self.job.company_email])
+        for task in Task.objects.all():
+            self.assertEqual(task.attempts, 1)
+            self.assertIsNotNone(task.queue_latency)
+            self.assertIsNotNone(task.duration)
+
+        self.assertEqual(run_pending_tasks(), [])
+
+    @patch("pyjobs.tasks.queue.client")
+    @patch("pyjobs.marketing.triggers.send_group_notification")
+    def test_failures_are_retried_with_backoff(
+        self, _mocked_send_group_push, mocked_client
+    ):
+        _mocked_send_group_push.side_effect = ConnectionError
+        Task.objects.exclude(
+            name=get_task_name(send_new_job_push_notification)
+        ).delete()
+        task = Task.objects.get()
+
+        self.run_due_tasks()
+        task.refresh_from_db()
+        self.assertEqual(task.status, PENDING)
+        self.assertEqual(task.attempts, 1)
+        self.assertIn("ConnectionError", task.last_error)
+        self.assertGreater(task.run_at, datetime.now() + timedelta(seconds=10))
+        self.assertEqual(claim_tasks(), [])
+        mocked_client.captureException.assert_called_once()
+
+        for _ in range(task.max_attempts - 1):
+            self.run_due_tasks()
+        task.refresh_from_db()
+        self.assertEqual(task.status, FAILED)
+        self.assertEqual(task.attempts, task.max_attempts)
+        self.assertEqual(self.run_due_tasks(), [])
+
+    def test_tasks_of_deleted_jobs_are_skipped(self):
+        self.job.delete()
+        self.assertEqual({task.status for task in run_pending_tasks(limit=100)}, {DONE})
+
+    @patch("pyjobs.tasks.queue.client")
+    @patch("pyjobs.marketing.triggers.post_telegram_channel")
+    def test_posts_are_not_retried(self, _mocked_post_telegram_channel, _client):
+        _mocked_post_telegram_channel.side_effect = ConnectionError
+        Task.objects.exclude(name=get_task_name(post_new_job_to_telegram)).delete()
+
+        self.run_due_tasks()
+
+        task = Task.objects.get()
+        self.assertEqual(task.status, FAILED)
+        self.assertEqual(task.attempts, 1)
+
+    def test_tasks_are_claimed_once(self):
+        ids = list(Task.objects.values_list("pk", flat=True))
+        self.assertEqual(len(claim_tasks(limit=100)), len(ids))
+
+        # a second worker that read the same rows before they were claimed
+        with patch.object(Task.objects, "select_for_update") as select:
+            due = select.return_value.filter.return_value.order_by.return_value
+            due.values_list.return_value = ids
+            self.assertEqual(claim_tasks(limit=100), [])
+        self.assertEqual(set(Task.objects.values_list("attempts", flat=True)), {1})
+
+    def test_tasks_of_dead_workers_are_claimed_again(self):
+        claimed = claim_tasks(limit=100)
+        self.assertEqual(claim_tasks(limit=100), [])
+
+        Task.objects.update(
+            started_at=datetime.now() - timedelta(seconds=RUNNING_TIMEOUT + 1),
+            max_attempts=5,
+        )
+        Task.objects.filter(pk=claimed[0].pk).update(max_attempts=1)
+
+        reclaimed = claim_tasks(limit=100)
+        self.assertEqual(len(reclaimed), len(claimed) - 1)
+        for task in reclaimed:
+            self.assertEqual(task.status, RUNNING)
+            self.assertEqual(task.attempts, 2)
+        claimed[0].refresh_from_db()
+        self.assertEqual(claimed[0].status, FAILED)